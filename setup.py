@@ -44,7 +44,7 @@ with open(fname, encoding='utf8') as f:
 setup(name='unicodetools',
       version=version,
       py_modules = [],
-      packages = ['unicodetools'],
+      packages = ['unicodetools', 'unicodetools.baked'],
       package_dir = {'unicodetools': 'unicodetools'},
       package_data = {'unicodetools': ['data/9.0.0/*.zip',
                                        'data/9.0.0/*.txt']},
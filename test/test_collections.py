@@ -40,6 +40,10 @@ if sys.maxunicode == 0xFFFF:
 import pytest
 import random
 import re
+if sys.version_info.major == 2:
+    import collections as collections_abc
+else:
+    import collections.abc as collections_abc
 
 
 
@@ -116,6 +120,47 @@ def test_CodePointRange():
 
 
 
+def test_CodePointBitset():
+    cpb = mdl.CodePointBitset([(0x41, 0x5A), (0x61, 0x7A), (0x10000, 0x10001)])
+    assert len(cpb) == 26 + 26 + 2
+    assert 0x41 in cpb and 0x5A in cpb and 0x10000 in cpb
+    assert 0x40 not in cpb and 0x5B not in cpb and 0x10002 not in cpb
+    assert 'A' not in cpb
+    assert list(cpb) == list(range(0x41, 0x5B)) + list(range(0x61, 0x7B)) + [0x10000, 0x10001]
+    assert cpb == set(cpb)
+    assert cpb == mdl.CodePointBitset([(0x41, 0x5A), (0x61, 0x7A), (0x10000, 0x10001)])
+    assert cpb != mdl.CodePointBitset([(0x41, 0x5A)])
+    assert cpb.contains_array([0x40, 0x41, 0x5A, 0x5B, 0x10001, -1, 0x110000]) == [False, True, True, False, True, False, False]
+    cpb2 = mdl.CodePointBitset([(0x3, 0x5), (0x100, 0x2FF)])
+    assert len(cpb2) == 3 + 0x200
+    assert all(cp in cpb2 for cp in (0x3, 0x5, 0x100, 0x2FF))
+    assert all(cp not in cpb2 for cp in (0x2, 0x6, 0xFF, 0x300))
+    with pytest.raises(ValueError):
+        mdl.CodePointBitset([(10, 5)])
+
+
+def test_CodePointBitsetMapping():
+    cpbm = mdl.CodePointBitsetMapping([('Alpha', [(0x41, 0x5A), (0x61, 0x7A)]),
+                                       ('Upper', [(0x41, 0x5A)])])
+    assert len(cpbm) == 52
+    assert 0x41 in cpbm and 0x61 in cpbm and 0x40 not in cpbm
+    assert cpbm[0x41] == {'Alpha': True, 'Upper': True}
+    assert cpbm[0x61] == {'Alpha': True}
+    assert cpbm.get(0x40) is None
+    with pytest.raises(KeyError):
+        cpbm[0x40]
+    assert dict(cpbm.items()) == cpbm
+    with pytest.raises(err.DataError):
+        mdl.CodePointBitsetMapping([('Alpha', [(0, 1)]), ('Alpha', [(2, 3)])])
+
+
+def test_abc_registration():
+    assert isinstance(mdl.CodePointRangeMapping([(0x41, 0x5A, 'x')]), collections_abc.Mapping)
+    assert isinstance(mdl.CodePointDenseMapping([None]*0x110000), collections_abc.Mapping)
+    assert isinstance(mdl.CodePointBitsetMapping([]), collections_abc.Mapping)
+    assert isinstance(mdl.CodePointBitset([]), collections_abc.Set)
+
+
 def test_codepoints_to_codepointranges():
     assert mdl.codepoints_to_codepointranges([0]) == [mdl.CodePointRange(0, 0)]
 
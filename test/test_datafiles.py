@@ -213,10 +213,12 @@ def test_against_regex():
 
 def test_script_extensions():
     sce = mdl.UCDFiles().scriptextensions
-    assert sce[0x1CD1]['Script_Extensions'] == {'Deva': True}
-    assert sce[0x3006]['Script_Extensions'] == {'Hani': True}
-    assert sce[0x0660]['Script_Extensions'] == {'Arab': True, 'Thaa': True}
-    assert sce[0x09E6]['Script_Extensions'] == {'Beng': True, 'Cakm': True, 'Sylo': True}
+    assert sce[0x1CD1]['Script_Extensions'] == ('Deva',)
+    assert sce[0x3006]['Script_Extensions'] == ('Hani',)
+    assert sce[0x0660]['Script_Extensions'] == ('Arab', 'Thaa')
+    assert sce[0x09E6]['Script_Extensions'] == ('Beng', 'Cakm', 'Sylo')
+    # Code points with the same script set share a single tuple
+    assert sce[0x0660]['Script_Extensions'] is sce[0x0661]['Script_Extensions']
 
 
 def test_confusables():
@@ -225,6 +227,46 @@ def test_confusables():
     assert cfs[0x06E8] == (0x0306, 0x0307)
     assert cfs[0x2026] == (0x002E, 0x002E, 0x002E)
     assert cfs[0x1142F] == (0x11434, 0x11442, 0x1142E)
+    # The default data may come from a pre-generated table module; make sure
+    # it agrees with the data parsed from confusables.txt
+    assert mdl.SecurityFiles()._parse_confusables() == cfs
+
+
+def test_files_factories():
+    assert mdl.get_ucd_files() is mdl.get_ucd_files()
+    assert mdl.get_security_files() is mdl.get_security_files()
+    assert mdl.get_ucd_files() is not mdl.UCDFiles()
+
+
+def test_shared_parsed_data():
+    # Parsed data that supports weak references is shared between live
+    # instances with the same settings
+    assert mdl.UCDFiles().scripts is mdl.UCDFiles().scripts
+    assert mdl.UCDFiles().unicodedata is mdl.UCDFiles().unicodedata
+
+
+def test_prefetch():
+    ucdf = mdl.UCDFiles()
+    ucdf.prefetch('scripts', 'blocks')
+    assert ucdf._scripts is not None and ucdf._blocks is not None
+    assert ucdf.scripts is ucdf._scripts
+    with pytest.raises(ValueError):
+        ucdf.prefetch('nonexistent')
+
+
+def test_background_prefetch():
+    ucdf = mdl.UCDFiles(background_prefetch=True)
+    ucdf._background_prefetch_thread.join()
+    assert 'Scripts' in ucdf._data_bytes_cache
+    assert 'Blocks' in ucdf._data_bytes_cache
+    assert ucdf.scripts[0x41]['Script'] == 'Latin'
+
+
+def test_warm():
+    ucdf = mdl.UCDFiles()
+    ucdf.warm(['scripts', 'blocks'], jobs=2)
+    with pytest.raises(ValueError):
+        ucdf.warm(['nonexistent'])
 
 
 def test_exceptions():
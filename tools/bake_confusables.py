@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2017, Geoffrey M. Poore
+# All rights reserved.
+#
+# Licensed under the BSD 3-Clause License:
+# http://opensource.org/licenses/BSD-3-Clause
+#
+
+'''
+Generate a Python module containing the processed confusables table for a
+Unicode version shipped in the package data directory.
+
+At runtime, importing the generated module replaces parsing confusables.txt
+entirely; after the first import, the cost is just loading cached bytecode.
+The generated module is written to `unicodetools/baked/`.
+'''
+
+
+from __future__ import (division, print_function, absolute_import,
+                        unicode_literals)
+
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import unicodetools.datafiles as datafiles
+
+
+def bake_confusables(unicode_version=None):
+    if unicode_version is None:
+        unicode_version = datafiles.UNICODE_VERSION
+    confusables = datafiles.SecurityFiles(unicode_version=unicode_version)._parse_confusables()
+    fname = '_confusables_{0}.py'.format(unicode_version.replace('.', '_'))
+    fpath = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..',
+                         'unicodetools', 'baked', fname)
+    lines = ['# -*- coding: utf-8 -*-',
+             '#',
+             '# Automatically generated by tools/bake_confusables.py from the',
+             '# processed form of confusables.txt for Unicode {0}.'.format(unicode_version),
+             '# Do not edit by hand.',
+             '#',
+             '',
+             'CONFUSABLES = {']
+    for cp in sorted(confusables):
+        cps = ', '.join('0x{0:04X}'.format(x) for x in confusables[cp])
+        if len(confusables[cp]) == 1:
+            cps += ','
+        lines.append('    0x{0:04X}: ({1}),'.format(cp, cps))
+    lines.append('}')
+    lines.append('')
+    with open(fpath, 'w') as f:
+        f.write('\n'.join(lines))
+    print('Generated "{0}" ({1} entries)'.format(os.path.normpath(fpath), len(confusables)))
+
+
+if __name__ == '__main__':
+    bake_confusables()
@@ -12,10 +12,13 @@ from .version import __version__
 
 
 from .collections import (CodePointRange, codepoints_to_codepointranges,
-                          CodePointMultiRange)
+                          CodePointMultiRange, CodePointRangeMapping,
+                          CodePointDenseMapping, CodePointBitset,
+                          CodePointBitsetMapping)
 
 from .coding import chr_surrogate, ord_surrogate
 
-from .datafiles import UNICODE_VERSION, UCDFiles, SecurityFiles
-ucd = UCDFiles()
-security = SecurityFiles()
+from .datafiles import (UNICODE_VERSION, UCDFiles, SecurityFiles,
+                        get_ucd_files, get_security_files)
+ucd = get_ucd_files()
+security = get_security_files()
@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (c) 2017, Geoffrey M. Poore
+# All rights reserved.
+#
+# Licensed under the BSD 3-Clause License:
+# http://opensource.org/licenses/BSD-3-Clause
+#
+
+'''
+Pre-generated data tables for the Unicode versions shipped in the package
+data directory.  The modules in this package are generated by the scripts
+under `tools/` and must not be edited by hand.
+'''
@@ -0,0 +1,6176 @@
+# -*- coding: utf-8 -*-
+#
+# Automatically generated by tools/bake_confusables.py from the
+# processed form of confusables.txt for Unicode 9.0.0.
+# Do not edit by hand.
+#
+
+CONFUSABLES = {
+    0x0022: (0x0027, 0x0027),
+    0x0025: (0x00BA, 0x002F, 0x2080),
+    0x0030: (0x004F,),
+    0x0031: (0x006C,),
+    0x0049: (0x006C,),
+    0x0060: (0x0027,),
+    0x006D: (0x0072, 0x006E),
+    0x0077: (0x0076, 0x0076),
+    0x007C: (0x006C,),
+    0x00A0: (0x0020,),
+    0x00A2: (0x0063, 0x0338),
+    0x00A5: (0x0059, 0x0335),
+    0x00AF: (0x02C9,),
+    0x00B4: (0x0027,),
+    0x00B5: (0x03BC,),
+    0x00B8: (0x002C,),
+    0x00C6: (0x0041, 0x0045),
+    0x00C7: (0x0043, 0x0326),
+    0x00D0: (0x0044, 0x0335),
+    0x00D6: (0x2365,),
+    0x00D7: (0x0078,),
+    0x00D8: (0x004F, 0x0338),
+    0x00E6: (0x0061, 0x0065),
+    0x00E7: (0x0063, 0x0326),
+    0x00F0: (0x2202, 0x0335),
+    0x00F6: (0x0629,),
+    0x00F8: (0x006F, 0x0338),
+    0x0110: (0x0044, 0x0335),
+    0x0111: (0x0064, 0x0335),
+    0x011A: (0x0114,),
+    0x011B: (0x0115,),
+    0x0126: (0x0048, 0x0335),
+    0x0127: (0x0068, 0x0335),
+    0x0131: (0x0069,),
+    0x0132: (0x006C, 0x004A),
+    0x0133: (0x0069, 0x006A),
+    0x0138: (0x006B,),
+    0x013F: (0x006C, 0x00B7),
+    0x0140: (0x006C, 0x00B7),
+    0x0141: (0x004C, 0x0338),
+    0x0142: (0x006C, 0x0338),
+    0x0146: (0x0272,),
+    0x0149: (0x0027, 0x006E),
+    0x0150: (0x2365,),
+    0x0152: (0x004F, 0x0045),
+    0x0153: (0x006F, 0x0065),
+    0x0163: (0x01AB,),
+    0x0166: (0x0054, 0x0335),
+    0x0167: (0x0074, 0x0335),
+    0x017F: (0x0066,),
+    0x0180: (0x0062, 0x0335),
+    0x0181: (0x0027, 0x0042),
+    0x0182: (0x0062, 0x0304),
+    0x0183: (0x0062, 0x0304),
+    0x0184: (0x0062,),
+    0x0187: (0x0043, 0x0027),
+    0x0189: (0x0044, 0x0335),
+    0x018A: (0x0027, 0x0044),
+    0x018C: (0x0064, 0x0304),
+    0x018D: (0x0067,),
+    0x0191: (0x0046, 0x0326),
+    0x0192: (0x0066, 0x0326),
+    0x0193: (0x0047, 0x0027),
+    0x0196: (0x006C,),
+    0x0197: (0x006C, 0x0335),
+    0x0198: (0x004B, 0x0027),
+    0x0199: (0x006B, 0x0314),
+    0x019A: (0x006C, 0x0335),
+    0x019D: (0x004E, 0x0326),
+    0x019E: (0x006E, 0x0329),
+    0x019F: (0x004F, 0x0335),
+    0x01A0: (0x004F, 0x0027),
+    0x01A1: (0x006F, 0x0027),
+    0x01A4: (0x0027, 0x0050),
+    0x01A5: (0x0070, 0x0314),
+    0x01A6: (0x0052,),
+    0x01A7: (0x0032,),
+    0x01AC: (0x0027, 0x0054),
+    0x01AD: (0x0074, 0x0314),
+    0x01AE: (0x0054, 0x0328),
+    0x01B3: (0x0027, 0x0059),
+    0x01B4: (0x0079, 0x0314),
+    0x01B5: (0x005A, 0x0335),
+    0x01B6: (0x007A, 0x0335),
+    0x01B7: (0x0033,),
+    0x01BB: (0x0032, 0x0335),
+    0x01BC: (0x0035,),
+    0x01BD: (0x0073,),
+    0x01BF: (0x00FE,),
+    0x01C0: (0x006C,),
+    0x01C1: (0x006C, 0x006C),
+    0x01C3: (0x0021,),
+    0x01C4: (0x0044, 0x017D),
+    0x01C5: (0x0044, 0x017E),
+    0x01C6: (0x0064, 0x017E),
+    0x01C7: (0x004C, 0x004A),
+    0x01C8: (0x004C, 0x006A),
+    0x01C9: (0x006C, 0x006A),
+    0x01CA: (0x004E, 0x004A),
+    0x01CB: (0x004E, 0x006A),
+    0x01CC: (0x006E, 0x006A),
+    0x01CD: (0x0102,),
+    0x01CE: (0x0103,),
+    0x01CF: (0x012C,),
+    0x01D0: (0x012D,),
+    0x01D1: (0x014E,),
+    0x01D2: (0x014F,),
+    0x01D3: (0x016C,),
+    0x01D4: (0x016D,),
+    0x01E4: (0x0047, 0x0335),
+    0x01E5: (0x0067, 0x0335),
+    0x01E6: (0x011E,),
+    0x01E7: (0x011F,),
+    0x01F1: (0x0044, 0x005A),
+    0x01F2: (0x0044, 0x007A),
+    0x01F3: (0x0064, 0x007A),
+    0x01F5: (0x0123,),
+    0x01FE: (0x004F, 0x0338, 0x0301),
+    0x021A: (0x0162,),
+    0x021B: (0x01AB,),
+    0x021C: (0x0033,),
+    0x0222: (0x0038,),
+    0x0223: (0x0038,),
+    0x0224: (0x005A, 0x0326),
+    0x0225: (0x007A, 0x0326),
+    0x0226: (0x00C5,),
+    0x0227: (0x00E5,),
+    0x023C: (0x0063, 0x0338),
+    0x023E: (0x0054, 0x0338),
+    0x0241: (0x003F,),
+    0x0244: (0x0055, 0x0335),
+    0x0246: (0x0045, 0x0338),
+    0x0247: (0x0065, 0x0338),
+    0x0248: (0x004A, 0x0335),
+    0x0249: (0x006A, 0x0335),
+    0x024D: (0x0072, 0x0335),
+    0x024E: (0x0059, 0x0335),
+    0x024F: (0x0079, 0x0335),
+    0x0251: (0x0061,),
+    0x0253: (0x0062, 0x0314),
+    0x0256: (0x0064, 0x0328),
+    0x0257: (0x0064, 0x0314),
+    0x0259: (0x01DD,),
+    0x025A: (0x01DD, 0x02DE),
+    0x025B: (0xA793,),
+    0x0260: (0x0067, 0x0314),
+    0x0261: (0x0067,),
+    0x0263: (0x0079,),
+    0x0266: (0x0068, 0x0314),
+    0x0268: (0x0069, 0x0335),
+    0x0269: (0x0069,),
+    0x026A: (0x0069,),
+    0x026B: (0x006C, 0x0334),
+    0x026D: (0x006C, 0x0328),
+    0x026E: (0x006C, 0x021D),
+    0x026F: (0x0076, 0x0076),
+    0x0271: (0x0072, 0x006E, 0x0326),
+    0x0273: (0x006E, 0x0328),
+    0x0275: (0x006F, 0x0335),
+    0x0276: (0x006F, 0x1D07),
+    0x027C: (0x0072, 0x0329),
+    0x027D: (0x0072, 0x0328),
+    0x0282: (0x0073, 0x0328),
+    0x028B: (0x0075,),
+    0x028D: (0x0072, 0x006E),
+    0x028F: (0x0079,),
+    0x0290: (0x007A, 0x0328),
+    0x0292: (0x021D,),
+    0x0294: (0x003F,),
+    0x02A0: (0x0071, 0x0314),
+    0x02A3: (0x0064, 0x007A),
+    0x02A4: (0x0064, 0x021D),
+    0x02A5: (0x0064, 0x0291),
+    0x02A6: (0x0074, 0x0073),
+    0x02A7: (0x0074, 0x0283),
+    0x02A8: (0x0074, 0x0255),
+    0x02A9: (0x0066, 0x014B),
+    0x02AA: (0x006C, 0x0073),
+    0x02AB: (0x006C, 0x007A),
+    0x02B3: (0x18F4,),
+    0x02B9: (0x0027,),
+    0x02BA: (0x0027, 0x0027),
+    0x02BB: (0x0027,),
+    0x02BC: (0x0027,),
+    0x02BD: (0x0027,),
+    0x02BE: (0x0027,),
+    0x02BF: (0x0559,),
+    0x02C2: (0x003C,),
+    0x02C3: (0x003E,),
+    0x02C4: (0x005E,),
+    0x02C6: (0x005E,),
+    0x02C8: (0x0027,),
+    0x02CA: (0x0027,),
+    0x02CB: (0x0027,),
+    0x02D0: (0x003A,),
+    0x02D3: (0x0559,),
+    0x02D7: (0x002D,),
+    0x02D8: (0x02C7,),
+    0x02D9: (0x0971,),
+    0x02DA: (0x00B0,),
+    0x02DB: (0x0069,),
+    0x02DC: (0x007E,),
+    0x02DD: (0x0027, 0x0027),
+    0x02E1: (0x18F3,),
+    0x02E2: (0x18F5,),
+    0x02E4: (0x02C1,),
+    0x02EE: (0x0027, 0x0027),
+    0x02F4: (0x0027,),
+    0x02F6: (0x0027, 0x0027),
+    0x02F8: (0x003A,),
+    0x02FB: (0x02EA,),
+    0x0305: (0x0304,),
+    0x030C: (0x0306,),
+    0x030D: (0x0670,),
+    0x0310: (0x0306, 0x0307),
+    0x0311: (0x0302,),
+    0x0315: (0x0313,),
+    0x0317: (0x0650,),
+    0x0320: (0x0331,),
+    0x0321: (0x0326,),
+    0x0322: (0x0328,),
+    0x0327: (0x0326,),
+    0x0336: (0x0335,),
+    0x0337: (0x0338,),
+    0x0339: (0x0326,),
+    0x0340: (0x0300,),
+    0x0341: (0x0301,),
+    0x0342: (0x0303,),
+    0x0343: (0x0313,),
+    0x0345: (0x0328,),
+    0x0347: (0x0333,),
+    0x0357: (0x0350,),
+    0x0358: (0x0307,),
+    0x0366: (0x030A,),
+    0x036E: (0x0306,),
+    0x0370: (0x2C75,),
+    0x0374: (0x0027,),
+    0x0375: (0x02CF,),
+    0x0376: (0x0418,),
+    0x0377: (0x1D0E,),
+    0x037A: (0x0069,),
+    0x037B: (0x0254,),
+    0x037D: (0xA73F,),
+    0x037E: (0x003B,),
+    0x037F: (0x004A,),
+    0x0384: (0x0027,),
+    0x0387: (0x00B7,),
+    0x0391: (0x0041,),
+    0x0392: (0x0042,),
+    0x0395: (0x0045,),
+    0x0396: (0x005A,),
+    0x0397: (0x0048,),
+    0x0398: (0x004F, 0x0335),
+    0x0399: (0x006C,),
+    0x039A: (0x004B,),
+    0x039B: (0x0245,),
+    0x039C: (0x004D,),
+    0x039D: (0x004E,),
+    0x039F: (0x004F,),
+    0x03A1: (0x0050,),
+    0x03A3: (0x01A9,),
+    0x03A4: (0x0054,),
+    0x03A5: (0x0059,),
+    0x03A7: (0x0058,),
+    0x03B1: (0x0061,),
+    0x03B2: (0x00DF,),
+    0x03B3: (0x0079,),
+    0x03B4: (0x1E9F,),
+    0x03B5: (0xA793,),
+    0x03B7: (0x006E, 0x0329),
+    0x03B8: (0x004F, 0x0335),
+    0x03B9: (0x0069,),
+    0x03BA: (0x006B,),
+    0x03BD: (0x0076,),
+    0x03BF: (0x006F,),
+    0x03C0: (0x006E,),
+    0x03C1: (0x0070,),
+    0x03C3: (0x006F,),
+    0x03C4: (0x0074,),
+    0x03C5: (0x0075,),
+    0x03C6: (0x0278,),
+    0x03D0: (0x00DF,),
+    0x03D1: (0x004F, 0x0335),
+    0x03D2: (0x0059,),
+    0x03D5: (0x0278,),
+    0x03D6: (0x006E,),
+    0x03DB: (0x03C2,),
+    0x03DC: (0x0046,),
+    0x03E8: (0x0032,),
+    0x03E9: (0x01A8,),
+    0x03F0: (0x006B,),
+    0x03F1: (0x0070,),
+    0x03F2: (0x0063,),
+    0x03F3: (0x006A,),
+    0x03F4: (0x004F, 0x0335),
+    0x03F5: (0xA793,),
+    0x03F7: (0x00DE,),
+    0x03F8: (0x00FE,),
+    0x03F9: (0x0043,),
+    0x03FA: (0x004D,),
+    0x03FD: (0x0186,),
+    0x03FF: (0xA73E,),
+    0x0404: (0xA792,),
+    0x0405: (0x0053,),
+    0x0406: (0x006C,),
+    0x0408: (0x004A,),
+    0x0410: (0x0041,),
+    0x0411: (0x0062, 0x0304),
+    0x0412: (0x0042,),
+    0x0413: (0x0393,),
+    0x0415: (0x0045,),
+    0x0417: (0x0033,),
+    0x0419: (0x040D,),
+    0x041A: (0x004B,),
+    0x041B: (0x0245,),
+    0x041C: (0x004D,),
+    0x041D: (0x0048,),
+    0x041E: (0x004F,),
+    0x041F: (0x03A0,),
+    0x0420: (0x0050,),
+    0x0421: (0x0043,),
+    0x0422: (0x0054,),
+    0x0424: (0x03A6,),
+    0x0425: (0x0058,),
+    0x042B: (0x0062, 0x006C),
+    0x042C: (0x0062,),
+    0x042E: (0x006C, 0x004F),
+    0x0430: (0x0061,),
+    0x0431: (0x0036,),
+    0x0432: (0x0299,),
+    0x0433: (0x0072,),
+    0x0435: (0x0065,),
+    0x0437: (0x025C,),
+    0x0438: (0x1D0E,),
+    0x043A: (0x006B,),
+    0x043C: (0x0072, 0x006E),
+    0x043D: (0x029C,),
+    0x043E: (0x006F,),
+    0x043F: (0x006E,),
+    0x0440: (0x0070,),
+    0x0441: (0x0063,),
+    0x0442: (0x0074,),
+    0x0443: (0x0079,),
+    0x0444: (0x0278,),
+    0x0445: (0x0078,),
+    0x0446: (0x0075,),
+    0x044A: (0x02C9, 0x0062),
+    0x044B: (0x0185, 0x0069),
+    0x044C: (0x0185,),
+    0x044F: (0x1D19,),
+    0x0454: (0xA793,),
+    0x0455: (0x0073,),
+    0x0456: (0x0069,),
+    0x0458: (0x006A,),
+    0x045B: (0x0068, 0x0335),
+    0x045D: (0x0439,),
+    0x0461: (0x0076, 0x0076),
+    0x0462: (0x0062, 0x0335),
+    0x0463: (0x0062, 0x0335),
+    0x0470: (0x03A8,),
+    0x0471: (0x03C8,),
+    0x0472: (0x004F, 0x0335),
+    0x0473: (0x006F, 0x0335),
+    0x0474: (0x0056,),
+    0x0475: (0x0076,),
+    0x047C: (0x0460, 0x0486, 0x0487),
+    0x047D: (0x0076, 0x0076, 0x0486, 0x0487),
+    0x048A: (0x040D, 0x0326),
+    0x048B: (0x0439, 0x0326),
+    0x048C: (0x0062, 0x0335),
+    0x048D: (0x0062, 0x0335),
+    0x0490: (0x0393, 0x0027),
+    0x0491: (0x0072, 0x0027),
+    0x0492: (0x0393, 0x0335),
+    0x0493: (0x0072, 0x0335),
+    0x0496: (0x0416, 0x0329),
+    0x0497: (0x0436, 0x0329),
+    0x0498: (0x0033, 0x0326),
+    0x0499: (0x025C, 0x0326),
+    0x049A: (0x004B, 0x0329),
+    0x049B: (0x006B, 0x0329),
+    0x049E: (0x004B, 0x0335),
+    0x049F: (0x006B, 0x0335),
+    0x04A2: (0x0048, 0x0329),
+    0x04A3: (0x029C, 0x0329),
+    0x04AA: (0x0043, 0x0326),
+    0x04AB: (0x0063, 0x0326),
+    0x04AC: (0x0054, 0x0329),
+    0x04AD: (0x0074, 0x0329),
+    0x04AE: (0x0059,),
+    0x04AF: (0x0079,),
+    0x04B0: (0x0059, 0x0335),
+    0x04B1: (0x0079, 0x0335),
+    0x04B2: (0x0058, 0x0329),
+    0x04BB: (0x0068,),
+    0x04BD: (0x0065,),
+    0x04BE: (0x04BC, 0x0328),
+    0x04BF: (0x0065, 0x0328),
+    0x04C0: (0x006C,),
+    0x04C5: (0x0245, 0x0326),
+    0x04C6: (0x043B, 0x0326),
+    0x04C7: (0x0048, 0x0326),
+    0x04C8: (0x029C, 0x0326),
+    0x04C9: (0x0048, 0x0326),
+    0x04CA: (0x029C, 0x0326),
+    0x04CB: (0x04B6,),
+    0x04CC: (0x04B7,),
+    0x04CD: (0x004D, 0x0326),
+    0x04CE: (0x0072, 0x006E, 0x0326),
+    0x04CF: (0x0069,),
+    0x04D4: (0x0041, 0x0045),
+    0x04D5: (0x0061, 0x0065),
+    0x04D8: (0x018F,),
+    0x04D9: (0x01DD,),
+    0x04E0: (0x0033,),
+    0x04E1: (0x021D,),
+    0x04E8: (0x004F, 0x0335),
+    0x04E9: (0x006F, 0x0335),
+    0x0501: (0x0064,),
+    0x050A: (0x01F6,),
+    0x050C: (0x0047,),
+    0x050D: (0x0262,),
+    0x0510: (0x0190,),
+    0x0511: (0xA793,),
+    0x051B: (0x0071,),
+    0x051C: (0x0057,),
+    0x051D: (0x0076, 0x0076),
+    0x053B: (0x12AE,),
+    0x0544: (0x1206,),
+    0x054A: (0x1323,),
+    0x054C: (0x1261,),
+    0x054D: (0x0055,),
+    0x054F: (0x0053,),
+    0x0553: (0x03A6,),
+    0x0555: (0x004F,),
+    0x055A: (0x0027,),
+    0x055D: (0x0027,),
+    0x0561: (0x0076, 0x0076),
+    0x0563: (0x0071,),
+    0x0566: (0x0071,),
+    0x056E: (0x1E9F,),
+    0x0570: (0x0068,),
+    0x0575: (0x0237,),
+    0x0578: (0x006E,),
+    0x057A: (0x0270,),
+    0x057C: (0x006E,),
+    0x057D: (0x0075,),
+    0x0581: (0x0067,),
+    0x0584: (0x0066,),
+    0x0585: (0x006F,),
+    0x0587: (0x0565, 0x0582),
+    0x0589: (0x003A,),
+    0x059C: (0x0301,),
+    0x059D: (0x0301,),
+    0x05A4: (0x059A,),
+    0x05A8: (0x0599,),
+    0x05AD: (0x0596,),
+    0x05AE: (0x0598,),
+    0x05AF: (0x030A,),
+    0x05B4: (0x0323,),
+    0x05B9: (0x0307,),
+    0x05BA: (0x0307,),
+    0x05C0: (0x006C,),
+    0x05C1: (0x0307,),
+    0x05C2: (0x0307,),
+    0x05C3: (0x003A,),
+    0x05C4: (0x0307,),
+    0x05C5: (0x0323,),
+    0x05D5: (0x006C,),
+    0x05D8: (0x0076,),
+    0x05D9: (0x0027,),
+    0x05DF: (0x006C,),
+    0x05E1: (0x006F,),
+    0x05F0: (0x006C, 0x006C),
+    0x05F1: (0x006C, 0x0027),
+    0x05F2: (0x0027, 0x0027),
+    0x05F3: (0x0027,),
+    0x05F4: (0x0027, 0x0027),
+    0x0609: (0x00BA, 0x002F, 0x2080, 0x2080),
+    0x060A: (0x00BA, 0x002F, 0x2080, 0x2080, 0x2080),
+    0x060D: (0x002C,),
+    0x060F: (0x0639,),
+    0x0618: (0x0301,),
+    0x0619: (0x0313,),
+    0x061A: (0x0650,),
+    0x0623: (0x006C, 0x0674),
+    0x0624: (0x0648, 0x0674),
+    0x0625: (0x006C, 0x0655),
+    0x0626: (0x0649, 0x0674),
+    0x0627: (0x006C,),
+    0x062B: (0x0649, 0x06DB),
+    0x0634: (0x0633, 0x06DB),
+    0x063D: (0x0649, 0x0302),
+    0x063F: (0x0649, 0x06DB),
+    0x0647: (0x006F,),
+    0x064A: (0x0649,),
+    0x064B: (0x030B,),
+    0x064E: (0x0301,),
+    0x064F: (0x0313,),
+    0x0652: (0x030A,),
+    0x0653: (0x0303,),
+    0x0656: (0x0329,),
+    0x0657: (0x0312,),
+    0x0658: (0x0306,),
+    0x0659: (0x0304,),
+    0x065A: (0x0306,),
+    0x065B: (0x0302,),
+    0x065C: (0x0323,),
+    0x065D: (0x0314,),
+    0x065F: (0x0655,),
+    0x0660: (0x002E,),
+    0x0661: (0x006C,),
+    0x0665: (0x006F,),
+    0x0667: (0x0056,),
+    0x0668: (0x0245,),
+    0x066A: (0x00BA, 0x002F, 0x2080),
+    0x066B: (0x002C,),
+    0x066C: (0x060C,),
+    0x066D: (0x002A,),
+    0x066E: (0x0649,),
+    0x066F: (0x06A1,),
+    0x0672: (0x006C, 0x0674),
+    0x0673: (0x006C, 0x0655),
+    0x0675: (0x006C, 0x0674),
+    0x0676: (0x0648, 0x0674),
+    0x0677: (0x0648, 0x0313, 0x0674),
+    0x0678: (0x0649, 0x0674),
+    0x0679: (0x0649, 0x0615),
+    0x067E: (0x0649, 0x06DB),
+    0x0681: (0x062D, 0x0654),
+    0x0685: (0x062D, 0x06DB),
+    0x0688: (0x062F, 0x0615),
+    0x068B: (0x068A, 0x0615),
+    0x068E: (0x062F, 0x06DB),
+    0x0691: (0x0631, 0x0615),
+    0x0692: (0x0631, 0x0306),
+    0x0698: (0x0631, 0x06DB),
+    0x069E: (0x0635, 0x06DB),
+    0x069F: (0x0637, 0x06DB),
+    0x06A4: (0x06A1, 0x06DB),
+    0x06A7: (0x0641,),
+    0x06A8: (0x06A1, 0x06DB),
+    0x06A9: (0x0643,),
+    0x06AA: (0x0643,),
+    0x06AD: (0x0643, 0x06DB),
+    0x06B4: (0x06AF, 0x06DB),
+    0x06B5: (0x0644, 0x0306),
+    0x06B7: (0x0644, 0x06DB),
+    0x06BA: (0x0649,),
+    0x06BB: (0x0649, 0x0615),
+    0x06BD: (0x0649, 0x06DB),
+    0x06BE: (0x006F,),
+    0x06C1: (0x006F,),
+    0x06C2: (0x06C0,),
+    0x06C3: (0x0629,),
+    0x06C6: (0x0648, 0x0306),
+    0x06C7: (0x0648, 0x0313),
+    0x06C8: (0x0648, 0x0670),
+    0x06C9: (0x0648, 0x0302),
+    0x06CB: (0x0648, 0x06DB),
+    0x06CC: (0x0649,),
+    0x06CE: (0x0649, 0x0306),
+    0x06D0: (0x067B,),
+    0x06D1: (0x0649, 0x06DB),
+    0x06D2: (0x0649,),
+    0x06D4: (0x002D,),
+    0x06D5: (0x006F,),
+    0x06DF: (0x030A,),
+    0x06E8: (0x0306, 0x0307),
+    0x06EC: (0x0307,),
+    0x06EE: (0x062F, 0x0302),
+    0x06EF: (0x0631, 0x0302),
+    0x06F0: (0x002E,),
+    0x06F1: (0x006C,),
+    0x06F2: (0x0662,),
+    0x06F3: (0x0663,),
+    0x06F4: (0x0664,),
+    0x06F5: (0x006F,),
+    0x06F6: (0x0666,),
+    0x06F7: (0x0056,),
+    0x06F8: (0x0245,),
+    0x06F9: (0x0669,),
+    0x06FD: (0x0621, 0x0348),
+    0x06FE: (0x0645, 0x0348),
+    0x06FF: (0x006F, 0x0302),
+    0x0701: (0x002E,),
+    0x0702: (0x002E,),
+    0x0703: (0x003A,),
+    0x0704: (0x003A,),
+    0x0740: (0x0307,),
+    0x0741: (0x0307,),
+    0x0742: (0x073C,),
+    0x0747: (0x0301,),
+    0x0751: (0x0628, 0x06DB),
+    0x0756: (0x0649, 0x0306),
+    0x0762: (0x06AC,),
+    0x0763: (0x0643, 0x06DB),
+    0x0767: (0x0754,),
+    0x0768: (0x0646, 0x0615),
+    0x0769: (0x0646, 0x0306),
+    0x076C: (0x0631, 0x0654),
+    0x0771: (0x0697, 0x0615),
+    0x0772: (0x062D, 0x0654),
+    0x077E: (0x0633, 0x0302),
+    0x07C0: (0x004F,),
+    0x07CA: (0x006C,),
+    0x07EB: (0x0304,),
+    0x07ED: (0x0307,),
+    0x07EE: (0x0302,),
+    0x07F3: (0x0308,),
+    0x07F4: (0x0027,),
+    0x07F5: (0x0027,),
+    0x07FA: (0x005F,),
+    0x08A1: (0x0628, 0x0654),
+    0x08A4: (0x06A2, 0x06DB),
+    0x08A7: (0x0645, 0x06DB),
+    0x08A8: (0x0649, 0x0654),
+    0x08A9: (0x0754,),
+    0x08AE: (0x062F, 0x0324, 0x0323),
+    0x08AF: (0x0635, 0x0324, 0x0323),
+    0x08B0: (0x06AF,),
+    0x08B1: (0x0648,),
+    0x08B2: (0x0632, 0x0302),
+    0x08E5: (0x064C,),
+    0x08E8: (0x064C,),
+    0x08EA: (0x0307,),
+    0x08EB: (0x0308,),
+    0x08ED: (0x0323,),
+    0x08EE: (0x0324,),
+    0x08F0: (0x030B,),
+    0x08F1: (0x064C,),
+    0x08F2: (0x064D,),
+    0x08F3: (0x0313,),
+    0x08F8: (0x0350,),
+    0x08F9: (0x0354,),
+    0x08FA: (0x0355,),
+    0x08FF: (0x0350,),
+    0x0900: (0x0352,),
+    0x0901: (0x0306, 0x0307),
+    0x0902: (0x0307,),
+    0x0903: (0x003A,),
+    0x0904: (0x0905, 0x0946),
+    0x0906: (0x0905, 0x093E),
+    0x0908: (0x0930, 0x094D, 0x0907),
+    0x090D: (0x090F, 0x0945),
+    0x090E: (0x090F, 0x0946),
+    0x0910: (0x090F, 0x0947),
+    0x0911: (0x0905, 0x0949),
+    0x0912: (0x0905, 0x093E, 0x0946),
+    0x0913: (0x0905, 0x093E, 0x0947),
+    0x0914: (0x0905, 0x093E, 0x0948),
+    0x093C: (0x0323,),
+    0x0952: (0x0331,),
+    0x0953: (0x0300,),
+    0x0954: (0x0301,),
+    0x0965: (0x0964, 0x0964),
+    0x0966: (0x006F,),
+    0x0967: (0x0669,),
+    0x097D: (0x003F,),
+    0x0981: (0x0306, 0x0307),
+    0x0986: (0x0985, 0x09BE),
+    0x09BC: (0x0323,),
+    0x09E0: (0x098B, 0x09C3),
+    0x09E1: (0x098B, 0x09C3),
+    0x09E6: (0x004F,),
+    0x09EA: (0x0038,),
+    0x09ED: (0x0039,),
+    0x0A02: (0x0307,),
+    0x0A03: (0x0983,),
+    0x0A06: (0x0A05, 0x0A3E),
+    0x0A07: (0x0A72, 0x0A3F),
+    0x0A08: (0x0A72, 0x0A40),
+    0x0A09: (0x0A73, 0x0A41),
+    0x0A0A: (0x0A73, 0x0A42),
+    0x0A0F: (0x0A72, 0x0A47),
+    0x0A10: (0x0A05, 0x0A48),
+    0x0A14: (0x0A05, 0x0A4C),
+    0x0A3C: (0x0323,),
+    0x0A4B: (0x0946,),
+    0x0A4D: (0x094D,),
+    0x0A66: (0x006F,),
+    0x0A67: (0x0039,),
+    0x0A6A: (0x0038,),
+    0x0A81: (0x0306, 0x0307),
+    0x0A82: (0x0307,),
+    0x0A83: (0x003A,),
+    0x0A86: (0x0A85, 0x0ABE),
+    0x0A8D: (0x0A85, 0x0AC5),
+    0x0A8F: (0x0A85, 0x0AC7),
+    0x0A90: (0x0A85, 0x0AC8),
+    0x0A91: (0x0A85, 0x0ABE, 0x0AC5),
+    0x0A93: (0x0A85, 0x0ABE, 0x0AC7),
+    0x0A94: (0x0A85, 0x0ABE, 0x0AC8),
+    0x0ABC: (0x0323,),
+    0x0ABD: (0x093D,),
+    0x0AC1: (0x0941,),
+    0x0AC2: (0x0942,),
+    0x0ACD: (0x094D,),
+    0x0AE6: (0x006F,),
+    0x0AE8: (0x0968,),
+    0x0AE9: (0x0969,),
+    0x0AEA: (0x096A,),
+    0x0AEE: (0x096E,),
+    0x0AF0: (0x0970,),
+    0x0B01: (0x0306, 0x0307),
+    0x0B03: (0x0038,),
+    0x0B06: (0x0B05, 0x0B3E),
+    0x0B20: (0x004F,),
+    0x0B3C: (0x0323,),
+    0x0B66: (0x004F,),
+    0x0B68: (0x0039,),
+    0x0B82: (0x030A,),
+    0x0B8A: (0x0B89, 0x0BB3),
+    0x0B9C: (0x0B90,),
+    0x0BB0: (0x0B88,),
+    0x0BBE: (0x0B88,),
+    0x0BC8: (0x0BA9,),
+    0x0BCA: (0x0BC6, 0x0B88),
+    0x0BCB: (0x0BC7, 0x0B88),
+    0x0BCC: (0x0BC6, 0x0BB3),
+    0x0BCD: (0x0307,),
+    0x0BD7: (0x0BB3,),
+    0x0BE6: (0x006F,),
+    0x0BE7: (0x0B95,),
+    0x0BE8: (0x0B89,),
+    0x0BEA: (0x0B9A,),
+    0x0BEB: (0x0B88, 0x0BC1),
+    0x0BEC: (0x0B9A, 0x0BC1),
+    0x0BED: (0x0B8E,),
+    0x0BEE: (0x0B85,),
+    0x0BF0: (0x0BAF,),
+    0x0BF2: (0x0B9A, 0x0BC2),
+    0x0BF4: (0x0BAE, 0x0BC0),
+    0x0BF5: (0x0BF3,),
+    0x0BF7: (0x0B8E, 0x0BB5),
+    0x0BF8: (0x0BB7,),
+    0x0BFA: (0x0BA8, 0x0BC0),
+    0x0C00: (0x0306, 0x0307),
+    0x0C02: (0x006F,),
+    0x0C03: (0x0983,),
+    0x0C13: (0x0C12, 0x0C55),
+    0x0C14: (0x0C12, 0x0C4C),
+    0x0C20: (0x0C30, 0x05BC),
+    0x0C22: (0x0C21, 0x0323),
+    0x0C25: (0x0C27, 0x05BC),
+    0x0C2D: (0x0C2C, 0x0323),
+    0x0C2E: (0x0C35, 0x0C41),
+    0x0C37: (0x0C35, 0x0323),
+    0x0C39: (0x0C35, 0x0C3E),
+    0x0C42: (0x0C41, 0x0C3E),
+    0x0C44: (0x0C43, 0x0C3E),
+    0x0C60: (0x0C0B, 0x0C3E),
+    0x0C61: (0x0C0C, 0x0C3E),
+    0x0C66: (0x006F,),
+    0x0C81: (0x0306, 0x0307),
+    0x0C82: (0x006F,),
+    0x0C83: (0x0983,),
+    0x0C85: (0x0C05,),
+    0x0C86: (0x0C06,),
+    0x0C87: (0x0C07,),
+    0x0C92: (0x0C12,),
+    0x0C93: (0x0C12, 0x0C55),
+    0x0C94: (0x0C12, 0x0C4C),
+    0x0C9C: (0x0C1C,),
+    0x0C9E: (0x0C1E,),
+    0x0CA3: (0x0C23,),
+    0x0CAF: (0x0C2F,),
+    0x0CB1: (0x0C31,),
+    0x0CB2: (0x0C32,),
+    0x0CE1: (0x0C8C, 0x0CBE),
+    0x0CE6: (0x006F,),
+    0x0CE7: (0x0C67,),
+    0x0CE8: (0x0C68,),
+    0x0CEF: (0x0C6F,),
+    0x0D01: (0x0306, 0x0307),
+    0x0D02: (0x006F,),
+    0x0D03: (0x0983,),
+    0x0D08: (0x0D07, 0x0D57),
+    0x0D09: (0x0B89,),
+    0x0D0A: (0x0B89, 0x0D57),
+    0x0D0C: (0x0D28, 0x0D41),
+    0x0D10: (0x0D0E, 0x0D46),
+    0x0D13: (0x0D12, 0x0D3E),
+    0x0D14: (0x0D12, 0x0D57),
+    0x0D19: (0x0D28, 0x0D41),
+    0x0D1C: (0x0B90,),
+    0x0D20: (0x006F,),
+    0x0D23: (0x0BA3,),
+    0x0D31: (0x0D30,),
+    0x0D34: (0x0BB4,),
+    0x0D36: (0x0BB6,),
+    0x0D3A: (0x0B9F, 0x0BBF),
+    0x0D3F: (0x0BBF,),
+    0x0D40: (0x0BBF,),
+    0x0D42: (0x0D41,),
+    0x0D43: (0x0D41,),
+    0x0D48: (0x0D46, 0x0D46),
+    0x0D4E: (0x0971,),
+    0x0D5A: (0x0D28, 0x0D4D, 0x0D2E),
+    0x0D5F: (0x006F, 0x0D30, 0x006F),
+    0x0D61: (0x0D1E,),
+    0x0D66: (0x006F,),
+    0x0D6A: (0x0D30, 0x0D4D),
+    0x0D6B: (0x0D26, 0x0D4D, 0x0D30),
+    0x0D6C: (0x0D28, 0x0D4D, 0x0D28),
+    0x0D6D: (0x0039,),
+    0x0D6E: (0x0D35, 0x0D4D, 0x0D30),
+    0x0D6F: (0x0D28, 0x0D4D),
+    0x0D76: (0x0D39, 0x0D4D, 0x0D2E),
+    0x0D79: (0x0D28, 0x0D41),
+    0x0D7B: (0x0D28, 0x0D4D),
+    0x0D7C: (0x0D30, 0x0D4D),
+    0x0D82: (0x006F,),
+    0x0D83: (0x0983,),
+    0x0DE9: (0x0DE8, 0x0DCF),
+    0x0DEA: (0x0DA2,),
+    0x0DEB: (0x0DAF,),
+    0x0DEF: (0x0DE8, 0x0DD3),
+    0x0E03: (0x0E02,),
+    0x0E0B: (0x0E0A,),
+    0x0E0F: (0x0E0E,),
+    0x0E14: (0x0E04,),
+    0x0E15: (0x0E04,),
+    0x0E17: (0x0E11,),
+    0x0E21: (0x0E06,),
+    0x0E26: (0x0E20,),
+    0x0E33: (0x030A, 0x0E32),
+    0x0E41: (0x0E40, 0x0E40),
+    0x0E45: (0x0E32,),
+    0x0E4D: (0x030A,),
+    0x0E50: (0x006F,),
+    0x0E88: (0x0E08,),
+    0x0E8D: (0x0E22,),
+    0x0E9A: (0x0E1A,),
+    0x0E9B: (0x0E1B,),
+    0x0E9D: (0x0E1D,),
+    0x0E9E: (0x0E1E,),
+    0x0E9F: (0x0E1F,),
+    0x0EB3: (0x030A, 0x0EB2),
+    0x0EB8: (0x0E38,),
+    0x0EB9: (0x0E39,),
+    0x0EC8: (0x0E48,),
+    0x0EC9: (0x0E49,),
+    0x0ECA: (0x0E4A,),
+    0x0ECB: (0x0E4B,),
+    0x0ECD: (0x030A,),
+    0x0ED0: (0x006F,),
+    0x0EDC: (0x0EAB, 0x0E99),
+    0x0EDD: (0x0EAB, 0x0EA1),
+    0x0F00: (0x0F68, 0x0F7C, 0x0F7E),
+    0x0F0C: (0x0F0B,),
+    0x0F0E: (0x0F0D, 0x0F0D),
+    0x0F1B: (0x0F1A, 0x0F1A),
+    0x0F1E: (0x0F1D, 0x0F1D),
+    0x0F1F: (0x0F1A, 0x0F1D),
+    0x0F6A: (0x0F62,),
+    0x0F77: (0x0FB2, 0x0F71, 0x0F80),
+    0x0F79: (0x0FB3, 0x0F71, 0x0F80),
+    0x0FCE: (0x0F1D, 0x0F1A),
+    0x0FD5: (0x5350,),
+    0x0FD6: (0x534D,),
+    0x1000: (0x1002, 0x102C),
+    0x1010: (0x006F, 0x102C),
+    0x101D: (0x006F,),
+    0x101F: (0x1015, 0x102C),
+    0x102A: (0x1029, 0x1031, 0x102C, 0x103A),
+    0x1036: (0x030A,),
+    0x1038: (0x0983,),
+    0x1040: (0x006F,),
+    0x104B: (0x104A, 0x104A),
+    0x1065: (0x1041,),
+    0x1066: (0x1015, 0x103E),
+    0x106F: (0x1015, 0x102C, 0x103E),
+    0x1070: (0x1003, 0x103E),
+    0x1081: (0x1002, 0x103E),
+    0x109E: (0x1083, 0x030A),
+    0x10A0: (0xA786,),
+    0x10E7: (0x0079,),
+    0x10F3: (0x021D,),
+    0x10FF: (0x006F,),
+    0x1101: (0x1100, 0x1100),
+    0x1104: (0x1103, 0x1103),
+    0x1108: (0x1107, 0x1107),
+    0x110A: (0x1109, 0x1109),
+    0x110D: (0x110C, 0x110C),
+    0x1113: (0x1102, 0x1100),
+    0x1114: (0x1102, 0x1102),
+    0x1115: (0x1102, 0x1103),
+    0x1116: (0x1102, 0x1107),
+    0x1117: (0x1103, 0x1100),
+    0x1118: (0x1105, 0x1102),
+    0x1119: (0x1105, 0x1105),
+    0x111A: (0x1105, 0x1112),
+    0x111B: (0x1105, 0x110B),
+    0x111C: (0x1106, 0x1107),
+    0x111D: (0x1106, 0x110B),
+    0x111E: (0x1107, 0x1100),
+    0x111F: (0x1107, 0x1102),
+    0x1120: (0x1107, 0x1103),
+    0x1121: (0x1107, 0x1109),
+    0x1122: (0x1107, 0x1109, 0x1100),
+    0x1123: (0x1107, 0x1109, 0x1103),
+    0x1124: (0x1107, 0x1109, 0x1107),
+    0x1125: (0x1107, 0x1109, 0x1109),
+    0x1126: (0x1107, 0x1109, 0x110C),
+    0x1127: (0x1107, 0x110C),
+    0x1128: (0x1107, 0x110E),
+    0x1129: (0x1107, 0x1110),
+    0x112A: (0x1107, 0x1111),
+    0x112B: (0x1107, 0x110B),
+    0x112C: (0x1107, 0x1107, 0x110B),
+    0x112D: (0x1109, 0x1100),
+    0x112E: (0x1109, 0x1102),
+    0x112F: (0x1109, 0x1103),
+    0x1130: (0x1109, 0x1105),
+    0x1131: (0x1109, 0x1106),
+    0x1132: (0x1109, 0x1107),
+    0x1133: (0x1109, 0x1107, 0x1100),
+    0x1134: (0x1109, 0x1109, 0x1109),
+    0x1135: (0x1109, 0x110B),
+    0x1136: (0x1109, 0x110C),
+    0x1137: (0x1109, 0x110E),
+    0x1138: (0x1109, 0x110F),
+    0x1139: (0x1109, 0x1110),
+    0x113A: (0x1109, 0x1111),
+    0x113B: (0x1105, 0x1112),
+    0x113D: (0x113C, 0x113C),
+    0x113F: (0x113E, 0x113E),
+    0x1141: (0x110B, 0x1100),
+    0x1142: (0x110B, 0x1103),
+    0x1143: (0x110B, 0x1106),
+    0x1144: (0x110B, 0x1107),
+    0x1145: (0x110B, 0x1109),
+    0x1146: (0x110B, 0x1140),
+    0x1147: (0x110B, 0x110B),
+    0x1148: (0x110B, 0x110C),
+    0x1149: (0x110B, 0x110E),
+    0x114A: (0x110B, 0x1110),
+    0x114B: (0x110B, 0x1111),
+    0x114D: (0x110C, 0x110B),
+    0x114F: (0x114E, 0x114E),
+    0x1151: (0x1150, 0x1150),
+    0x1152: (0x110E, 0x110F),
+    0x1153: (0x110E, 0x1112),
+    0x1156: (0x1111, 0x1107),
+    0x1157: (0x1111, 0x110B),
+    0x1158: (0x1112, 0x1112),
+    0x115A: (0x1100, 0x1103),
+    0x115B: (0x1102, 0x1109),
+    0x115C: (0x1102, 0x110C),
+    0x115D: (0x1102, 0x1112),
+    0x115E: (0x1103, 0x1105),
+    0x1162: (0x1161, 0x4E28),
+    0x1164: (0x1163, 0x4E28),
+    0x1166: (0x1165, 0x4E28),
+    0x1168: (0x1167, 0x4E28),
+    0x116A: (0x1169, 0x1161),
+    0x116B: (0x1169, 0x1161, 0x4E28),
+    0x116C: (0x1169, 0x4E28),
+    0x116F: (0x116E, 0x1165),
+    0x1170: (0x116E, 0x1165, 0x4E28),
+    0x1171: (0x116E, 0x4E28),
+    0x1173: (0x30FC,),
+    0x1174: (0x30FC, 0x4E28),
+    0x1175: (0x4E28,),
+    0x1176: (0x1161, 0x1169),
+    0x1177: (0x1161, 0x116E),
+    0x1178: (0x1163, 0x1169),
+    0x1179: (0x1163, 0x116D),
+    0x117A: (0x1165, 0x1169),
+    0x117B: (0x1165, 0x116E),
+    0x117C: (0x1165, 0x30FC),
+    0x117D: (0x1167, 0x1169),
+    0x117E: (0x1167, 0x116E),
+    0x117F: (0x1169, 0x1165),
+    0x1180: (0x1169, 0x1165, 0x4E28),
+    0x1181: (0x1169, 0x1167, 0x4E28),
+    0x1182: (0x1169, 0x1169),
+    0x1183: (0x1169, 0x116E),
+    0x1184: (0x116D, 0x1163),
+    0x1185: (0x116D, 0x1163, 0x4E28),
+    0x1186: (0x116D, 0x1163),
+    0x1187: (0x116D, 0x1169),
+    0x1188: (0x116D, 0x4E28),
+    0x1189: (0x116E, 0x1161),
+    0x118A: (0x116E, 0x1161, 0x4E28),
+    0x118B: (0x116E, 0x1165, 0x30FC),
+    0x118C: (0x116E, 0x1167, 0x4E28),
+    0x118D: (0x116E, 0x116E),
+    0x118E: (0x1172, 0x1161),
+    0x118F: (0x1172, 0x1165),
+    0x1190: (0x1172, 0x1165, 0x4E28),
+    0x1191: (0x1172, 0x1167),
+    0x1192: (0x1172, 0x1167, 0x4E28),
+    0x1193: (0x1172, 0x116E),
+    0x1194: (0x1172, 0x4E28),
+    0x1195: (0x30FC, 0x116E),
+    0x1196: (0x30FC, 0x30FC),
+    0x1197: (0x30FC, 0x4E28, 0x116E),
+    0x1198: (0x4E28, 0x1161),
+    0x1199: (0x4E28, 0x1163),
+    0x119A: (0x4E28, 0x1169),
+    0x119B: (0x4E28, 0x116E),
+    0x119C: (0x4E28, 0x30FC),
+    0x119D: (0x4E28, 0x119E),
+    0x119F: (0x119E, 0x1165),
+    0x11A0: (0x119E, 0x116E),
+    0x11A1: (0x119E, 0x4E28),
+    0x11A2: (0x119E, 0x119E),
+    0x11A3: (0x1161, 0x30FC),
+    0x11A4: (0x1163, 0x116E),
+    0x11A5: (0x1167, 0x1163),
+    0x11A6: (0x1169, 0x1163),
+    0x11A7: (0x1169, 0x1163, 0x4E28),
+    0x11A8: (0x1100,),
+    0x11A9: (0x1100, 0x1100),
+    0x11AA: (0x1100, 0x1109),
+    0x11AB: (0x1102,),
+    0x11AC: (0x1102, 0x110C),
+    0x11AD: (0x1102, 0x1112),
+    0x11AE: (0x1103,),
+    0x11AF: (0x1105,),
+    0x11B0: (0x1105, 0x1100),
+    0x11B1: (0x1105, 0x1106),
+    0x11B2: (0x1105, 0x1107),
+    0x11B3: (0x1105, 0x1109),
+    0x11B4: (0x1105, 0x1110),
+    0x11B5: (0x1105, 0x1111),
+    0x11B6: (0x1105, 0x1112),
+    0x11B7: (0x1106,),
+    0x11B8: (0x1107,),
+    0x11B9: (0x1107, 0x1109),
+    0x11BA: (0x1109,),
+    0x11BB: (0x1109, 0x1109),
+    0x11BC: (0x110B,),
+    0x11BD: (0x110C,),
+    0x11BE: (0x110E,),
+    0x11BF: (0x110F,),
+    0x11C0: (0x1110,),
+    0x11C1: (0x1111,),
+    0x11C2: (0x1112,),
+    0x11C3: (0x1100, 0x1105),
+    0x11C4: (0x1100, 0x1109, 0x1100),
+    0x11C5: (0x1102, 0x1100),
+    0x11C6: (0x1102, 0x1103),
+    0x11C7: (0x1102, 0x1109),
+    0x11C8: (0x1102, 0x1140),
+    0x11C9: (0x1102, 0x1110),
+    0x11CA: (0x1103, 0x1100),
+    0x11CB: (0x1103, 0x1105),
+    0x11CC: (0x1105, 0x1100, 0x1109),
+    0x11CD: (0x1105, 0x1102),
+    0x11CE: (0x1105, 0x1103),
+    0x11CF: (0x1105, 0x1103, 0x1112),
+    0x11D0: (0x1105, 0x1105),
+    0x11D1: (0x1105, 0x1106, 0x1100),
+    0x11D2: (0x1105, 0x1106, 0x1109),
+    0x11D3: (0x1105, 0x1107, 0x1109),
+    0x11D4: (0x1105, 0x1107, 0x1112),
+    0x11D5: (0x1105, 0x1107, 0x110B),
+    0x11D6: (0x1105, 0x1109, 0x1109),
+    0x11D7: (0x1105, 0x1140),
+    0x11D8: (0x1105, 0x110F),
+    0x11D9: (0x1105, 0x1159),
+    0x11DA: (0x1106, 0x1100),
+    0x11DB: (0x1106, 0x1105),
+    0x11DC: (0x1106, 0x1107),
+    0x11DD: (0x1106, 0x1109),
+    0x11DE: (0x1106, 0x1109, 0x1109),
+    0x11DF: (0x1106, 0x1140),
+    0x11E0: (0x1106, 0x110E),
+    0x11E1: (0x1106, 0x1112),
+    0x11E2: (0x1106, 0x110B),
+    0x11E3: (0x1107, 0x1105),
+    0x11E4: (0x1107, 0x1111),
+    0x11E5: (0x1107, 0x1112),
+    0x11E6: (0x1107, 0x110B),
+    0x11E7: (0x1109, 0x1100),
+    0x11E8: (0x1109, 0x1103),
+    0x11E9: (0x1109, 0x1105),
+    0x11EA: (0x1109, 0x1107),
+    0x11EB: (0x1140,),
+    0x11EC: (0x110B, 0x1100),
+    0x11ED: (0x110B, 0x1100, 0x1100),
+    0x11EE: (0x110B, 0x110B),
+    0x11EF: (0x110B, 0x110F),
+    0x11F0: (0x114C,),
+    0x11F1: (0x110B, 0x1109),
+    0x11F2: (0x110B, 0x1140),
+    0x11F3: (0x1111, 0x1107),
+    0x11F4: (0x1111, 0x110B),
+    0x11F5: (0x1112, 0x1102),
+    0x11F6: (0x1112, 0x1105),
+    0x11F7: (0x1112, 0x1106),
+    0x11F8: (0x1112, 0x1107),
+    0x11F9: (0x1159,),
+    0x11FA: (0x1100, 0x1102),
+    0x11FB: (0x1100, 0x1107),
+    0x11FC: (0x1100, 0x110E),
+    0x11FD: (0x1100, 0x110F),
+    0x11FE: (0x1100, 0x1112),
+    0x11FF: (0x1102, 0x1102),
+    0x1200: (0x0055,),
+    0x1223: (0x0270,),
+    0x1240: (0x03A6,),
+    0x1260: (0x0548,),
+    0x1294: (0x0571,),
+    0x12D0: (0x004F,),
+    0x13A0: (0x0044,),
+    0x13A1: (0x0052,),
+    0x13A2: (0x0054,),
+    0x13A4: (0x004F, 0x0027),
+    0x13A5: (0x0069,),
+    0x13A8: (0x2C75,),
+    0x13A9: (0x0059,),
+    0x13AA: (0x0041,),
+    0x13AB: (0x004A,),
+    0x13AC: (0x0045,),
+    0x13AE: (0x003F,),
+    0x13B0: (0x2C75,),
+    0x13B1: (0x0393,),
+    0x13B3: (0x0057,),
+    0x13B7: (0x004D,),
+    0x13BB: (0x0048,),
+    0x13BD: (0x0059,),
+    0x13BE: (0x004F, 0x0335),
+    0x13BF: (0x01AB,),
+    0x13C0: (0x0047,),
+    0x13C2: (0x0068,),
+    0x13C3: (0x005A,),
+    0x13C7: (0x0460,),
+    0x13CB: (0x0190,),
+    0x13CC: (0x0055, 0x0335),
+    0x13CE: (0x0034,),
+    0x13CF: (0x0062,),
+    0x13D2: (0x0052,),
+    0x13D4: (0x0057,),
+    0x13D5: (0x0053,),
+    0x13D9: (0x0056,),
+    0x13DA: (0x0053,),
+    0x13DE: (0x004C,),
+    0x13DF: (0x0043,),
+    0x13E2: (0x0050,),
+    0x13E6: (0x004B,),
+    0x13E7: (0x0064,),
+    0x13EB: (0x004F, 0x0335),
+    0x13EE: (0x0036,),
+    0x13F0: (0x00DF,),
+    0x13F2: (0x0068, 0x0314),
+    0x13F3: (0x0047,),
+    0x13F4: (0x0042,),
+    0x1400: (0x003D,),
+    0x1403: (0x0394,),
+    0x140C: (0x00B7, 0x1401),
+    0x140D: (0x1401, 0x00B7),
+    0x140E: (0x00B7, 0x0394),
+    0x140F: (0x0394, 0x00B7),
+    0x1410: (0x00B7, 0x1404),
+    0x1411: (0x1404, 0x00B7),
+    0x1412: (0x00B7, 0x1405),
+    0x1413: (0x1405, 0x00B7),
+    0x1414: (0x00B7, 0x1406),
+    0x1415: (0x1406, 0x00B7),
+    0x1417: (0x00B7, 0x140A),
+    0x1418: (0x140A, 0x00B7),
+    0x1419: (0x00B7, 0x140B),
+    0x141A: (0x140B, 0x00B7),
+    0x1427: (0x00B7,),
+    0x142B: (0x1401, 0x1420),
+    0x142C: (0x0394, 0x1420),
+    0x142D: (0x1405, 0x1420),
+    0x142E: (0x140A, 0x1420),
+    0x142F: (0x0056,),
+    0x1431: (0x0245,),
+    0x1433: (0x003E,),
+    0x1437: (0x00B7, 0x003E),
+    0x1438: (0x003C,),
+    0x143A: (0x00B7, 0x0056),
+    0x143B: (0x0056, 0x00B7),
+    0x143C: (0x00B7, 0x0245),
+    0x143D: (0x0245, 0x00B7),
+    0x143E: (0x00B7, 0x1432),
+    0x143F: (0x1432, 0x00B7),
+    0x1440: (0x00B7, 0x003E),
+    0x1441: (0x003E, 0x00B7),
+    0x1442: (0x00B7, 0x1434),
+    0x1443: (0x1434, 0x00B7),
+    0x1444: (0x00B7, 0x003C),
+    0x1445: (0x003C, 0x00B7),
+    0x1446: (0x00B7, 0x1439),
+    0x1447: (0x1439, 0x00B7),
+    0x144A: (0x0027,),
+    0x144C: (0x0055,),
+    0x144E: (0x0548,),
+    0x1454: (0x00B7, 0x1450),
+    0x1457: (0x00B7, 0x0055),
+    0x1458: (0x0055, 0x00B7),
+    0x1459: (0x00B7, 0x0548),
+    0x145A: (0x0548, 0x00B7),
+    0x145B: (0x00B7, 0x144F),
+    0x145C: (0x144F, 0x00B7),
+    0x145D: (0x00B7, 0x1450),
+    0x145E: (0x1450, 0x00B7),
+    0x145F: (0x00B7, 0x1451),
+    0x1460: (0x1451, 0x00B7),
+    0x1461: (0x00B7, 0x1455),
+    0x1462: (0x1455, 0x00B7),
+    0x1463: (0x00B7, 0x1456),
+    0x1464: (0x1456, 0x00B7),
+    0x1467: (0x0055, 0x0027),
+    0x1468: (0x0548, 0x0027),
+    0x1469: (0x1450, 0x0027),
+    0x146A: (0x1455, 0x0027),
+    0x146D: (0x0050,),
+    0x146F: (0x0064,),
+    0x1474: (0x00B7, 0x146B),
+    0x1475: (0x146B, 0x00B7),
+    0x1476: (0x00B7, 0x0050),
+    0x1477: (0x0070, 0x00B7),
+    0x1478: (0x00B7, 0x146E),
+    0x1479: (0x146E, 0x00B7),
+    0x147A: (0x00B7, 0x0064),
+    0x147B: (0x0064, 0x00B7),
+    0x147C: (0x00B7, 0x1470),
+    0x147D: (0x1470, 0x00B7),
+    0x147E: (0x00B7, 0x1472),
+    0x147F: (0x1472, 0x00B7),
+    0x1480: (0x00B7, 0x1473),
+    0x1481: (0x1473, 0x00B7),
+    0x1485: (0x146B, 0x0027),
+    0x1486: (0x0050, 0x0027),
+    0x1487: (0x0064, 0x0027),
+    0x1488: (0x1472, 0x0027),
+    0x148D: (0x004A,),
+    0x1492: (0x00B7, 0x1489),
+    0x1493: (0x1489, 0x00B7),
+    0x1494: (0x00B7, 0x148B),
+    0x1495: (0x148B, 0x00B7),
+    0x1496: (0x00B7, 0x148C),
+    0x1497: (0x148C, 0x00B7),
+    0x1498: (0x00B7, 0x004A),
+    0x1499: (0x004A, 0x00B7),
+    0x149A: (0x00B7, 0x148E),
+    0x149B: (0x148E, 0x00B7),
+    0x149C: (0x00B7, 0x1490),
+    0x149D: (0x1490, 0x00B7),
+    0x149E: (0x00B7, 0x1491),
+    0x149F: (0x1491, 0x00B7),
+    0x14A5: (0x0393,),
+    0x14AA: (0x004C,),
+    0x14AC: (0x00B7, 0x14A3),
+    0x14AD: (0x14A3, 0x00B7),
+    0x14AE: (0x00B7, 0x0393),
+    0x14AF: (0x0393, 0x00B7),
+    0x14B0: (0x00B7, 0x14A6),
+    0x14B1: (0x14A6, 0x00B7),
+    0x14B2: (0x00B7, 0x14A7),
+    0x14B3: (0x14A7, 0x00B7),
+    0x14B4: (0x00B7, 0x14A8),
+    0x14B5: (0x14A8, 0x00B7),
+    0x14B6: (0x00B7, 0x004C),
+    0x14B7: (0x006C, 0x00B7),
+    0x14B8: (0x00B7, 0x14AB),
+    0x14B9: (0x14AB, 0x00B7),
+    0x14BF: (0x0032,),
+    0x14C9: (0x00B7, 0x14C0),
+    0x14CA: (0x14C0, 0x00B7),
+    0x14CB: (0x00B7, 0x14C7),
+    0x14CC: (0x14C7, 0x00B7),
+    0x14CD: (0x00B7, 0x14C8),
+    0x14CE: (0x14C8, 0x00B7),
+    0x14D1: (0x1421,),
+    0x14DC: (0x00B7, 0x14D3),
+    0x14DD: (0x14D3, 0x00B7),
+    0x14DE: (0x00B7, 0x14D5),
+    0x14DF: (0x14D5, 0x00B7),
+    0x14E0: (0x00B7, 0x14D6),
+    0x14E1: (0x14D6, 0x00B7),
+    0x14E2: (0x00B7, 0x14D7),
+    0x14E3: (0x14D7, 0x00B7),
+    0x14E4: (0x00B7, 0x14D8),
+    0x14E5: (0x14D8, 0x00B7),
+    0x14E6: (0x00B7, 0x14DA),
+    0x14E7: (0x14DA, 0x00B7),
+    0x14E8: (0x00B7, 0x14DB),
+    0x14E9: (0x14DB, 0x00B7),
+    0x14F6: (0x00B7, 0x14ED),
+    0x14F7: (0x14ED, 0x00B7),
+    0x14F8: (0x00B7, 0x14EF),
+    0x14F9: (0x14EF, 0x00B7),
+    0x14FA: (0x00B7, 0x14F0),
+    0x14FB: (0x14F0, 0x00B7),
+    0x14FC: (0x00B7, 0x14F1),
+    0x14FD: (0x14F1, 0x00B7),
+    0x14FE: (0x00B7, 0x14F2),
+    0x14FF: (0x14F2, 0x00B7),
+    0x1500: (0x00B7, 0x14F4),
+    0x1501: (0x14F4, 0x00B7),
+    0x1502: (0x00B7, 0x14F5),
+    0x1503: (0x14F5, 0x00B7),
+    0x150C: (0x150B, 0x003C),
+    0x150D: (0x150B, 0x1455),
+    0x150E: (0x150B, 0x1472),
+    0x150F: (0x150B, 0x1490),
+    0x1517: (0x00B7, 0x1510),
+    0x1518: (0x1510, 0x00B7),
+    0x1519: (0x00B7, 0x1511),
+    0x151A: (0x1511, 0x00B7),
+    0x151B: (0x00B7, 0x1512),
+    0x151C: (0x1512, 0x00B7),
+    0x151D: (0x00B7, 0x1513),
+    0x151E: (0x1513, 0x00B7),
+    0x151F: (0x00B7, 0x1514),
+    0x1520: (0x1514, 0x00B7),
+    0x1521: (0x00B7, 0x1515),
+    0x1522: (0x1515, 0x00B7),
+    0x1523: (0x00B7, 0x1516),
+    0x1524: (0x1516, 0x00B7),
+    0x152F: (0x00B7, 0x0034),
+    0x1530: (0x0034, 0x00B7),
+    0x1531: (0x00B7, 0x1528),
+    0x1532: (0x1528, 0x00B7),
+    0x1533: (0x00B7, 0x1529),
+    0x1534: (0x1529, 0x00B7),
+    0x1535: (0x00B7, 0x152A),
+    0x1536: (0x152A, 0x00B7),
+    0x1537: (0x00B7, 0x152B),
+    0x1538: (0x152B, 0x00B7),
+    0x1539: (0x00B7, 0x152D),
+    0x153A: (0x152D, 0x00B7),
+    0x153B: (0x00B7, 0x152E),
+    0x153C: (0x152E, 0x00B7),
+    0x1540: (0x1429,),
+    0x1541: (0x0078,),
+    0x154E: (0x00B7, 0x154C),
+    0x154F: (0x154C, 0x00B7),
+    0x155B: (0x00B7, 0x155A),
+    0x155C: (0x155A, 0x00B7),
+    0x1568: (0x00B7, 0x1567),
+    0x1569: (0x1567, 0x00B7),
+    0x1577: (0x1E9F,),
+    0x157C: (0x0048,),
+    0x157D: (0x0078,),
+    0x157E: (0x1550, 0x146C),
+    0x157F: (0x1550, 0x0050),
+    0x1580: (0x1550, 0x146E),
+    0x1581: (0x1550, 0x0064),
+    0x1582: (0x1550, 0x1470),
+    0x1583: (0x1550, 0x1472),
+    0x1584: (0x1550, 0x1473),
+    0x1585: (0x1550, 0x1483),
+    0x1587: (0x0052,),
+    0x158E: (0x1595, 0x148A),
+    0x158F: (0x1595, 0x148B),
+    0x1590: (0x1595, 0x148C),
+    0x1591: (0x1595, 0x004A),
+    0x1592: (0x1595, 0x148E),
+    0x1593: (0x1595, 0x1490),
+    0x1594: (0x1595, 0x1491),
+    0x15AF: (0x0062,),
+    0x15B4: (0x0046,),
+    0x15B5: (0x2132,),
+    0x15B7: (0xA7FB,),
+    0x15C4: (0x2C6F,),
+    0x15C5: (0x0041,),
+    0x15DE: (0x0044,),
+    0x15EA: (0x0044,),
+    0x15EF: (0x0460,),
+    0x15F0: (0x004D,),
+    0x15F7: (0x0042,),
+    0x1602: (0x1490,),
+    0x1603: (0x1489,),
+    0x1604: (0x14D3,),
+    0x1607: (0x14DA,),
+    0x1622: (0x1543,),
+    0x1623: (0x1546,),
+    0x1624: (0x154A,),
+    0x162E: (0x01B1,),
+    0x162F: (0x03A9,),
+    0x1634: (0x01B1,),
+    0x1635: (0x03A9,),
+    0x166D: (0x0058,),
+    0x166E: (0x0078,),
+    0x166F: (0x1550, 0x146B),
+    0x1670: (0x1595, 0x1489),
+    0x1671: (0x1596, 0x148B),
+    0x1672: (0x1596, 0x148C),
+    0x1673: (0x1596, 0x004A),
+    0x1674: (0x1596, 0x148E),
+    0x1675: (0x1596, 0x1490),
+    0x1676: (0x1596, 0x1491),
+    0x1677: (0x15A7, 0x00B7),
+    0x1678: (0x15A8, 0x00B7),
+    0x1679: (0x15A9, 0x00B7),
+    0x167A: (0x15AA, 0x00B7),
+    0x167B: (0x15AB, 0x00B7),
+    0x167C: (0x15AC, 0x00B7),
+    0x167D: (0x15AD, 0x00B7),
+    0x1680: (0x0020,),
+    0x16B2: (0x003C,),
+    0x16B7: (0x0058,),
+    0x16C1: (0x006C,),
+    0x16C2: (0x16BD,),
+    0x16CC: (0x0027,),
+    0x16D5: (0x004B,),
+    0x16D6: (0x004D,),
+    0x16D8: (0x03A8,),
+    0x16E1: (0x16BC,),
+    0x16EB: (0x00B7,),
+    0x16EC: (0x003A,),
+    0x16ED: (0x002B,),
+    0x16F0: (0x03A6,),
+    0x1735: (0x002F,),
+    0x17A3: (0x17A2,),
+    0x17B7: (0x0E34,),
+    0x17B8: (0x0E35,),
+    0x17B9: (0x0E36,),
+    0x17BA: (0x0E37,),
+    0x17C6: (0x030A,),
+    0x17CB: (0x0E48,),
+    0x17D3: (0x030A,),
+    0x17D4: (0x0E2F,),
+    0x17D5: (0x0E5A,),
+    0x17D9: (0x0E4F,),
+    0x17DA: (0x0E5B,),
+    0x1803: (0x003A,),
+    0x1809: (0x003A,),
+    0x1855: (0x1835,),
+    0x1896: (0x185C,),
+    0x18B3: (0x00B7, 0x18B1),
+    0x18B6: (0x00B7, 0x18B4),
+    0x18B9: (0x00B7, 0x18B8),
+    0x18C2: (0x00B7, 0x18C0),
+    0x18E0: (0x1543, 0x00B7),
+    0x18E3: (0x155E, 0x00B7),
+    0x18E4: (0x1566, 0x00B7),
+    0x18E5: (0x156B, 0x00B7),
+    0x18E8: (0x1586, 0x00B7),
+    0x18EA: (0x1597, 0x00B7),
+    0x18ED: (0x0460, 0x00B7),
+    0x18F0: (0x15F4, 0x00B7),
+    0x18F2: (0x161B, 0x00B7),
+    0x19D0: (0x199E,),
+    0x19D1: (0x19B1,),
+    0x1A80: (0x1A45,),
+    0x1A90: (0x1A45,),
+    0x1AA9: (0x1AA8, 0x1AA8),
+    0x1AAB: (0x1AAA, 0x1AA8),
+    0x1AB4: (0x06DB,),
+    0x1AB7: (0x0328,),
+    0x1B52: (0x1B0D,),
+    0x1B53: (0x1B11,),
+    0x1B58: (0x1B28,),
+    0x1B5C: (0x1B50,),
+    0x1B5F: (0x1B5E, 0x1B5E),
+    0x1C3C: (0x1C3B, 0x1C3B),
+    0x1C7F: (0x1C7E, 0x1C7E),
+    0x1CD0: (0x0302,),
+    0x1CD2: (0x0304,),
+    0x1CD3: (0x0027, 0x0027),
+    0x1CD5: (0x032B,),
+    0x1CD8: (0x032E,),
+    0x1CD9: (0x032D,),
+    0x1CDA: (0x030E,),
+    0x1CDC: (0x0329,),
+    0x1CDD: (0x0323,),
+    0x1CDE: (0x0324,),
+    0x1CED: (0x0316,),
+    0x1D00: (0x0041,),
+    0x1D04: (0x0063,),
+    0x1D08: (0x025C,),
+    0x1D0B: (0x006B,),
+    0x1D0D: (0x0072, 0x006E),
+    0x1D0F: (0x006F,),
+    0x1D10: (0x0254,),
+    0x1D11: (0x006F,),
+    0x1D14: (0x01DD, 0x006F),
+    0x1D1B: (0x0074,),
+    0x1D1C: (0x0075,),
+    0x1D20: (0x0076,),
+    0x1D21: (0x0076, 0x0076),
+    0x1D22: (0x007A,),
+    0x1D24: (0x01A8,),
+    0x1D26: (0x0072,),
+    0x1D27: (0x028C,),
+    0x1D28: (0x006E,),
+    0x1D29: (0x1D18,),
+    0x1D2B: (0x043B,),
+    0x1D52: (0x00BA,),
+    0x1D6B: (0x0075, 0x0065),
+    0x1D6E: (0x0066, 0x0334),
+    0x1D6F: (0x0072, 0x006E, 0x0334),
+    0x1D70: (0x006E, 0x0334),
+    0x1D72: (0x0072, 0x0334),
+    0x1D73: (0x027E, 0x0334),
+    0x1D74: (0x0073, 0x0334),
+    0x1D75: (0x0074, 0x0334),
+    0x1D76: (0x007A, 0x0334),
+    0x1D78: (0x1D34,),
+    0x1D7B: (0x0069, 0x0335),
+    0x1D7C: (0x0069, 0x0335),
+    0x1D7D: (0x0070, 0x0335),
+    0x1D7E: (0x0075, 0x0335),
+    0x1D7F: (0x028A, 0x0335),
+    0x1D83: (0x0067,),
+    0x1D8C: (0x0079,),
+    0x1D90: (0x024B,),
+    0x1D9F: (0x1D4B,),
+    0x1DA2: (0x1D4D,),
+    0x1DBB: (0x1646,),
+    0x1E9A: (0x1EA3,),
+    0x1E9D: (0x0066,),
+    0x1EFF: (0x0079,),
+    0x1F7D: (0x1FF4,),
+    0x1FBD: (0x0027,),
+    0x1FBE: (0x0069,),
+    0x1FBF: (0x0027,),
+    0x1FC0: (0x007E,),
+    0x1FEF: (0x0027,),
+    0x1FF6: (0x13EF,),
+    0x1FFD: (0x0027,),
+    0x1FFE: (0x0027,),
+    0x2000: (0x0020,),
+    0x2001: (0x0020,),
+    0x2002: (0x0020,),
+    0x2003: (0x0020,),
+    0x2004: (0x0020,),
+    0x2005: (0x0020,),
+    0x2006: (0x0020,),
+    0x2007: (0x0020,),
+    0x2008: (0x0020,),
+    0x2009: (0x0020,),
+    0x200A: (0x0020,),
+    0x2010: (0x002D,),
+    0x2011: (0x002D,),
+    0x2012: (0x002D,),
+    0x2013: (0x002D,),
+    0x2014: (0x30FC,),
+    0x2015: (0x30FC,),
+    0x2016: (0x006C, 0x006C),
+    0x2018: (0x0027,),
+    0x2019: (0x0027,),
+    0x201A: (0x002C,),
+    0x201B: (0x0027,),
+    0x201C: (0x0027, 0x0027),
+    0x201D: (0x0027, 0x0027),
+    0x201F: (0x0027, 0x0027),
+    0x2022: (0x00B7,),
+    0x2024: (0x002E,),
+    0x2025: (0x002E, 0x002E),
+    0x2026: (0x002E, 0x002E, 0x002E),
+    0x2027: (0x00B7,),
+    0x2028: (0x0020,),
+    0x2029: (0x0020,),
+    0x202F: (0x0020,),
+    0x2030: (0x00BA, 0x002F, 0x2080, 0x2080),
+    0x2031: (0x00BA, 0x002F, 0x2080, 0x2080, 0x2080),
+    0x2032: (0x0027,),
+    0x2033: (0x0027, 0x0027),
+    0x2034: (0x0027, 0x0027, 0x0027),
+    0x2035: (0x0027,),
+    0x2036: (0x0027, 0x0027),
+    0x2037: (0x0027, 0x0027, 0x0027),
+    0x2039: (0x003C,),
+    0x203A: (0x003E,),
+    0x203C: (0x0021, 0x0021),
+    0x203E: (0x02C9,),
+    0x2041: (0x002F,),
+    0x2043: (0x002D,),
+    0x2044: (0x002F,),
+    0x2047: (0x003F, 0x003F),
+    0x2048: (0x003F, 0x0021),
+    0x2049: (0x0021, 0x003F),
+    0x204E: (0x002A,),
+    0x2052: (0x00BA, 0x002F, 0x2080),
+    0x2053: (0x007E,),
+    0x2057: (0x0027, 0x0027, 0x0027, 0x0027),
+    0x205A: (0x003A,),
+    0x205D: (0x2D57,),
+    0x205E: (0x2D42,),
+    0x205F: (0x0020,),
+    0x2070: (0x00BA,),
+    0x2079: (0xA770,),
+    0x20A1: (0x0043, 0x20EB),
+    0x20A4: (0x00A3,),
+    0x20A5: (0x0072, 0x006E, 0x0338),
+    0x20A8: (0x0052, 0x0073),
+    0x20A9: (0x0057, 0x0335),
+    0x20AB: (0x0064, 0x0335, 0x0331),
+    0x20AC: (0xA792,),
+    0x20AD: (0x004B, 0x0335),
+    0x20AE: (0x0054, 0x20EB),
+    0x20B6: (0x006C, 0x0074),
+    0x20BD: (0x0554,),
+    0x20DB: (0x06DB,),
+    0x2100: (0x0061, 0x002F, 0x0063),
+    0x2101: (0x0061, 0x002F, 0x0073),
+    0x2102: (0x0043,),
+    0x2103: (0x00B0, 0x0043),
+    0x2105: (0x0063, 0x002F, 0x006F),
+    0x2106: (0x0063, 0x002F, 0x0075),
+    0x2107: (0x0190,),
+    0x2108: (0x042D,),
+    0x2109: (0x00B0, 0x0046),
+    0x210A: (0x0067,),
+    0x210B: (0x0048,),
+    0x210C: (0x0048,),
+    0x210D: (0x0048,),
+    0x210E: (0x0068,),
+    0x210F: (0x0068, 0x0335),
+    0x2110: (0x006C,),
+    0x2111: (0x006C,),
+    0x2112: (0x004C,),
+    0x2113: (0x006C,),
+    0x2115: (0x004E,),
+    0x2116: (0x004E, 0x006F),
+    0x2119: (0x0050,),
+    0x211A: (0x0051,),
+    0x211B: (0x0052,),
+    0x211C: (0x0052,),
+    0x211D: (0x0052,),
+    0x2121: (0x0054, 0x0045, 0x004C),
+    0x2124: (0x005A,),
+    0x2126: (0x03A9,),
+    0x2127: (0x01B1,),
+    0x2128: (0x005A,),
+    0x2129: (0x027F,),
+    0x212A: (0x004B,),
+    0x212C: (0x0042,),
+    0x212D: (0x0043,),
+    0x212E: (0x0065,),
+    0x212F: (0x0065,),
+    0x2130: (0x0045,),
+    0x2131: (0x0046,),
+    0x2133: (0x004D,),
+    0x2134: (0x006F,),
+    0x2135: (0x05D0,),
+    0x2136: (0x05D1,),
+    0x2137: (0x05D2,),
+    0x2138: (0x05D3,),
+    0x2139: (0x0069,),
+    0x213B: (0x0046, 0x0041, 0x0058),
+    0x213C: (0x006E,),
+    0x213D: (0x0079,),
+    0x213E: (0x0393,),
+    0x213F: (0x03A0,),
+    0x2140: (0x01A9,),
+    0x2141: (0xA4E8,),
+    0x2142: (0xA4F6,),
+    0x2145: (0x0044,),
+    0x2146: (0x0064,),
+    0x2147: (0x0065,),
+    0x2148: (0x0069,),
+    0x2149: (0x006A,),
+    0x2160: (0x006C,),
+    0x2161: (0x006C, 0x006C),
+    0x2162: (0x006C, 0x006C, 0x006C),
+    0x2163: (0x006C, 0x0056),
+    0x2164: (0x0056,),
+    0x2165: (0x0056, 0x006C),
+    0x2166: (0x0056, 0x006C, 0x006C),
+    0x2167: (0x0056, 0x006C, 0x006C, 0x006C),
+    0x2168: (0x006C, 0x0058),
+    0x2169: (0x0058,),
+    0x216A: (0x0058, 0x006C),
+    0x216B: (0x0058, 0x006C, 0x006C),
+    0x216C: (0x004C,),
+    0x216D: (0x0043,),
+    0x216E: (0x0044,),
+    0x216F: (0x004D,),
+    0x2170: (0x0069,),
+    0x2171: (0x0069, 0x0069),
+    0x2172: (0x0069, 0x0069, 0x0069),
+    0x2173: (0x0069, 0x0076),
+    0x2174: (0x0076,),
+    0x2175: (0x0076, 0x0069),
+    0x2176: (0x0076, 0x0069, 0x0069),
+    0x2177: (0x0076, 0x0069, 0x0069, 0x0069),
+    0x2178: (0x0069, 0x0078),
+    0x2179: (0x0078,),
+    0x217A: (0x0078, 0x0069),
+    0x217B: (0x0078, 0x0069, 0x0069),
+    0x217C: (0x006C,),
+    0x217D: (0x0063,),
+    0x217E: (0x0064,),
+    0x217F: (0x0072, 0x006E),
+    0x2183: (0x0186,),
+    0x2184: (0x0254,),
+    0x2191: (0x16CF,),
+    0x2195: (0x16E8,),
+    0x21B5: (0x21B2,),
+    0x21BE: (0x16DA,),
+    0x21BF: (0x16D0,),
+    0x2200: (0x2C6F,),
+    0x2203: (0x018E,),
+    0x2206: (0x0394,),
+    0x220F: (0x03A0,),
+    0x2211: (0x01A9,),
+    0x2212: (0x002D,),
+    0x2214: (0x002B, 0x0307),
+    0x2215: (0x002F,),
+    0x2216: (0x005C,),
+    0x2217: (0x002A,),
+    0x2218: (0x00B0,),
+    0x2219: (0x00B7,),
+    0x221E: (0x006F, 0x006F),
+    0x2223: (0x006C,),
+    0x2225: (0x006C, 0x006C),
+    0x2228: (0x0076,),
+    0x2229: (0x0548,),
+    0x222A: (0x0055,),
+    0x222B: (0x0283,),
+    0x222C: (0x0283, 0x0283),
+    0x222D: (0x0283, 0x0283, 0x0283),
+    0x222F: (0x222E, 0x222E),
+    0x2230: (0x222E, 0x222E, 0x222E),
+    0x2236: (0x003A,),
+    0x2238: (0x002D, 0x0307),
+    0x223C: (0x007E,),
+    0x2250: (0x003D, 0x0307),
+    0x2251: (0x003D, 0x0307, 0x0323),
+    0x2257: (0x003D, 0x030A),
+    0x2259: (0x003D, 0x0302),
+    0x225A: (0x003D, 0x0306),
+    0x225E: (0x003D, 0x036B),
+    0x2263: (0x2261,),
+    0x226A: (0x003C, 0x003C),
+    0x226B: (0x003E, 0x003E),
+    0x2282: (0x1455,),
+    0x2283: (0x1450,),
+    0x2295: (0x102A8,),
+    0x2296: (0x004F, 0x0335),
+    0x2299: (0x0298,),
+    0x229D: (0x004F, 0x0335),
+    0x22A4: (0x0054,),
+    0x22A5: (0xA4D5,),
+    0x22C0: (0x2227,),
+    0x22C1: (0x0076,),
+    0x22C2: (0x0548,),
+    0x22C3: (0x0055,),
+    0x22C4: (0x16DC,),
+    0x22C5: (0x00B7,),
+    0x22C8: (0x16DE,),
+    0x22D6: (0x003C, 0x00B7),
+    0x22D7: (0x00B7, 0x003E),
+    0x22D8: (0x003C, 0x003C, 0x003C),
+    0x22D9: (0x003E, 0x003E, 0x003E),
+    0x22EE: (0x2D57,),
+    0x22EF: (0x00B7, 0x00B7, 0x00B7),
+    0x22F4: (0xA793,),
+    0x22FF: (0x0045,),
+    0x2300: (0x2205,),
+    0x2325: (0x2324,),
+    0x2329: (0x276C,),
+    0x232A: (0x276D,),
+    0x2341: (0x303C,),
+    0x2359: (0x0394, 0x0332),
+    0x235A: (0x16DC, 0x0332),
+    0x235C: (0x00B0, 0x0332),
+    0x235F: (0x229B,),
+    0x2361: (0x0054, 0x0308),
+    0x2362: (0x2207, 0x0308),
+    0x2363: (0x22C6, 0x0308),
+    0x2364: (0x00B0, 0x0308),
+    0x2368: (0x007E, 0x0308),
+    0x2369: (0x1435,),
+    0x236B: (0x2207, 0x0334),
+    0x236C: (0x004F, 0x0335),
+    0x2373: (0x0069,),
+    0x2374: (0x0070,),
+    0x2375: (0x03C9,),
+    0x2376: (0x0061, 0x0332),
+    0x2377: (0xA793, 0x0332),
+    0x2378: (0x0069, 0x0332),
+    0x2379: (0x03C9, 0x0332),
+    0x237A: (0x0061,),
+    0x237F: (0x16BD,),
+    0x239C: (0x4E28,),
+    0x239F: (0x4E28,),
+    0x23A2: (0x4E28,),
+    0x23A5: (0x4E28,),
+    0x23AA: (0x4E28,),
+    0x23AE: (0x4E28,),
+    0x23C1: (0x2355,),
+    0x23C2: (0x234E,),
+    0x23C3: (0x234B,),
+    0x23C6: (0x236D,),
+    0x23E8: (0x2081, 0x2080),
+    0x23FC: (0x23FB,),
+    0x23FD: (0x006C,),
+    0x23FE: (0x263E,),
+    0x244A: (0x005C, 0x005C),
+    0x2460: (0x2780,),
+    0x2461: (0x2781,),
+    0x2462: (0x2782,),
+    0x2463: (0x2783,),
+    0x2464: (0x2784,),
+    0x2465: (0x2785,),
+    0x2466: (0x2786,),
+    0x2467: (0x2787,),
+    0x2468: (0x2788,),
+    0x2469: (0x2789,),
+    0x2474: (0x0028, 0x006C, 0x0029),
+    0x2475: (0x0028, 0x0032, 0x0029),
+    0x2476: (0x0028, 0x0033, 0x0029),
+    0x2477: (0x0028, 0x0034, 0x0029),
+    0x2478: (0x0028, 0x0035, 0x0029),
+    0x2479: (0x0028, 0x0036, 0x0029),
+    0x247A: (0x0028, 0x0037, 0x0029),
+    0x247B: (0x0028, 0x0038, 0x0029),
+    0x247C: (0x0028, 0x0039, 0x0029),
+    0x247D: (0x0028, 0x006C, 0x004F, 0x0029),
+    0x247E: (0x0028, 0x006C, 0x006C, 0x0029),
+    0x247F: (0x0028, 0x006C, 0x0032, 0x0029),
+    0x2480: (0x0028, 0x006C, 0x0033, 0x0029),
+    0x2481: (0x0028, 0x006C, 0x0034, 0x0029),
+    0x2482: (0x0028, 0x006C, 0x0035, 0x0029),
+    0x2483: (0x0028, 0x006C, 0x0036, 0x0029),
+    0x2484: (0x0028, 0x006C, 0x0037, 0x0029),
+    0x2485: (0x0028, 0x006C, 0x0038, 0x0029),
+    0x2486: (0x0028, 0x006C, 0x0039, 0x0029),
+    0x2487: (0x0028, 0x0032, 0x004F, 0x0029),
+    0x2488: (0x006C, 0x002E),
+    0x2489: (0x0032, 0x002E),
+    0x248A: (0x0033, 0x002E),
+    0x248B: (0x0034, 0x002E),
+    0x248C: (0x0035, 0x002E),
+    0x248D: (0x0036, 0x002E),
+    0x248E: (0x0037, 0x002E),
+    0x248F: (0x0038, 0x002E),
+    0x2490: (0x0039, 0x002E),
+    0x2491: (0x006C, 0x004F, 0x002E),
+    0x2492: (0x006C, 0x006C, 0x002E),
+    0x2493: (0x006C, 0x0032, 0x002E),
+    0x2494: (0x006C, 0x0033, 0x002E),
+    0x2495: (0x006C, 0x0034, 0x002E),
+    0x2496: (0x006C, 0x0035, 0x002E),
+    0x2497: (0x006C, 0x0036, 0x002E),
+    0x2498: (0x006C, 0x0037, 0x002E),
+    0x2499: (0x006C, 0x0038, 0x002E),
+    0x249A: (0x006C, 0x0039, 0x002E),
+    0x249B: (0x0032, 0x004F, 0x002E),
+    0x249C: (0x0028, 0x0061, 0x0029),
+    0x249D: (0x0028, 0x0062, 0x0029),
+    0x249E: (0x0028, 0x0063, 0x0029),
+    0x249F: (0x0028, 0x0064, 0x0029),
+    0x24A0: (0x0028, 0x0065, 0x0029),
+    0x24A1: (0x0028, 0x0066, 0x0029),
+    0x24A2: (0x0028, 0x0067, 0x0029),
+    0x24A3: (0x0028, 0x0068, 0x0029),
+    0x24A4: (0x0028, 0x0069, 0x0029),
+    0x24A5: (0x0028, 0x006A, 0x0029),
+    0x24A6: (0x0028, 0x006B, 0x0029),
+    0x24A7: (0x0028, 0x006C, 0x0029),
+    0x24A8: (0x0028, 0x0072, 0x006E, 0x0029),
+    0x24A9: (0x0028, 0x006E, 0x0029),
+    0x24AA: (0x0028, 0x006F, 0x0029),
+    0x24AB: (0x0028, 0x0070, 0x0029),
+    0x24AC: (0x0028, 0x0071, 0x0029),
+    0x24AD: (0x0028, 0x0072, 0x0029),
+    0x24AE: (0x0028, 0x0073, 0x0029),
+    0x24AF: (0x0028, 0x0074, 0x0029),
+    0x24B0: (0x0028, 0x0075, 0x0029),
+    0x24B1: (0x0028, 0x0076, 0x0029),
+    0x24B2: (0x0028, 0x0076, 0x0076, 0x0029),
+    0x24B3: (0x0028, 0x0078, 0x0029),
+    0x24B4: (0x0028, 0x0079, 0x0029),
+    0x24B5: (0x0028, 0x007A, 0x0029),
+    0x24B8: (0x00A9,),
+    0x24C5: (0x2117,),
+    0x24C7: (0x00AE,),
+    0x24DB: (0x24BE,),
+    0x2500: (0x30FC,),
+    0x2501: (0x30FC,),
+    0x2503: (0x2502,),
+    0x250F: (0x250C,),
+    0x2523: (0x251C,),
+    0x2571: (0x002F,),
+    0x2573: (0x0058,),
+    0x2588: (0x220E,),
+    0x2590: (0x258C,),
+    0x2594: (0x02C9,),
+    0x2597: (0x2596,),
+    0x259D: (0x2598,),
+    0x25A0: (0x220E,),
+    0x25B1: (0x23E5,),
+    0x25B3: (0x0394,),
+    0x25B7: (0x22B3,),
+    0x25B8: (0x25B6,),
+    0x25BA: (0x25B6,),
+    0x25BD: (0x102BC,),
+    0x25C1: (0x22B2,),
+    0x25C7: (0x16DC,),
+    0x25CA: (0x16DC,),
+    0x25CB: (0x00B0,),
+    0x25CE: (0x233E,),
+    0x25E0: (0x2312,),
+    0x25E6: (0x00B0,),
+    0x2609: (0x0298,),
+    0x2610: (0x25A1,),
+    0x2625: (0x1099E,),
+    0x2630: (0x2CB6,),
+    0x2638: (0x2388,),
+    0x264E: (0x224F,),
+    0x2662: (0x16DC,),
+    0x2669: (0x1D158, 0x1D165),
+    0x266A: (0x1D158, 0x1D165, 0x1D16E),
+    0x26AC: (0x0970,),
+    0x2768: (0x0028,),
+    0x2769: (0x0029,),
+    0x276E: (0x003C,),
+    0x276F: (0x003E,),
+    0x2772: (0x0028,),
+    0x2773: (0x0029,),
+    0x2774: (0x007B,),
+    0x2775: (0x007D,),
+    0x2795: (0x002B,),
+    0x2796: (0x002D,),
+    0x2797: (0x00F7,),
+    0x27C2: (0xA4D5,),
+    0x27C8: (0x005C, 0x1455),
+    0x27C9: (0x1450, 0x002F),
+    0x27CB: (0x002F,),
+    0x27CD: (0x005C,),
+    0x27D9: (0x0054,),
+    0x27E8: (0x276C,),
+    0x27E9: (0x276D,),
+    0x292B: (0x0078,),
+    0x292C: (0x0078,),
+    0x2963: (0x16D0, 0x16DA),
+    0x2965: (0x21C3, 0x21C2),
+    0x296E: (0x16D0, 0x21C2),
+    0x296F: (0x21C3, 0x16DA),
+    0x2999: (0x2D42,),
+    0x29B0: (0x2349,),
+    0x29BE: (0x233E,),
+    0x29C4: (0x303C,),
+    0x29C5: (0x2342,),
+    0x29C7: (0x233B,),
+    0x29D6: (0x102C0,),
+    0x29D9: (0x299A,),
+    0x29F4: (0x003A, 0x2192),
+    0x29F5: (0x005C,),
+    0x29F6: (0x002F, 0x0304),
+    0x29F8: (0x002F,),
+    0x29F9: (0x005C,),
+    0x2A00: (0x0298,),
+    0x2A01: (0x102A8,),
+    0x2A02: (0x2297,),
+    0x2A03: (0x228D,),
+    0x2A04: (0x228E,),
+    0x2A05: (0x2293,),
+    0x2A06: (0x2294,),
+    0x2A0C: (0x0283, 0x0283, 0x0283, 0x0283),
+    0x2A1D: (0x16DE,),
+    0x2A20: (0x003E, 0x003E),
+    0x2A21: (0x16DA,),
+    0x2A22: (0x002B, 0x030A),
+    0x2A23: (0x002B, 0x0302),
+    0x2A24: (0x002B, 0x0303),
+    0x2A25: (0x002B, 0x0323),
+    0x2A26: (0x002B, 0x0330),
+    0x2A27: (0x002B, 0x2082),
+    0x2A29: (0x002D, 0x0313),
+    0x2A2A: (0x002D, 0x0323),
+    0x2A2F: (0x0078,),
+    0x2A30: (0x0078, 0x0307),
+    0x2A3D: (0x2319,),
+    0x2A3E: (0x2A1F,),
+    0x2A3F: (0x2210,),
+    0x2A6A: (0x007E, 0x0307),
+    0x2A6E: (0x003D, 0x20F0),
+    0x2A74: (0x003A, 0x003A, 0x003D),
+    0x2A75: (0x003D, 0x003D),
+    0x2A76: (0x003D, 0x003D, 0x003D),
+    0x2AA5: (0x003E, 0x003C),
+    0x2AAA: (0x15D5,),
+    0x2AAB: (0x15D2,),
+    0x2AD7: (0x1450, 0x1455),
+    0x2AFB: (0x002F, 0x002F, 0x002F),
+    0x2AFD: (0x002F, 0x002F),
+    0x2BEC: (0x219E,),
+    0x2BED: (0x219F,),
+    0x2BEE: (0x21A0,),
+    0x2BEF: (0x21A1,),
+    0x2C67: (0x0048, 0x0329),
+    0x2C69: (0x004B, 0x0329),
+    0x2C84: (0x0393,),
+    0x2C85: (0x0072,),
+    0x2C86: (0x0394,),
+    0x2C88: (0xA792,),
+    0x2C89: (0xA793,),
+    0x2C8E: (0x0048,),
+    0x2C92: (0x006C,),
+    0x2C94: (0x004B,),
+    0x2C95: (0x006B,),
+    0x2C96: (0x03BB,),
+    0x2C98: (0x004D,),
+    0x2C9A: (0x004E,),
+    0x2C9E: (0x004F,),
+    0x2C9F: (0x006F,),
+    0x2CA0: (0x03A0,),
+    0x2CA2: (0x0050,),
+    0x2CA3: (0x0070,),
+    0x2CA4: (0x0043,),
+    0x2CA5: (0x0063,),
+    0x2CA6: (0x0054,),
+    0x2CA8: (0x0059,),
+    0x2CAA: (0x03A6,),
+    0x2CAB: (0x0278,),
+    0x2CAC: (0x0058,),
+    0x2CAD: (0x03C7,),
+    0x2CAE: (0x03A8,),
+    0x2CB1: (0x03C9,),
+    0x2CB4: (0x003C, 0x00B7),
+    0x2CBA: (0x002D,),
+    0x2CBC: (0x0428,),
+    0x2CBD: (0x0448,),
+    0x2CC6: (0x002F,),
+    0x2CCA: (0x0039,),
+    0x2CCC: (0x0033,),
+    0x2CCD: (0x021D,),
+    0x2CD0: (0x004C,),
+    0x2CD1: (0x029F,),
+    0x2CD2: (0x0036,),
+    0x2CDC: (0x03EC,),
+    0x2CE4: (0x03D7,),
+    0x2CE9: (0x2627,),
+    0x2CF9: (0x005C, 0x005C),
+    0x2D31: (0x004F, 0x0335),
+    0x2D37: (0x0245,),
+    0x2D38: (0x0056,),
+    0x2D39: (0x0045,),
+    0x2D3A: (0x018E,),
+    0x2D41: (0x004F, 0x0338),
+    0x2D48: (0x00B7, 0x00B7, 0x00B7),
+    0x2D49: (0x01A9,),
+    0x2D4F: (0x006C,),
+    0x2D51: (0x0021,),
+    0x2D54: (0x004F,),
+    0x2D55: (0x0051,),
+    0x2D59: (0x0298,),
+    0x2D5D: (0x0058,),
+    0x2D60: (0x0394,),
+    0x2D63: (0x16EF,),
+    0x2DE8: (0x1DDF,),
+    0x2E1A: (0x002D, 0x0308),
+    0x2E1E: (0x007E, 0x0307),
+    0x2E1F: (0x007E, 0x0323),
+    0x2E26: (0x1455,),
+    0x2E27: (0x1450,),
+    0x2E28: (0x0028, 0x0028),
+    0x2E29: (0x0029, 0x0029),
+    0x2E2A: (0x2235,),
+    0x2E2B: (0x2234,),
+    0x2E2C: (0x2237,),
+    0x2E2E: (0x061F,),
+    0x2E30: (0x00B0,),
+    0x2E31: (0x00B7,),
+    0x2E32: (0x060C,),
+    0x2E35: (0x061B,),
+    0x2E39: (0x1E9F,),
+    0x2E3D: (0x2D42,),
+    0x2E3F: (0x00B6,),
+    0x2E40: (0x003D,),
+    0x2E82: (0x4E5B,),
+    0x2E83: (0x4E5A,),
+    0x2E85: (0x4EBB,),
+    0x2E89: (0x5202,),
+    0x2E8B: (0x353E,),
+    0x2E8E: (0x5140,),
+    0x2E8F: (0x5C23,),
+    0x2E90: (0x5C22,),
+    0x2E92: (0x5DF3,),
+    0x2E93: (0x5E7A,),
+    0x2E94: (0x5F51,),
+    0x2E96: (0x5FC4,),
+    0x2E97: (0x38FA,),
+    0x2E98: (0x624C,),
+    0x2E99: (0x6535,),
+    0x2E9B: (0x65E1,),
+    0x2E9E: (0x6B7A,),
+    0x2E9F: (0x6BCD,),
+    0x2EA0: (0x6C11,),
+    0x2EA1: (0x6C35,),
+    0x2EA2: (0x6C3A,),
+    0x2EA3: (0x706C,),
+    0x2EA4: (0x722B,),
+    0x2EA6: (0x4E2C,),
+    0x2EA8: (0x72AD,),
+    0x2EAB: (0x7F52,),
+    0x2EAD: (0x793B,),
+    0x2EAF: (0x7CF9,),
+    0x2EB1: (0x7F53,),
+    0x2EB2: (0x7F52,),
+    0x2EB9: (0x8002,),
+    0x2EBA: (0x8080,),
+    0x2EBE: (0x8279,),
+    0x2EBF: (0x8279,),
+    0x2EC0: (0x8279,),
+    0x2EC1: (0x864E,),
+    0x2EC2: (0x8864,),
+    0x2EC3: (0x8980,),
+    0x2EC4: (0x897F,),
+    0x2EC5: (0x89C1,),
+    0x2EC8: (0x8BA0,),
+    0x2EC9: (0x8D1D,),
+    0x2ECB: (0x8F66,),
+    0x2ECC: (0x8FB6,),
+    0x2ECD: (0x8FB6,),
+    0x2ECF: (0x961D,),
+    0x2ED0: (0x9485,),
+    0x2ED1: (0x9577,),
+    0x2ED2: (0x9578,),
+    0x2ED3: (0x957F,),
+    0x2ED4: (0x95E8,),
+    0x2ED6: (0x961D,),
+    0x2ED8: (0x9752,),
+    0x2ED9: (0x97E6,),
+    0x2EDA: (0x9875,),
+    0x2EDB: (0x98CE,),
+    0x2EDC: (0x98DE,),
+    0x2EDD: (0x98DF,),
+    0x2EDF: (0x98E0,),
+    0x2EE0: (0x9963,),
+    0x2EE2: (0x9A6C,),
+    0x2EE4: (0x9B3C,),
+    0x2EE5: (0x9C7C,),
+    0x2EE8: (0x9EA6,),
+    0x2EE9: (0x9EC4,),
+    0x2EEB: (0x6589,),
+    0x2EEC: (0x9F50,),
+    0x2EED: (0x6B6F,),
+    0x2EEE: (0x9F7F,),
+    0x2EEF: (0x7ADC,),
+    0x2EF0: (0x9F99,),
+    0x2EF2: (0x4E80,),
+    0x2EF3: (0x9F9F,),
+    0x2F00: (0x30FC,),
+    0x2F01: (0x4E28,),
+    0x2F02: (0x005C,),
+    0x2F03: (0x002F,),
+    0x2F04: (0x4E59,),
+    0x2F05: (0x4E85,),
+    0x2F06: (0x4E8C,),
+    0x2F07: (0x4EA0,),
+    0x2F08: (0x4EBA,),
+    0x2F09: (0x513F,),
+    0x2F0A: (0x5165,),
+    0x2F0B: (0x516B,),
+    0x2F0C: (0x5182,),
+    0x2F0D: (0x5196,),
+    0x2F0E: (0x51AB,),
+    0x2F0F: (0x51E0,),
+    0x2F10: (0x51F5,),
+    0x2F11: (0x5200,),
+    0x2F12: (0x529B,),
+    0x2F13: (0x52F9,),
+    0x2F14: (0x5315,),
+    0x2F15: (0x531A,),
+    0x2F16: (0x5338,),
+    0x2F17: (0x5341,),
+    0x2F18: (0x535C,),
+    0x2F19: (0x5369,),
+    0x2F1A: (0x5382,),
+    0x2F1B: (0x53B6,),
+    0x2F1C: (0x53C8,),
+    0x2F1D: (0x53E3,),
+    0x2F1E: (0x53E3,),
+    0x2F1F: (0x571F,),
+    0x2F20: (0x571F,),
+    0x2F21: (0x5902,),
+    0x2F22: (0x590A,),
+    0x2F23: (0x5915,),
+    0x2F24: (0x5927,),
+    0x2F25: (0x5973,),
+    0x2F26: (0x5B50,),
+    0x2F27: (0x5B80,),
+    0x2F28: (0x5BF8,),
+    0x2F29: (0x5C0F,),
+    0x2F2A: (0x5C22,),
+    0x2F2B: (0x5C38,),
+    0x2F2C: (0x5C6E,),
+    0x2F2D: (0x5C71,),
+    0x2F2E: (0x5DDB,),
+    0x2F2F: (0x5DE5,),
+    0x2F30: (0x5DF1,),
+    0x2F31: (0x5DFE,),
+    0x2F32: (0x5E72,),
+    0x2F33: (0x5E7A,),
+    0x2F34: (0x5E7F,),
+    0x2F35: (0x5EF4,),
+    0x2F36: (0x5EFE,),
+    0x2F37: (0x5F0B,),
+    0x2F38: (0x5F13,),
+    0x2F39: (0x5F50,),
+    0x2F3A: (0x5F61,),
+    0x2F3B: (0x5F73,),
+    0x2F3C: (0x5FC3,),
+    0x2F3D: (0x6208,),
+    0x2F3E: (0x6236,),
+    0x2F3F: (0x624B,),
+    0x2F40: (0x652F,),
+    0x2F41: (0x6534,),
+    0x2F42: (0x6587,),
+    0x2F43: (0x6597,),
+    0x2F44: (0x65A4,),
+    0x2F45: (0x65B9,),
+    0x2F46: (0x65E0,),
+    0x2F47: (0x65E5,),
+    0x2F48: (0x66F0,),
+    0x2F49: (0x6708,),
+    0x2F4A: (0x6728,),
+    0x2F4B: (0x6B20,),
+    0x2F4C: (0x6B62,),
+    0x2F4D: (0x6B79,),
+    0x2F4E: (0x6BB3,),
+    0x2F4F: (0x6BCB,),
+    0x2F50: (0x6BD4,),
+    0x2F51: (0x6BDB,),
+    0x2F52: (0x6C0F,),
+    0x2F53: (0x6C14,),
+    0x2F54: (0x6C34,),
+    0x2F55: (0x706B,),
+    0x2F56: (0x722A,),
+    0x2F57: (0x7236,),
+    0x2F58: (0x723B,),
+    0x2F59: (0x723F,),
+    0x2F5A: (0x7247,),
+    0x2F5B: (0x7259,),
+    0x2F5C: (0x725B,),
+    0x2F5D: (0x72AC,),
+    0x2F5E: (0x7384,),
+    0x2F5F: (0x7389,),
+    0x2F60: (0x74DC,),
+    0x2F61: (0x74E6,),
+    0x2F62: (0x7518,),
+    0x2F63: (0x751F,),
+    0x2F64: (0x7528,),
+    0x2F65: (0x7530,),
+    0x2F66: (0x758B,),
+    0x2F67: (0x7592,),
+    0x2F68: (0x7676,),
+    0x2F69: (0x767D,),
+    0x2F6A: (0x76AE,),
+    0x2F6B: (0x76BF,),
+    0x2F6C: (0x76EE,),
+    0x2F6D: (0x77DB,),
+    0x2F6E: (0x77E2,),
+    0x2F6F: (0x77F3,),
+    0x2F70: (0x793A,),
+    0x2F71: (0x79B8,),
+    0x2F72: (0x79BE,),
+    0x2F73: (0x7A74,),
+    0x2F74: (0x7ACB,),
+    0x2F75: (0x7AF9,),
+    0x2F76: (0x7C73,),
+    0x2F77: (0x7CF8,),
+    0x2F78: (0x7F36,),
+    0x2F79: (0x7F51,),
+    0x2F7A: (0x7F8A,),
+    0x2F7B: (0x7FBD,),
+    0x2F7C: (0x8001,),
+    0x2F7D: (0x800C,),
+    0x2F7E: (0x8012,),
+    0x2F7F: (0x8033,),
+    0x2F80: (0x807F,),
+    0x2F81: (0x8089,),
+    0x2F82: (0x81E3,),
+    0x2F83: (0x81EA,),
+    0x2F84: (0x81F3,),
+    0x2F85: (0x81FC,),
+    0x2F86: (0x820C,),
+    0x2F87: (0x821B,),
+    0x2F88: (0x821F,),
+    0x2F89: (0x826E,),
+    0x2F8A: (0x8272,),
+    0x2F8B: (0x8278,),
+    0x2F8C: (0x864D,),
+    0x2F8D: (0x866B,),
+    0x2F8E: (0x8840,),
+    0x2F8F: (0x884C,),
+    0x2F90: (0x8863,),
+    0x2F91: (0x897E,),
+    0x2F92: (0x898B,),
+    0x2F93: (0x89D2,),
+    0x2F94: (0x8A00,),
+    0x2F95: (0x8C37,),
+    0x2F96: (0x8C46,),
+    0x2F97: (0x8C55,),
+    0x2F98: (0x8C78,),
+    0x2F99: (0x8C9D,),
+    0x2F9A: (0x8D64,),
+    0x2F9B: (0x8D70,),
+    0x2F9C: (0x8DB3,),
+    0x2F9D: (0x8EAB,),
+    0x2F9E: (0x8ECA,),
+    0x2F9F: (0x8F9B,),
+    0x2FA0: (0x8FB0,),
+    0x2FA1: (0x8FB5,),
+    0x2FA2: (0x9091,),
+    0x2FA3: (0x9149,),
+    0x2FA4: (0x91C6,),
+    0x2FA5: (0x91CC,),
+    0x2FA6: (0x91D1,),
+    0x2FA7: (0x9577,),
+    0x2FA8: (0x9580,),
+    0x2FA9: (0x961C,),
+    0x2FAA: (0x96B6,),
+    0x2FAB: (0x96B9,),
+    0x2FAC: (0x96E8,),
+    0x2FAD: (0x9751,),
+    0x2FAE: (0x975E,),
+    0x2FAF: (0x9762,),
+    0x2FB0: (0x9769,),
+    0x2FB1: (0x97CB,),
+    0x2FB2: (0x97ED,),
+    0x2FB3: (0x97F3,),
+    0x2FB4: (0x9801,),
+    0x2FB5: (0x98A8,),
+    0x2FB6: (0x98DB,),
+    0x2FB7: (0x98DF,),
+    0x2FB8: (0x9996,),
+    0x2FB9: (0x9999,),
+    0x2FBA: (0x99AC,),
+    0x2FBB: (0x9AA8,),
+    0x2FBC: (0x9AD8,),
+    0x2FBD: (0x9ADF,),
+    0x2FBE: (0x9B25,),
+    0x2FBF: (0x9B2F,),
+    0x2FC0: (0x9B32,),
+    0x2FC1: (0x9B3C,),
+    0x2FC2: (0x9B5A,),
+    0x2FC3: (0x9CE5,),
+    0x2FC4: (0x9E75,),
+    0x2FC5: (0x9E7F,),
+    0x2FC6: (0x9EA5,),
+    0x2FC7: (0x9EBB,),
+    0x2FC8: (0x9EC3,),
+    0x2FC9: (0x9ECD,),
+    0x2FCA: (0x9ED1,),
+    0x2FCB: (0x9EF9,),
+    0x2FCC: (0x9EFD,),
+    0x2FCD: (0x9F0E,),
+    0x2FCE: (0x9F13,),
+    0x2FCF: (0x9F20,),
+    0x2FD0: (0x9F3B,),
+    0x2FD1: (0x9F4A,),
+    0x2FD2: (0x9F52,),
+    0x2FD3: (0x9F8D,),
+    0x2FD4: (0x9F9C,),
+    0x2FD5: (0x9FA0,),
+    0x3002: (0x02F3,),
+    0x3003: (0x0027, 0x0027),
+    0x3007: (0x004F,),
+    0x3008: (0x276C,),
+    0x3009: (0x276D,),
+    0x3012: (0x20B8,),
+    0x3014: (0x0028,),
+    0x3015: (0x0029,),
+    0x301A: (0x27E6,),
+    0x301B: (0x27E7,),
+    0x302C: (0x0309,),
+    0x302D: (0x0325,),
+    0x3033: (0x002F,),
+    0x3036: (0x20B8,),
+    0x3038: (0x5341,),
+    0x3039: (0x5344,),
+    0x303A: (0x5345,),
+    0x304F: (0x276C,),
+    0x309A: (0x030A,),
+    0x309B: (0xFF9E,),
+    0x309C: (0xFF9F,),
+    0x30A0: (0x003D,),
+    0x30A4: (0x4EBB,),
+    0x30A8: (0x5DE5,),
+    0x30AB: (0x529B,),
+    0x30BF: (0x5915,),
+    0x30C8: (0x535C,),
+    0x30CB: (0x4E8C,),
+    0x30CE: (0x002F,),
+    0x30CF: (0x516B,),
+    0x30D8: (0x3078,),
+    0x30ED: (0x53E3,),
+    0x30FB: (0x00B7,),
+    0x3131: (0x1100,),
+    0x3132: (0x1100, 0x1100),
+    0x3133: (0x1100, 0x1109),
+    0x3134: (0x1102,),
+    0x3135: (0x1102, 0x110C),
+    0x3136: (0x1102, 0x1112),
+    0x3137: (0x1103,),
+    0x3138: (0x1103, 0x1103),
+    0x3139: (0x1105,),
+    0x313A: (0x1105, 0x1100),
+    0x313B: (0x1105, 0x1106),
+    0x313C: (0x1105, 0x1107),
+    0x313D: (0x1105, 0x1109),
+    0x313E: (0x1105, 0x1110),
+    0x313F: (0x1105, 0x1111),
+    0x3140: (0x1105, 0x1112),
+    0x3141: (0x1106,),
+    0x3142: (0x1107,),
+    0x3143: (0x1107, 0x1107),
+    0x3144: (0x1107, 0x1109),
+    0x3145: (0x1109,),
+    0x3146: (0x1109, 0x1109),
+    0x3147: (0x110B,),
+    0x3148: (0x110C,),
+    0x3149: (0x110C, 0x110C),
+    0x314A: (0x110E,),
+    0x314B: (0x110F,),
+    0x314C: (0x1110,),
+    0x314D: (0x1111,),
+    0x314E: (0x1112,),
+    0x314F: (0x1161,),
+    0x3150: (0x1161, 0x4E28),
+    0x3151: (0x1163,),
+    0x3152: (0x1163, 0x4E28),
+    0x3153: (0x1165,),
+    0x3154: (0x1165, 0x4E28),
+    0x3155: (0x1167,),
+    0x3156: (0x1167, 0x4E28),
+    0x3157: (0x1169,),
+    0x3158: (0x1169, 0x1161),
+    0x3159: (0x1169, 0x1161, 0x4E28),
+    0x315A: (0x1169, 0x4E28),
+    0x315B: (0x116D,),
+    0x315C: (0x116E,),
+    0x315D: (0x116E, 0x1165),
+    0x315E: (0x116E, 0x1165, 0x4E28),
+    0x315F: (0x116E, 0x4E28),
+    0x3160: (0x1172,),
+    0x3161: (0x30FC,),
+    0x3162: (0x30FC, 0x4E28),
+    0x3163: (0x4E28,),
+    0x3164: (0x1160,),
+    0x3165: (0x1102, 0x1102),
+    0x3166: (0x1102, 0x1103),
+    0x3167: (0x1102, 0x1109),
+    0x3168: (0x1102, 0x1140),
+    0x3169: (0x1105, 0x1100, 0x1109),
+    0x316A: (0x1105, 0x1103),
+    0x316B: (0x1105, 0x1107, 0x1109),
+    0x316C: (0x1105, 0x1140),
+    0x316D: (0x1105, 0x1159),
+    0x316E: (0x1106, 0x1107),
+    0x316F: (0x1106, 0x1109),
+    0x3170: (0x1106, 0x1140),
+    0x3171: (0x1106, 0x110B),
+    0x3172: (0x1107, 0x1100),
+    0x3173: (0x1107, 0x1103),
+    0x3174: (0x1107, 0x1109, 0x1100),
+    0x3175: (0x1107, 0x1109, 0x1103),
+    0x3176: (0x1107, 0x110C),
+    0x3177: (0x1107, 0x1110),
+    0x3178: (0x1107, 0x110B),
+    0x3179: (0x1107, 0x1107, 0x110B),
+    0x317A: (0x1109, 0x1100),
+    0x317B: (0x1109, 0x1102),
+    0x317C: (0x1109, 0x1103),
+    0x317D: (0x1109, 0x1107),
+    0x317E: (0x1109, 0x110C),
+    0x317F: (0x1140,),
+    0x3180: (0x110B, 0x110B),
+    0x3181: (0x114C,),
+    0x3182: (0x110B, 0x1109),
+    0x3183: (0x110B, 0x1140),
+    0x3184: (0x1111, 0x110B),
+    0x3185: (0x1112, 0x1112),
+    0x3186: (0x1159,),
+    0x3187: (0x116D, 0x1163),
+    0x3188: (0x116D, 0x1163, 0x4E28),
+    0x3189: (0x116D, 0x4E28),
+    0x318A: (0x1172, 0x1167),
+    0x318B: (0x1172, 0x1167, 0x4E28),
+    0x318C: (0x1172, 0x4E28),
+    0x318D: (0x119E,),
+    0x318E: (0x119E, 0x4E28),
+    0x31D0: (0x30FC,),
+    0x31D1: (0x4E28,),
+    0x31D3: (0x002F,),
+    0x31D4: (0x005C,),
+    0x31D6: (0x4E5B,),
+    0x31DA: (0x4E85,),
+    0x31DB: (0x276C,),
+    0x31DF: (0x4E5A,),
+    0x31E0: (0x4E59,),
+    0x3200: (0x0028, 0x1100, 0x0029),
+    0x3201: (0x0028, 0x1102, 0x0029),
+    0x3202: (0x0028, 0x1103, 0x0029),
+    0x3203: (0x0028, 0x1105, 0x0029),
+    0x3204: (0x0028, 0x1106, 0x0029),
+    0x3205: (0x0028, 0x1107, 0x0029),
+    0x3206: (0x0028, 0x1109, 0x0029),
+    0x3207: (0x0028, 0x110B, 0x0029),
+    0x3208: (0x0028, 0x110C, 0x0029),
+    0x3209: (0x0028, 0x110E, 0x0029),
+    0x320A: (0x0028, 0x110F, 0x0029),
+    0x320B: (0x0028, 0x1110, 0x0029),
+    0x320C: (0x0028, 0x1111, 0x0029),
+    0x320D: (0x0028, 0x1112, 0x0029),
+    0x320E: (0x0028, 0xAC00, 0x0029),
+    0x320F: (0x0028, 0xB098, 0x0029),
+    0x3210: (0x0028, 0xB2E4, 0x0029),
+    0x3211: (0x0028, 0xB77C, 0x0029),
+    0x3212: (0x0028, 0xB9C8, 0x0029),
+    0x3213: (0x0028, 0xBC14, 0x0029),
+    0x3214: (0x0028, 0xC0AC, 0x0029),
+    0x3215: (0x0028, 0xC544, 0x0029),
+    0x3216: (0x0028, 0xC790, 0x0029),
+    0x3217: (0x0028, 0xCC28, 0x0029),
+    0x3218: (0x0028, 0xCE74, 0x0029),
+    0x3219: (0x0028, 0xD0C0, 0x0029),
+    0x321A: (0x0028, 0xD30C, 0x0029),
+    0x321B: (0x0028, 0xD558, 0x0029),
+    0x321C: (0x0028, 0xC8FC, 0x0029),
+    0x321D: (0x0028, 0xC624, 0xC804, 0x0029),
+    0x321E: (0x0028, 0xC624, 0xD6C4, 0x0029),
+    0x3220: (0x0028, 0x30FC, 0x0029),
+    0x3221: (0x0028, 0x4E8C, 0x0029),
+    0x3222: (0x0028, 0x4E09, 0x0029),
+    0x3223: (0x0028, 0x56DB, 0x0029),
+    0x3224: (0x0028, 0x4E94, 0x0029),
+    0x3225: (0x0028, 0x516D, 0x0029),
+    0x3226: (0x0028, 0x4E03, 0x0029),
+    0x3227: (0x0028, 0x516B, 0x0029),
+    0x3228: (0x0028, 0x4E5D, 0x0029),
+    0x3229: (0x0028, 0x5341, 0x0029),
+    0x322A: (0x0028, 0x6708, 0x0029),
+    0x322B: (0x0028, 0x706B, 0x0029),
+    0x322C: (0x0028, 0x6C34, 0x0029),
+    0x322D: (0x0028, 0x6728, 0x0029),
+    0x322E: (0x0028, 0x91D1, 0x0029),
+    0x322F: (0x0028, 0x571F, 0x0029),
+    0x3230: (0x0028, 0x65E5, 0x0029),
+    0x3231: (0x0028, 0x682A, 0x0029),
+    0x3232: (0x0028, 0x6709, 0x0029),
+    0x3233: (0x0028, 0x793E, 0x0029),
+    0x3234: (0x0028, 0x540D, 0x0029),
+    0x3235: (0x0028, 0x7279, 0x0029),
+    0x3236: (0x0028, 0x8CA1, 0x0029),
+    0x3237: (0x0028, 0x795D, 0x0029),
+    0x3238: (0x0028, 0x52B4, 0x0029),
+    0x3239: (0x0028, 0x4EE3, 0x0029),
+    0x323A: (0x0028, 0x547C, 0x0029),
+    0x323B: (0x0028, 0x5B66, 0x0029),
+    0x323C: (0x0028, 0x76E3, 0x0029),
+    0x323D: (0x0028, 0x4F01, 0x0029),
+    0x323E: (0x0028, 0x8CC7, 0x0029),
+    0x323F: (0x0028, 0x5354, 0x0029),
+    0x3240: (0x0028, 0x796D, 0x0029),
+    0x3241: (0x0028, 0x4F11, 0x0029),
+    0x3242: (0x0028, 0x81EA, 0x0029),
+    0x3243: (0x0028, 0x81F3, 0x0029),
+    0x32C0: (0x006C, 0x6708),
+    0x32C1: (0x0032, 0x6708),
+    0x32C2: (0x0033, 0x6708),
+    0x32C3: (0x0034, 0x6708),
+    0x32C4: (0x0035, 0x6708),
+    0x32C5: (0x0036, 0x6708),
+    0x32C6: (0x0037, 0x6708),
+    0x32C7: (0x0038, 0x6708),
+    0x32C8: (0x0039, 0x6708),
+    0x32C9: (0x006C, 0x004F, 0x6708),
+    0x32CA: (0x006C, 0x006C, 0x6708),
+    0x32CB: (0x006C, 0x0032, 0x6708),
+    0x3358: (0x004F, 0x70B9),
+    0x3359: (0x006C, 0x70B9),
+    0x335A: (0x0032, 0x70B9),
+    0x335B: (0x0033, 0x70B9),
+    0x335C: (0x0034, 0x70B9),
+    0x335D: (0x0035, 0x70B9),
+    0x335E: (0x0036, 0x70B9),
+    0x335F: (0x0037, 0x70B9),
+    0x3360: (0x0038, 0x70B9),
+    0x3361: (0x0039, 0x70B9),
+    0x3362: (0x006C, 0x004F, 0x70B9),
+    0x3363: (0x006C, 0x006C, 0x70B9),
+    0x3364: (0x006C, 0x0032, 0x70B9),
+    0x3365: (0x006C, 0x0033, 0x70B9),
+    0x3366: (0x006C, 0x0034, 0x70B9),
+    0x3367: (0x006C, 0x0035, 0x70B9),
+    0x3368: (0x006C, 0x0036, 0x70B9),
+    0x3369: (0x006C, 0x0037, 0x70B9),
+    0x336A: (0x006C, 0x0038, 0x70B9),
+    0x336B: (0x006C, 0x0039, 0x70B9),
+    0x336C: (0x0032, 0x004F, 0x70B9),
+    0x336D: (0x0032, 0x006C, 0x70B9),
+    0x336E: (0x0032, 0x0032, 0x70B9),
+    0x336F: (0x0032, 0x0033, 0x70B9),
+    0x3370: (0x0032, 0x0034, 0x70B9),
+    0x33E0: (0x006C, 0x65E5),
+    0x33E1: (0x0032, 0x65E5),
+    0x33E2: (0x0033, 0x65E5),
+    0x33E3: (0x0034, 0x65E5),
+    0x33E4: (0x0035, 0x65E5),
+    0x33E5: (0x0036, 0x65E5),
+    0x33E6: (0x0037, 0x65E5),
+    0x33E7: (0x0038, 0x65E5),
+    0x33E8: (0x0039, 0x65E5),
+    0x33E9: (0x006C, 0x004F, 0x65E5),
+    0x33EA: (0x006C, 0x006C, 0x65E5),
+    0x33EB: (0x006C, 0x0032, 0x65E5),
+    0x33EC: (0x006C, 0x0033, 0x65E5),
+    0x33ED: (0x006C, 0x0034, 0x65E5),
+    0x33EE: (0x006C, 0x0035, 0x65E5),
+    0x33EF: (0x006C, 0x0036, 0x65E5),
+    0x33F0: (0x006C, 0x0037, 0x65E5),
+    0x33F1: (0x006C, 0x0038, 0x65E5),
+    0x33F2: (0x006C, 0x0039, 0x65E5),
+    0x33F3: (0x0032, 0x004F, 0x65E5),
+    0x33F4: (0x0032, 0x006C, 0x65E5),
+    0x33F5: (0x0032, 0x0032, 0x65E5),
+    0x33F6: (0x0032, 0x0033, 0x65E5),
+    0x33F7: (0x0032, 0x0034, 0x65E5),
+    0x33F8: (0x0032, 0x0035, 0x65E5),
+    0x33F9: (0x0032, 0x0036, 0x65E5),
+    0x33FA: (0x0032, 0x0037, 0x65E5),
+    0x33FB: (0x0032, 0x0038, 0x65E5),
+    0x33FC: (0x0032, 0x0039, 0x65E5),
+    0x33FD: (0x0033, 0x004F, 0x65E5),
+    0x33FE: (0x0033, 0x006C, 0x65E5),
+    0x39B3: (0x363D,),
+    0x439B: (0x3588,),
+    0x4420: (0x3B3B,),
+    0x4E00: (0x30FC,),
+    0x4E36: (0x005C,),
+    0x4E3F: (0x002F,),
+    0x5002: (0x4F75,),
+    0x503C: (0x5024,),
+    0x555F: (0x5553,),
+    0x56D7: (0x53E3,),
+    0x586B: (0x5861,),
+    0x58EB: (0x571F,),
+    0x58FF: (0x58AB,),
+    0x5B00: (0x5AAF,),
+    0x5E32: (0x5E21,),
+    0x5E50: (0x3B3A,),
+    0x6238: (0x6236,),
+    0x6409: (0x3A41,),
+    0x6663: (0x403F,),
+    0x6669: (0x665A,),
+    0x66F6: (0x3ADA,),
+    0x6726: (0x4443,),
+    0x67FF: (0x676E,),
+    0x69E9: (0x3BA3,),
+    0x6A27: (0x699D,),
+    0x6F59: (0x6E88,),
+    0x784F: (0x7814,),
+    0x7D76: (0x7D55,),
+    0x80A6: (0x670C,),
+    0x80CA: (0x6710,),
+    0x80D0: (0x670F,),
+    0x80F6: (0x3B35,),
+    0x8101: (0x6713,),
+    0x8127: (0x6718,),
+    0x8141: (0x80FC,),
+    0x81A7: (0x6723,),
+    0x853F: (0x848D,),
+    0x8641: (0x8637,),
+    0x8A1E: (0x46B6,),
+    0x8A7D: (0x8A2E,),
+    0x8B8F: (0x8B86,),
+    0x8C63: (0x8C5C,),
+    0x8D86: (0x8D7F,),
+    0x8DFA: (0x8DE5,),
+    0x8E9B: (0x8E97,),
+    0x8F27: (0x8EFF,),
+    0x90DE: (0x90CE,),
+    0x93AE: (0x93AD,),
+    0x96B8: (0x96B7,),
+    0x9E43: (0x9E42,),
+    0x9ED2: (0x9ED1,),
+    0x9FC3: (0x4039,),
+    0xA494: (0xA2CD,),
+    0xA49C: (0xA0C0,),
+    0xA49E: (0xA04A,),
+    0xA4A7: (0xA458,),
+    0xA4A8: (0xA132,),
+    0xA4AC: (0xA050,),
+    0xA4B0: (0xA3C2,),
+    0xA4BA: (0xA3BF,),
+    0xA4BE: (0xA2B1,),
+    0xA4BF: (0xA259,),
+    0xA4C0: (0xA3AB,),
+    0xA4C2: (0xA3B5,),
+    0xA4D0: (0x0042,),
+    0xA4D1: (0x0050,),
+    0xA4D2: (0x0064,),
+    0xA4D3: (0x0044,),
+    0xA4D4: (0x0054,),
+    0xA4D6: (0x0047,),
+    0xA4D7: (0x004B,),
+    0xA4D9: (0x004A,),
+    0xA4DA: (0x0043,),
+    0xA4DB: (0x0186,),
+    0xA4DC: (0x005A,),
+    0xA4DD: (0x0046,),
+    0xA4DE: (0x2132,),
+    0xA4DF: (0x004D,),
+    0xA4E0: (0x004E,),
+    0xA4E1: (0x004C,),
+    0xA4E2: (0x0053,),
+    0xA4E3: (0x0052,),
+    0xA4E5: (0x0245,),
+    0xA4E6: (0x0056,),
+    0xA4E7: (0x0048,),
+    0xA4EA: (0x0057,),
+    0xA4EB: (0x0058,),
+    0xA4EC: (0x0059,),
+    0xA4ED: (0x1660,),
+    0xA4EE: (0x0041,),
+    0xA4EF: (0x2C6F,),
+    0xA4F0: (0x0045,),
+    0xA4F1: (0x018E,),
+    0xA4F2: (0x006C,),
+    0xA4F3: (0x004F,),
+    0xA4F4: (0x0055,),
+    0xA4F5: (0x0548,),
+    0xA4F7: (0x15E1,),
+    0xA4F8: (0x002E,),
+    0xA4F9: (0x002C,),
+    0xA4FA: (0x002E, 0x002E),
+    0xA4FB: (0x002E, 0x002C),
+    0xA4FD: (0x003A,),
+    0xA4FE: (0x002D, 0x002E),
+    0xA4FF: (0x003D,),
+    0xA60E: (0x002E,),
+    0xA644: (0x0032,),
+    0xA645: (0x01A8,),
+    0xA647: (0x0069,),
+    0xA64D: (0x03C9,),
+    0xA650: (0x042A, 0x006C),
+    0xA651: (0x02C9, 0x0062, 0x0069),
+    0xA668: (0x0298,),
+    0xA66F: (0x20E9,),
+    0xA67C: (0x0306,),
+    0xA67E: (0x02C7,),
+    0xA695: (0x0068, 0x0314),
+    0xA698: (0x004F, 0x004F),
+    0xA699: (0x006F, 0x006F),
+    0xA69A: (0x102A8,),
+    0xA6A1: (0x0418,),
+    0xA6B0: (0x16B9,),
+    0xA6B1: (0x2C75,),
+    0xA6CD: (0x02A1,),
+    0xA6CE: (0x0245,),
+    0xA6DB: (0x03A0,),
+    0xA6DF: (0x0056,),
+    0xA6EB: (0x003F,),
+    0xA6EF: (0x0032,),
+    0xA6F0: (0x0302,),
+    0xA6F1: (0x0304,),
+    0xA6F4: (0xA6F3, 0xA6F3),
+    0xA714: (0x02EB,),
+    0xA716: (0x02EA,),
+    0xA728: (0x0054, 0x0033),
+    0xA729: (0x0074, 0x021D),
+    0xA731: (0x0073,),
+    0xA732: (0x0041, 0x0041),
+    0xA733: (0x0061, 0x0061),
+    0xA734: (0x0041, 0x004F),
+    0xA735: (0x0061, 0x006F),
+    0xA736: (0x0041, 0x0055),
+    0xA737: (0x0061, 0x0075),
+    0xA738: (0x0041, 0x0056),
+    0xA739: (0x0061, 0x0076),
+    0xA73A: (0x0041, 0x0056),
+    0xA73B: (0x0061, 0x0076),
+    0xA73C: (0x0041, 0x0059),
+    0xA73D: (0x0061, 0x0079),
+    0xA740: (0x004B, 0x0335),
+    0xA74A: (0x004F, 0x0335),
+    0xA74B: (0x006F, 0x0335),
+    0xA74E: (0x004F, 0x004F),
+    0xA74F: (0x006F, 0x006F),
+    0xA75A: (0x0032,),
+    0xA761: (0x0076, 0x0079),
+    0xA76A: (0x0033,),
+    0xA76B: (0x021D,),
+    0xA76E: (0x0039,),
+    0xA777: (0x0074, 0x0066),
+    0xA778: (0x0026,),
+    0xA77A: (0xA779,),
+    0xA789: (0x003A,),
+    0xA78C: (0x0027,),
+    0xA78F: (0x00B7,),
+    0xA795: (0xA727,),
+    0xA798: (0x0046,),
+    0xA799: (0x0066,),
+    0xA79A: (0x10412,),
+    0xA79B: (0x1043A,),
+    0xA79D: (0x029A,),
+    0xA79E: (0xA4E4,),
+    0xA79F: (0x0075,),
+    0xA7AB: (0x0033,),
+    0xA7B1: (0xA4D5,),
+    0xA7B2: (0x004A,),
+    0xA7B3: (0x0058,),
+    0xA7B4: (0x0042,),
+    0xA7B5: (0x00DF,),
+    0xA7B6: (0xA64C,),
+    0xA7B7: (0x03C9,),
+    0xA7F7: (0x30FC,),
+    0xA830: (0x0964,),
+    0xA960: (0x1103, 0x1106),
+    0xA961: (0x1103, 0x1107),
+    0xA962: (0x1103, 0x1109),
+    0xA963: (0x1103, 0x110C),
+    0xA964: (0x1105, 0x1100),
+    0xA965: (0x1105, 0x1100, 0x1100),
+    0xA966: (0x1105, 0x1103),
+    0xA967: (0x1105, 0x1103, 0x1103),
+    0xA968: (0x1105, 0x1106),
+    0xA969: (0x1105, 0x1107),
+    0xA96A: (0x1105, 0x1107, 0x1107),
+    0xA96B: (0x1105, 0x1107, 0x110B),
+    0xA96C: (0x1105, 0x1109),
+    0xA96D: (0x1105, 0x110C),
+    0xA96E: (0x1105, 0x110F),
+    0xA96F: (0x1106, 0x1100),
+    0xA970: (0x1106, 0x1103),
+    0xA971: (0x1106, 0x1109),
+    0xA972: (0x1107, 0x1109, 0x1110),
+    0xA973: (0x1107, 0x110F),
+    0xA974: (0x1107, 0x1112),
+    0xA975: (0x1109, 0x1109, 0x1107),
+    0xA976: (0x110B, 0x1105),
+    0xA977: (0x110B, 0x1112),
+    0xA978: (0x110C, 0x110C, 0x1112),
+    0xA979: (0x1110, 0x1110),
+    0xA97A: (0x1111, 0x1112),
+    0xA97B: (0x1112, 0x1109),
+    0xA97C: (0x1159, 0x1159),
+    0xA992: (0x2C3F,),
+    0xA9A3: (0xA99D,),
+    0xA9C6: (0xA9D0,),
+    0xA9CF: (0x0662,),
+    0xAA53: (0xAA01,),
+    0xAA56: (0xAA23,),
+    0xAB32: (0x0065,),
+    0xAB35: (0x0066,),
+    0xAB3D: (0x006F,),
+    0xAB3E: (0x006F, 0x0338),
+    0xAB3F: (0x0254, 0x0338),
+    0xAB41: (0x01DD, 0x006F, 0x0338),
+    0xAB42: (0x01DD, 0x006F, 0x0335),
+    0xAB47: (0x0072,),
+    0xAB48: (0x0072,),
+    0xAB4D: (0x0283,),
+    0xAB4E: (0x0075,),
+    0xAB51: (0x0072, 0x006E),
+    0xAB52: (0x0075,),
+    0xAB53: (0x03C7,),
+    0xAB55: (0x03C7,),
+    0xAB5A: (0x0079,),
+    0xAB60: (0x0459,),
+    0xD7B0: (0x1169, 0x1167),
+    0xD7B1: (0x1169, 0x1169, 0x4E28),
+    0xD7B2: (0x116D, 0x1161),
+    0xD7B3: (0x116D, 0x1161, 0x4E28),
+    0xD7B4: (0x116D, 0x1165),
+    0xD7B5: (0x116E, 0x1167),
+    0xD7B6: (0x116E, 0x4E28, 0x4E28),
+    0xD7B7: (0x1172, 0x1161, 0x4E28),
+    0xD7B8: (0x1172, 0x1169),
+    0xD7B9: (0x30FC, 0x1161),
+    0xD7BA: (0x30FC, 0x1165),
+    0xD7BB: (0x30FC, 0x1165, 0x4E28),
+    0xD7BC: (0x30FC, 0x1169),
+    0xD7BD: (0x4E28, 0x1163, 0x1169),
+    0xD7BE: (0x4E28, 0x1163, 0x4E28),
+    0xD7BF: (0x4E28, 0x1167),
+    0xD7C0: (0x4E28, 0x1167, 0x4E28),
+    0xD7C1: (0x4E28, 0x1169, 0x4E28),
+    0xD7C2: (0x4E28, 0x116D),
+    0xD7C3: (0x4E28, 0x1172),
+    0xD7C4: (0x4E28, 0x4E28),
+    0xD7C5: (0x119E, 0x1161),
+    0xD7C6: (0x119E, 0x1165, 0x4E28),
+    0xD7CB: (0x1102, 0x1105),
+    0xD7CC: (0x1102, 0x110E),
+    0xD7CD: (0x1103, 0x1103),
+    0xD7CE: (0x1103, 0x1103, 0x1107),
+    0xD7CF: (0x1103, 0x1107),
+    0xD7D0: (0x1103, 0x1109),
+    0xD7D1: (0x1103, 0x1109, 0x1100),
+    0xD7D2: (0x1103, 0x110C),
+    0xD7D3: (0x1103, 0x110E),
+    0xD7D4: (0x1103, 0x1110),
+    0xD7D5: (0x1105, 0x1100, 0x1100),
+    0xD7D6: (0x1105, 0x1100, 0x1112),
+    0xD7D7: (0x1105, 0x1105, 0x110F),
+    0xD7D8: (0x1105, 0x1106, 0x1112),
+    0xD7D9: (0x1105, 0x1107, 0x1103),
+    0xD7DA: (0x1105, 0x1107, 0x1111),
+    0xD7DB: (0x1105, 0x114C),
+    0xD7DC: (0x1105, 0x1159, 0x1112),
+    0xD7DD: (0x1105, 0x110B),
+    0xD7DE: (0x1106, 0x1102),
+    0xD7DF: (0x1106, 0x1102, 0x1102),
+    0xD7E0: (0x1106, 0x1106),
+    0xD7E1: (0x1106, 0x1107, 0x1109),
+    0xD7E2: (0x1106, 0x110C),
+    0xD7E3: (0x1107, 0x1103),
+    0xD7E4: (0x1107, 0x1105, 0x1111),
+    0xD7E5: (0x1107, 0x1106),
+    0xD7E6: (0x1107, 0x1107),
+    0xD7E7: (0x1107, 0x1109, 0x1103),
+    0xD7E8: (0x1107, 0x110C),
+    0xD7E9: (0x1107, 0x110E),
+    0xD7EA: (0x1109, 0x1106),
+    0xD7EB: (0x1109, 0x1107, 0x110B),
+    0xD7EC: (0x1109, 0x1109, 0x1100),
+    0xD7ED: (0x1109, 0x1109, 0x1103),
+    0xD7EE: (0x1109, 0x1140),
+    0xD7EF: (0x1109, 0x110C),
+    0xD7F0: (0x1109, 0x110E),
+    0xD7F1: (0x1109, 0x1110),
+    0xD7F2: (0x1105, 0x1112),
+    0xD7F3: (0x1140, 0x1107),
+    0xD7F4: (0x1140, 0x1107, 0x110B),
+    0xD7F5: (0x114C, 0x1106),
+    0xD7F6: (0x114C, 0x1112),
+    0xD7F7: (0x110C, 0x1107),
+    0xD7F8: (0x110C, 0x1107, 0x1107),
+    0xD7F9: (0x110C, 0x110C),
+    0xD7FA: (0x1111, 0x1109),
+    0xD7FB: (0x1111, 0x1110),
+    0xF900: (0x8C48,),
+    0xF901: (0x66F4,),
+    0xF902: (0x8ECA,),
+    0xF903: (0x8CC8,),
+    0xF904: (0x6ED1,),
+    0xF905: (0x4E32,),
+    0xF906: (0x53E5,),
+    0xF907: (0x9F9C,),
+    0xF908: (0x9F9C,),
+    0xF909: (0x5951,),
+    0xF90A: (0x91D1,),
+    0xF90B: (0x5587,),
+    0xF90C: (0x5948,),
+    0xF90D: (0x61F6,),
+    0xF90E: (0x7669,),
+    0xF90F: (0x7F85,),
+    0xF910: (0x863F,),
+    0xF911: (0x87BA,),
+    0xF912: (0x88F8,),
+    0xF913: (0x908F,),
+    0xF914: (0x6A02,),
+    0xF915: (0x6D1B,),
+    0xF916: (0x70D9,),
+    0xF917: (0x73DE,),
+    0xF918: (0x843D,),
+    0xF919: (0x916A,),
+    0xF91A: (0x99F1,),
+    0xF91B: (0x4E82,),
+    0xF91C: (0x5375,),
+    0xF91D: (0x6B04,),
+    0xF91E: (0x721B,),
+    0xF91F: (0x862D,),
+    0xF920: (0x9E1E,),
+    0xF921: (0x5D50,),
+    0xF922: (0x6FEB,),
+    0xF923: (0x85CD,),
+    0xF924: (0x8964,),
+    0xF925: (0x62C9,),
+    0xF926: (0x81D8,),
+    0xF927: (0x881F,),
+    0xF928: (0x5ECA,),
+    0xF929: (0x6717,),
+    0xF92A: (0x6D6A,),
+    0xF92B: (0x72FC,),
+    0xF92C: (0x90CE,),
+    0xF92D: (0x4F86,),
+    0xF92E: (0x51B7,),
+    0xF92F: (0x52DE,),
+    0xF930: (0x64C4,),
+    0xF931: (0x6AD3,),
+    0xF932: (0x7210,),
+    0xF933: (0x76E7,),
+    0xF934: (0x8001,),
+    0xF935: (0x8606,),
+    0xF936: (0x865C,),
+    0xF937: (0x8DEF,),
+    0xF938: (0x9732,),
+    0xF939: (0x9B6F,),
+    0xF93A: (0x9DFA,),
+    0xF93B: (0x788C,),
+    0xF93C: (0x797F,),
+    0xF93D: (0x7DA0,),
+    0xF93E: (0x83C9,),
+    0xF93F: (0x9304,),
+    0xF940: (0x9E7F,),
+    0xF941: (0x8AD6,),
+    0xF942: (0x58DF,),
+    0xF943: (0x5F04,),
+    0xF944: (0x7C60,),
+    0xF945: (0x807E,),
+    0xF946: (0x7262,),
+    0xF947: (0x78CA,),
+    0xF948: (0x8CC2,),
+    0xF949: (0x96F7,),
+    0xF94A: (0x58D8,),
+    0xF94B: (0x5C62,),
+    0xF94C: (0x6A13,),
+    0xF94D: (0x6DDA,),
+    0xF94E: (0x6F0F,),
+    0xF94F: (0x7D2F,),
+    0xF950: (0x7E37,),
+    0xF951: (0x964B,),
+    0xF952: (0x52D2,),
+    0xF953: (0x808B,),
+    0xF954: (0x51DC,),
+    0xF955: (0x51CC,),
+    0xF956: (0x7A1C,),
+    0xF957: (0x7DBE,),
+    0xF958: (0x83F1,),
+    0xF959: (0x9675,),
+    0xF95A: (0x8B80,),
+    0xF95B: (0x62CF,),
+    0xF95C: (0x6A02,),
+    0xF95D: (0x8AFE,),
+    0xF95E: (0x4E39,),
+    0xF95F: (0x5BE7,),
+    0xF960: (0x6012,),
+    0xF961: (0x7387,),
+    0xF962: (0x7570,),
+    0xF963: (0x5317,),
+    0xF964: (0x78FB,),
+    0xF965: (0x4FBF,),
+    0xF966: (0x5FA9,),
+    0xF967: (0x4E0D,),
+    0xF968: (0x6CCC,),
+    0xF969: (0x6578,),
+    0xF96A: (0x7D22,),
+    0xF96B: (0x53C3,),
+    0xF96C: (0x585E,),
+    0xF96D: (0x7701,),
+    0xF96E: (0x8449,),
+    0xF96F: (0x8AAA,),
+    0xF970: (0x6BBA,),
+    0xF971: (0x8FB0,),
+    0xF972: (0x6C88,),
+    0xF973: (0x62FE,),
+    0xF974: (0x82E5,),
+    0xF975: (0x63A0,),
+    0xF976: (0x7565,),
+    0xF977: (0x4EAE,),
+    0xF978: (0x5169,),
+    0xF979: (0x51C9,),
+    0xF97A: (0x6881,),
+    0xF97B: (0x7CE7,),
+    0xF97C: (0x826F,),
+    0xF97D: (0x8AD2,),
+    0xF97E: (0x91CF,),
+    0xF97F: (0x52F5,),
+    0xF980: (0x5442,),
+    0xF981: (0x5973,),
+    0xF982: (0x5EEC,),
+    0xF983: (0x65C5,),
+    0xF984: (0x6FFE,),
+    0xF985: (0x792A,),
+    0xF986: (0x95AD,),
+    0xF987: (0x9A6A,),
+    0xF988: (0x9E97,),
+    0xF989: (0x9ECE,),
+    0xF98A: (0x529B,),
+    0xF98B: (0x66C6,),
+    0xF98C: (0x6B77,),
+    0xF98D: (0x8F62,),
+    0xF98E: (0x5E74,),
+    0xF98F: (0x6190,),
+    0xF990: (0x6200,),
+    0xF991: (0x649A,),
+    0xF992: (0x6F23,),
+    0xF993: (0x7149,),
+    0xF994: (0x7489,),
+    0xF995: (0x79CA,),
+    0xF996: (0x7DF4,),
+    0xF997: (0x806F,),
+    0xF998: (0x8F26,),
+    0xF999: (0x84EE,),
+    0xF99A: (0x9023,),
+    0xF99B: (0x934A,),
+    0xF99C: (0x5217,),
+    0xF99D: (0x52A3,),
+    0xF99E: (0x54BD,),
+    0xF99F: (0x70C8,),
+    0xF9A0: (0x88C2,),
+    0xF9A1: (0x8AAA,),
+    0xF9A2: (0x5EC9,),
+    0xF9A3: (0x5FF5,),
+    0xF9A4: (0x637B,),
+    0xF9A5: (0x6BAE,),
+    0xF9A6: (0x7C3E,),
+    0xF9A7: (0x7375,),
+    0xF9A8: (0x4EE4,),
+    0xF9A9: (0x56F9,),
+    0xF9AA: (0x5BE7,),
+    0xF9AB: (0x5DBA,),
+    0xF9AC: (0x601C,),
+    0xF9AD: (0x73B2,),
+    0xF9AE: (0x7469,),
+    0xF9AF: (0x7F9A,),
+    0xF9B0: (0x8046,),
+    0xF9B1: (0x9234,),
+    0xF9B2: (0x96F6,),
+    0xF9B3: (0x9748,),
+    0xF9B4: (0x9818,),
+    0xF9B5: (0x4F8B,),
+    0xF9B6: (0x79AE,),
+    0xF9B7: (0x91B4,),
+    0xF9B8: (0x96B7,),
+    0xF9B9: (0x60E1,),
+    0xF9BA: (0x4E86,),
+    0xF9BB: (0x50DA,),
+    0xF9BC: (0x5BEE,),
+    0xF9BD: (0x5C3F,),
+    0xF9BE: (0x6599,),
+    0xF9BF: (0x6A02,),
+    0xF9C0: (0x71CE,),
+    0xF9C1: (0x7642,),
+    0xF9C2: (0x84FC,),
+    0xF9C3: (0x907C,),
+    0xF9C4: (0x9F8D,),
+    0xF9C5: (0x6688,),
+    0xF9C6: (0x962E,),
+    0xF9C7: (0x5289,),
+    0xF9C8: (0x677B,),
+    0xF9C9: (0x67F3,),
+    0xF9CA: (0x6D41,),
+    0xF9CB: (0x6E9C,),
+    0xF9CC: (0x7409,),
+    0xF9CD: (0x7559,),
+    0xF9CE: (0x786B,),
+    0xF9CF: (0x7D10,),
+    0xF9D0: (0x985E,),
+    0xF9D1: (0x516D,),
+    0xF9D2: (0x622E,),
+    0xF9D3: (0x9678,),
+    0xF9D4: (0x502B,),
+    0xF9D5: (0x5D19,),
+    0xF9D6: (0x6DEA,),
+    0xF9D7: (0x8F2A,),
+    0xF9D8: (0x5F8B,),
+    0xF9D9: (0x6144,),
+    0xF9DA: (0x6817,),
+    0xF9DB: (0x7387,),
+    0xF9DC: (0x9686,),
+    0xF9DD: (0x5229,),
+    0xF9DE: (0x540F,),
+    0xF9DF: (0x5C65,),
+    0xF9E0: (0x6613,),
+    0xF9E1: (0x674E,),
+    0xF9E2: (0x68A8,),
+    0xF9E3: (0x6CE5,),
+    0xF9E4: (0x7406,),
+    0xF9E5: (0x75E2,),
+    0xF9E6: (0x7F79,),
+    0xF9E7: (0x88CF,),
+    0xF9E8: (0x88E1,),
+    0xF9E9: (0x91CC,),
+    0xF9EA: (0x96E2,),
+    0xF9EB: (0x533F,),
+    0xF9EC: (0x6EBA,),
+    0xF9ED: (0x541D,),
+    0xF9EE: (0x71D0,),
+    0xF9EF: (0x7498,),
+    0xF9F0: (0x85FA,),
+    0xF9F1: (0x96A3,),
+    0xF9F2: (0x9C57,),
+    0xF9F3: (0x9E9F,),
+    0xF9F4: (0x6797,),
+    0xF9F5: (0x6DCB,),
+    0xF9F6: (0x81E8,),
+    0xF9F7: (0x7ACB,),
+    0xF9F8: (0x7B20,),
+    0xF9F9: (0x7C92,),
+    0xF9FA: (0x72C0,),
+    0xF9FB: (0x7099,),
+    0xF9FC: (0x8B58,),
+    0xF9FD: (0x4EC0,),
+    0xF9FE: (0x8336,),
+    0xF9FF: (0x523A,),
+    0xFA00: (0x5207,),
+    0xFA01: (0x5EA6,),
+    0xFA02: (0x62D3,),
+    0xFA03: (0x7CD6,),
+    0xFA04: (0x5B85,),
+    0xFA05: (0x6D1E,),
+    0xFA06: (0x66B4,),
+    0xFA07: (0x8F3B,),
+    0xFA08: (0x884C,),
+    0xFA09: (0x964D,),
+    0xFA0A: (0x898B,),
+    0xFA0B: (0x5ED3,),
+    0xFA0C: (0x5140,),
+    0xFA0D: (0x55C0,),
+    0xFA10: (0x585A,),
+    0xFA12: (0x6674,),
+    0xFA15: (0x51DE,),
+    0xFA16: (0x732A,),
+    0xFA17: (0x76CA,),
+    0xFA18: (0x793C,),
+    0xFA19: (0x795E,),
+    0xFA1A: (0x7965,),
+    0xFA1B: (0x798F,),
+    0xFA1C: (0x9756,),
+    0xFA1D: (0x7CBE,),
+    0xFA1E: (0x7FBD,),
+    0xFA20: (0x8612,),
+    0xFA22: (0x8AF8,),
+    0xFA25: (0x9038,),
+    0xFA26: (0x90FD,),
+    0xFA2A: (0x98EF,),
+    0xFA2B: (0x98FC,),
+    0xFA2C: (0x9928,),
+    0xFA2D: (0x9DB4,),
+    0xFA2E: (0x90CE,),
+    0xFA2F: (0x96B7,),
+    0xFA30: (0x4FAE,),
+    0xFA31: (0x50E7,),
+    0xFA32: (0x514D,),
+    0xFA33: (0x52C9,),
+    0xFA34: (0x52E4,),
+    0xFA35: (0x5351,),
+    0xFA36: (0x559D,),
+    0xFA37: (0x5606,),
+    0xFA38: (0x5668,),
+    0xFA39: (0x5840,),
+    0xFA3A: (0x58A8,),
+    0xFA3B: (0x5C64,),
+    0xFA3C: (0x5C6E,),
+    0xFA3D: (0x6094,),
+    0xFA3E: (0x6168,),
+    0xFA3F: (0x618E,),
+    0xFA40: (0x61F2,),
+    0xFA41: (0x654F,),
+    0xFA42: (0x65E2,),
+    0xFA43: (0x6691,),
+    0xFA44: (0x6885,),
+    0xFA45: (0x6D77,),
+    0xFA46: (0x6E1A,),
+    0xFA47: (0x6F22,),
+    0xFA48: (0x716E,),
+    0xFA49: (0x722B,),
+    0xFA4A: (0x7422,),
+    0xFA4B: (0x7891,),
+    0xFA4C: (0x793E,),
+    0xFA4D: (0x7949,),
+    0xFA4E: (0x7948,),
+    0xFA4F: (0x7950,),
+    0xFA50: (0x7956,),
+    0xFA51: (0x795D,),
+    0xFA52: (0x798D,),
+    0xFA53: (0x798E,),
+    0xFA54: (0x7A40,),
+    0xFA55: (0x7A81,),
+    0xFA56: (0x7BC0,),
+    0xFA57: (0x7DF4,),
+    0xFA58: (0x7E09,),
+    0xFA59: (0x7E41,),
+    0xFA5A: (0x7F72,),
+    0xFA5B: (0x8005,),
+    0xFA5C: (0x81ED,),
+    0xFA5D: (0x8279,),
+    0xFA5E: (0x8279,),
+    0xFA5F: (0x8457,),
+    0xFA60: (0x8910,),
+    0xFA61: (0x8996,),
+    0xFA62: (0x8B01,),
+    0xFA63: (0x8B39,),
+    0xFA64: (0x8CD3,),
+    0xFA65: (0x8D08,),
+    0xFA66: (0x8FB6,),
+    0xFA67: (0x9038,),
+    0xFA68: (0x96E3,),
+    0xFA69: (0x97FF,),
+    0xFA6A: (0x983B,),
+    0xFA6B: (0x6075,),
+    0xFA6C: (0x242EE,),
+    0xFA6D: (0x8218,),
+    0xFA70: (0x4E26,),
+    0xFA71: (0x51B5,),
+    0xFA72: (0x5168,),
+    0xFA73: (0x4F80,),
+    0xFA74: (0x5145,),
+    0xFA75: (0x5180,),
+    0xFA76: (0x52C7,),
+    0xFA77: (0x52FA,),
+    0xFA78: (0x559D,),
+    0xFA79: (0x5555,),
+    0xFA7A: (0x5599,),
+    0xFA7B: (0x55E2,),
+    0xFA7C: (0x585A,),
+    0xFA7D: (0x58B3,),
+    0xFA7E: (0x5944,),
+    0xFA7F: (0x5954,),
+    0xFA80: (0x5A62,),
+    0xFA81: (0x5B28,),
+    0xFA82: (0x5ED2,),
+    0xFA83: (0x5ED9,),
+    0xFA84: (0x5F69,),
+    0xFA85: (0x5FAD,),
+    0xFA86: (0x60D8,),
+    0xFA87: (0x614E,),
+    0xFA88: (0x6108,),
+    0xFA89: (0x618E,),
+    0xFA8A: (0x6160,),
+    0xFA8B: (0x61F2,),
+    0xFA8C: (0x6234,),
+    0xFA8D: (0x63C4,),
+    0xFA8E: (0x641C,),
+    0xFA8F: (0x6452,),
+    0xFA90: (0x6556,),
+    0xFA91: (0x6674,),
+    0xFA92: (0x6717,),
+    0xFA93: (0x671B,),
+    0xFA94: (0x6756,),
+    0xFA95: (0x6B79,),
+    0xFA96: (0x6BBA,),
+    0xFA97: (0x6D41,),
+    0xFA98: (0x6EDB,),
+    0xFA99: (0x6ECB,),
+    0xFA9A: (0x6F22,),
+    0xFA9B: (0x701E,),
+    0xFA9C: (0x716E,),
+    0xFA9D: (0x77A7,),
+    0xFA9E: (0x7235,),
+    0xFA9F: (0x72AF,),
+    0xFAA0: (0x732A,),
+    0xFAA1: (0x7471,),
+    0xFAA2: (0x7506,),
+    0xFAA3: (0x753B,),
+    0xFAA4: (0x761D,),
+    0xFAA5: (0x761F,),
+    0xFAA6: (0x76CA,),
+    0xFAA7: (0x76DB,),
+    0xFAA8: (0x76F4,),
+    0xFAA9: (0x774A,),
+    0xFAAA: (0x7740,),
+    0xFAAB: (0x78CC,),
+    0xFAAC: (0x7AB1,),
+    0xFAAD: (0x7BC0,),
+    0xFAAE: (0x7C7B,),
+    0xFAAF: (0x7D5B,),
+    0xFAB0: (0x7DF4,),
+    0xFAB1: (0x7F3E,),
+    0xFAB2: (0x8005,),
+    0xFAB3: (0x8352,),
+    0xFAB4: (0x83EF,),
+    0xFAB5: (0x8779,),
+    0xFAB6: (0x8941,),
+    0xFAB7: (0x8986,),
+    0xFAB8: (0x8996,),
+    0xFAB9: (0x8ABF,),
+    0xFABA: (0x8AF8,),
+    0xFABB: (0x8ACB,),
+    0xFABC: (0x8B01,),
+    0xFABD: (0x8AFE,),
+    0xFABE: (0x8AED,),
+    0xFABF: (0x8B39,),
+    0xFAC0: (0x8B8A,),
+    0xFAC1: (0x8D08,),
+    0xFAC2: (0x8F38,),
+    0xFAC3: (0x9072,),
+    0xFAC4: (0x9199,),
+    0xFAC5: (0x9276,),
+    0xFAC6: (0x967C,),
+    0xFAC7: (0x96E3,),
+    0xFAC8: (0x9756,),
+    0xFAC9: (0x97DB,),
+    0xFACA: (0x97FF,),
+    0xFACB: (0x980B,),
+    0xFACC: (0x983B,),
+    0xFACD: (0x9B12,),
+    0xFACE: (0x9F9C,),
+    0xFACF: (0x2284A,),
+    0xFAD0: (0x22844,),
+    0xFAD1: (0x233D5,),
+    0xFAD2: (0x3B9D,),
+    0xFAD3: (0x4018,),
+    0xFAD4: (0x4039,),
+    0xFAD5: (0x25249,),
+    0xFAD6: (0x25CD0,),
+    0xFAD7: (0x27ED3,),
+    0xFAD8: (0x9F43,),
+    0xFAD9: (0x9F8E,),
+    0xFB00: (0x0066, 0x0066),
+    0xFB01: (0x0066, 0x0069),
+    0xFB02: (0x0066, 0x006C),
+    0xFB03: (0x0066, 0x0066, 0x0069),
+    0xFB04: (0x0066, 0x0066, 0x006C),
+    0xFB06: (0x0073, 0x0074),
+    0xFB13: (0x0574, 0x0576),
+    0xFB14: (0x0574, 0x0565),
+    0xFB15: (0x0574, 0x056B),
+    0xFB16: (0x057E, 0x0576),
+    0xFB17: (0x0574, 0x056D),
+    0xFB20: (0x05E2,),
+    0xFB21: (0x05D0,),
+    0xFB22: (0x05D3,),
+    0xFB23: (0x05D4,),
+    0xFB24: (0x05DB,),
+    0xFB25: (0x05DC,),
+    0xFB26: (0x05DD,),
+    0xFB27: (0x05E8,),
+    0xFB28: (0x05EA,),
+    0xFB29: (0x002D, 0x0307),
+    0xFB2B: (0xFB2A,),
+    0xFB2D: (0xFB2C,),
+    0xFB2F: (0xFB2E,),
+    0xFB30: (0xFB2E,),
+    0xFB39: (0xFB1D,),
+    0xFB49: (0xFB2A,),
+    0xFB4F: (0x05D0, 0x05DC),
+    0xFB50: (0x0671,),
+    0xFB51: (0x0671,),
+    0xFB52: (0x067B,),
+    0xFB53: (0x067B,),
+    0xFB54: (0x067B,),
+    0xFB55: (0x067B,),
+    0xFB56: (0x0649, 0x06DB),
+    0xFB57: (0x0649, 0x06DB),
+    0xFB58: (0x0649, 0x06DB),
+    0xFB59: (0x0649, 0x06DB),
+    0xFB5A: (0x0680,),
+    0xFB5B: (0x0680,),
+    0xFB5C: (0x0680,),
+    0xFB5D: (0x0680,),
+    0xFB5E: (0x067A,),
+    0xFB5F: (0x067A,),
+    0xFB60: (0x067A,),
+    0xFB61: (0x067A,),
+    0xFB62: (0x067F,),
+    0xFB63: (0x067F,),
+    0xFB64: (0x067F,),
+    0xFB65: (0x067F,),
+    0xFB66: (0x0649, 0x0615),
+    0xFB67: (0x0649, 0x0615),
+    0xFB68: (0x0649, 0x0615),
+    0xFB69: (0x0649, 0x0615),
+    0xFB6A: (0x06A1, 0x06DB),
+    0xFB6B: (0x06A1, 0x06DB),
+    0xFB6C: (0x06A1, 0x06DB),
+    0xFB6D: (0x06A1, 0x06DB),
+    0xFB6E: (0x06A6,),
+    0xFB6F: (0x06A6,),
+    0xFB70: (0x06A6,),
+    0xFB71: (0x06A6,),
+    0xFB72: (0x0684,),
+    0xFB73: (0x0684,),
+    0xFB74: (0x0684,),
+    0xFB75: (0x0684,),
+    0xFB76: (0x0683,),
+    0xFB77: (0x0683,),
+    0xFB78: (0x0683,),
+    0xFB79: (0x0683,),
+    0xFB7A: (0x0686,),
+    0xFB7B: (0x0686,),
+    0xFB7C: (0x0686,),
+    0xFB7D: (0x0686,),
+    0xFB7E: (0x0687,),
+    0xFB7F: (0x0687,),
+    0xFB80: (0x0687,),
+    0xFB81: (0x0687,),
+    0xFB82: (0x068D,),
+    0xFB83: (0x068D,),
+    0xFB84: (0x068C,),
+    0xFB85: (0x068C,),
+    0xFB86: (0x062F, 0x06DB),
+    0xFB87: (0x062F, 0x06DB),
+    0xFB88: (0x062F, 0x0615),
+    0xFB89: (0x062F, 0x0615),
+    0xFB8A: (0x0631, 0x06DB),
+    0xFB8B: (0x0631, 0x06DB),
+    0xFB8C: (0x0631, 0x0615),
+    0xFB8D: (0x0631, 0x0615),
+    0xFB8E: (0x0643,),
+    0xFB8F: (0x0643,),
+    0xFB90: (0x0643,),
+    0xFB91: (0x0643,),
+    0xFB92: (0x06AF,),
+    0xFB93: (0x06AF,),
+    0xFB94: (0x06AF,),
+    0xFB95: (0x06AF,),
+    0xFB96: (0x06B3,),
+    0xFB97: (0x06B3,),
+    0xFB98: (0x06B3,),
+    0xFB99: (0x06B3,),
+    0xFB9A: (0x06B1,),
+    0xFB9B: (0x06B1,),
+    0xFB9C: (0x06B1,),
+    0xFB9D: (0x06B1,),
+    0xFB9E: (0x0649,),
+    0xFB9F: (0x0649,),
+    0xFBA0: (0x0649, 0x0615),
+    0xFBA1: (0x0649, 0x0615),
+    0xFBA2: (0x0649, 0x0615),
+    0xFBA3: (0x0649, 0x0615),
+    0xFBA4: (0x06C0,),
+    0xFBA5: (0x06C0,),
+    0xFBA6: (0x006F,),
+    0xFBA7: (0x006F,),
+    0xFBA8: (0x006F,),
+    0xFBA9: (0x006F,),
+    0xFBAA: (0x006F,),
+    0xFBAB: (0x006F,),
+    0xFBAC: (0x006F,),
+    0xFBAD: (0x006F,),
+    0xFBAE: (0x0649,),
+    0xFBAF: (0x0649,),
+    0xFBB0: (0x06D3,),
+    0xFBB1: (0x06D3,),
+    0xFBD3: (0x0643, 0x06DB),
+    0xFBD4: (0x0643, 0x06DB),
+    0xFBD5: (0x0643, 0x06DB),
+    0xFBD6: (0x0643, 0x06DB),
+    0xFBD7: (0x0648, 0x0313),
+    0xFBD8: (0x0648, 0x0313),
+    0xFBD9: (0x0648, 0x0306),
+    0xFBDA: (0x0648, 0x0306),
+    0xFBDB: (0x0648, 0x0670),
+    0xFBDC: (0x0648, 0x0670),
+    0xFBDD: (0x0648, 0x0313, 0x0674),
+    0xFBDE: (0x0648, 0x06DB),
+    0xFBDF: (0x0648, 0x06DB),
+    0xFBE0: (0x06C5,),
+    0xFBE1: (0x06C5,),
+    0xFBE2: (0x0648, 0x0302),
+    0xFBE3: (0x0648, 0x0302),
+    0xFBE4: (0x067B,),
+    0xFBE5: (0x067B,),
+    0xFBE6: (0x067B,),
+    0xFBE7: (0x067B,),
+    0xFBE8: (0x0649,),
+    0xFBE9: (0x0649,),
+    0xFBEA: (0x0649, 0x0674, 0x006C),
+    0xFBEB: (0x0649, 0x0674, 0x006C),
+    0xFBEC: (0x0649, 0x0674, 0x006F),
+    0xFBED: (0x0649, 0x0674, 0x006F),
+    0xFBEE: (0x0649, 0x0674, 0x0648),
+    0xFBEF: (0x0649, 0x0674, 0x0648),
+    0xFBF0: (0x0649, 0x0674, 0x0648, 0x0313),
+    0xFBF1: (0x0649, 0x0674, 0x0648, 0x0313),
+    0xFBF2: (0x0649, 0x0674, 0x0648, 0x0306),
+    0xFBF3: (0x0649, 0x0674, 0x0648, 0x0306),
+    0xFBF4: (0x0649, 0x0674, 0x0648, 0x0670),
+    0xFBF5: (0x0649, 0x0674, 0x0648, 0x0670),
+    0xFBF6: (0x0649, 0x0674, 0x067B),
+    0xFBF7: (0x0649, 0x0674, 0x067B),
+    0xFBF8: (0x0649, 0x0674, 0x067B),
+    0xFBF9: (0x0649, 0x0674, 0x0649),
+    0xFBFA: (0x0649, 0x0674, 0x0649),
+    0xFBFB: (0x0649, 0x0674, 0x0649),
+    0xFBFC: (0x0649,),
+    0xFBFD: (0x0649,),
+    0xFBFE: (0x0649,),
+    0xFBFF: (0x0649,),
+    0xFC00: (0x0649, 0x0674, 0x062C),
+    0xFC01: (0x0649, 0x0674, 0x062D),
+    0xFC02: (0x0649, 0x0674, 0x0645),
+    0xFC03: (0x0649, 0x0674, 0x0649),
+    0xFC04: (0x0649, 0x0674, 0x0649),
+    0xFC05: (0x0628, 0x062C),
+    0xFC06: (0x0628, 0x062D),
+    0xFC07: (0x0628, 0x062E),
+    0xFC08: (0x0628, 0x0645),
+    0xFC09: (0x0628, 0x0649),
+    0xFC0A: (0x0628, 0x0649),
+    0xFC0B: (0x062A, 0x062C),
+    0xFC0C: (0x062A, 0x062D),
+    0xFC0D: (0x062A, 0x062E),
+    0xFC0E: (0x062A, 0x0645),
+    0xFC0F: (0x062A, 0x0649),
+    0xFC10: (0x062A, 0x0649),
+    0xFC11: (0x0649, 0x06DB, 0x062C),
+    0xFC12: (0x0649, 0x06DB, 0x0645),
+    0xFC13: (0x0649, 0x06DB, 0x0649),
+    0xFC14: (0x0649, 0x06DB, 0x0649),
+    0xFC15: (0x062C, 0x062D),
+    0xFC16: (0x062C, 0x0645),
+    0xFC17: (0x062D, 0x062C),
+    0xFC18: (0x062D, 0x0645),
+    0xFC19: (0x062E, 0x062C),
+    0xFC1A: (0x062E, 0x062D),
+    0xFC1B: (0x062E, 0x0645),
+    0xFC1C: (0x0633, 0x062C),
+    0xFC1D: (0x0633, 0x062D),
+    0xFC1E: (0x0633, 0x062E),
+    0xFC1F: (0x0633, 0x0645),
+    0xFC20: (0x0635, 0x062D),
+    0xFC21: (0x0635, 0x0645),
+    0xFC22: (0x0636, 0x062C),
+    0xFC23: (0x0636, 0x062D),
+    0xFC24: (0x0636, 0x062E),
+    0xFC25: (0x0636, 0x0645),
+    0xFC26: (0x0637, 0x062D),
+    0xFC27: (0x0637, 0x0645),
+    0xFC28: (0x0638, 0x0645),
+    0xFC29: (0x0639, 0x062C),
+    0xFC2A: (0x0639, 0x0645),
+    0xFC2B: (0x063A, 0x062C),
+    0xFC2C: (0x063A, 0x0645),
+    0xFC2D: (0x0641, 0x062C),
+    0xFC2E: (0x0641, 0x062D),
+    0xFC2F: (0x0641, 0x062E),
+    0xFC30: (0x0641, 0x0645),
+    0xFC31: (0x0641, 0x0649),
+    0xFC32: (0x0641, 0x0649),
+    0xFC33: (0x0642, 0x062D),
+    0xFC34: (0x0642, 0x0645),
+    0xFC35: (0x0642, 0x0649),
+    0xFC36: (0x0642, 0x0649),
+    0xFC37: (0x0643, 0x006C),
+    0xFC38: (0x0643, 0x062C),
+    0xFC39: (0x0643, 0x062D),
+    0xFC3A: (0x0643, 0x062E),
+    0xFC3B: (0x0643, 0x0644),
+    0xFC3C: (0x0643, 0x0645),
+    0xFC3D: (0x0643, 0x0649),
+    0xFC3E: (0x0643, 0x0649),
+    0xFC3F: (0x0644, 0x062C),
+    0xFC40: (0x0644, 0x062D),
+    0xFC41: (0x0644, 0x062E),
+    0xFC42: (0x0644, 0x0645),
+    0xFC43: (0x0644, 0x0649),
+    0xFC44: (0x0644, 0x0649),
+    0xFC45: (0x0645, 0x062C),
+    0xFC46: (0x0645, 0x062D),
+    0xFC47: (0x0645, 0x062E),
+    0xFC48: (0x0645, 0x0645),
+    0xFC49: (0x0645, 0x0649),
+    0xFC4A: (0x0645, 0x0649),
+    0xFC4B: (0x0628, 0x062E),
+    0xFC4C: (0x0646, 0x062D),
+    0xFC4D: (0x0646, 0x062E),
+    0xFC4E: (0x0646, 0x0645),
+    0xFC4F: (0x0646, 0x0649),
+    0xFC50: (0x0646, 0x0649),
+    0xFC51: (0x006F, 0x062C),
+    0xFC52: (0x006F, 0x0645),
+    0xFC53: (0x006F, 0x0649),
+    0xFC54: (0x006F, 0x0649),
+    0xFC55: (0x0649, 0x062C),
+    0xFC56: (0x0649, 0x062D),
+    0xFC57: (0x0649, 0x062E),
+    0xFC58: (0x0649, 0x0645),
+    0xFC59: (0x0649, 0x0649),
+    0xFC5A: (0x0649, 0x0649),
+    0xFC5B: (0x0630, 0x0670),
+    0xFC5C: (0x0631, 0x0670),
+    0xFC5D: (0x0649, 0x0670),
+    0xFC5E: (0xFE72, 0x0651),
+    0xFC5F: (0xFE74, 0x0651),
+    0xFC60: (0xFE76, 0x0651),
+    0xFC61: (0xFE78, 0x0651),
+    0xFC62: (0xFE7A, 0x0651),
+    0xFC63: (0xFE7C, 0x0670),
+    0xFC64: (0x0649, 0x0674, 0x0631),
+    0xFC65: (0x0649, 0x0674, 0x0632),
+    0xFC66: (0x0649, 0x0674, 0x0645),
+    0xFC67: (0x0649, 0x0674, 0x0646),
+    0xFC68: (0x0649, 0x0674, 0x0649),
+    0xFC69: (0x0649, 0x0674, 0x0649),
+    0xFC6A: (0x0628, 0x0631),
+    0xFC6B: (0x0628, 0x0632),
+    0xFC6C: (0x0628, 0x0645),
+    0xFC6D: (0x0628, 0x0646),
+    0xFC6E: (0x0628, 0x0649),
+    0xFC6F: (0x0628, 0x0649),
+    0xFC70: (0x062A, 0x0631),
+    0xFC71: (0x062A, 0x0632),
+    0xFC72: (0x062A, 0x0645),
+    0xFC73: (0x062A, 0x0646),
+    0xFC74: (0x062A, 0x0649),
+    0xFC75: (0x062A, 0x0649),
+    0xFC76: (0x0649, 0x06DB, 0x0631),
+    0xFC77: (0x0649, 0x06DB, 0x0632),
+    0xFC78: (0x0649, 0x06DB, 0x0645),
+    0xFC79: (0x0649, 0x06DB, 0x0646),
+    0xFC7A: (0x0649, 0x06DB, 0x0649),
+    0xFC7B: (0x0649, 0x06DB, 0x0649),
+    0xFC7C: (0x0641, 0x0649),
+    0xFC7D: (0x0641, 0x0649),
+    0xFC7E: (0x0642, 0x0649),
+    0xFC7F: (0x0642, 0x0649),
+    0xFC80: (0x0643, 0x006C),
+    0xFC81: (0x0643, 0x0644),
+    0xFC82: (0x0643, 0x0645),
+    0xFC83: (0x0643, 0x0649),
+    0xFC84: (0x0643, 0x0649),
+    0xFC85: (0x0644, 0x0645),
+    0xFC86: (0x0644, 0x0649),
+    0xFC87: (0x0644, 0x0649),
+    0xFC88: (0x0645, 0x006C),
+    0xFC89: (0x0645, 0x0645),
+    0xFC8A: (0x0646, 0x0631),
+    0xFC8B: (0x0646, 0x0632),
+    0xFC8C: (0x0646, 0x0645),
+    0xFC8D: (0x0646, 0x0646),
+    0xFC8E: (0x0646, 0x0649),
+    0xFC8F: (0x0646, 0x0649),
+    0xFC90: (0x0649, 0x0670),
+    0xFC91: (0x0649, 0x0631),
+    0xFC92: (0x0649, 0x0632),
+    0xFC93: (0x0649, 0x0645),
+    0xFC94: (0x0649, 0x0646),
+    0xFC95: (0x0649, 0x0649),
+    0xFC96: (0x0649, 0x0649),
+    0xFC97: (0x0649, 0x0674, 0x062C),
+    0xFC98: (0x0649, 0x0674, 0x062D),
+    0xFC99: (0x0649, 0x0674, 0x062E),
+    0xFC9A: (0x0649, 0x0674, 0x0645),
+    0xFC9B: (0x0649, 0x0674, 0x006F),
+    0xFC9C: (0x0628, 0x062C),
+    0xFC9D: (0x0628, 0x062D),
+    0xFC9E: (0x0628, 0x062E),
+    0xFC9F: (0x0628, 0x0645),
+    0xFCA0: (0x0628, 0x006F),
+    0xFCA1: (0x062A, 0x062C),
+    0xFCA2: (0x062A, 0x062D),
+    0xFCA3: (0x062A, 0x062E),
+    0xFCA4: (0x062A, 0x0645),
+    0xFCA5: (0x062A, 0x006F),
+    0xFCA6: (0x0649, 0x06DB, 0x0645),
+    0xFCA7: (0x062C, 0x062D),
+    0xFCA8: (0x062C, 0x0645),
+    0xFCA9: (0x062D, 0x062C),
+    0xFCAA: (0x062D, 0x0645),
+    0xFCAB: (0x062E, 0x062C),
+    0xFCAC: (0x062E, 0x0645),
+    0xFCAD: (0x0633, 0x062C),
+    0xFCAE: (0x0633, 0x062D),
+    0xFCAF: (0x0633, 0x062E),
+    0xFCB0: (0x0633, 0x0645),
+    0xFCB1: (0x0635, 0x062D),
+    0xFCB2: (0x0635, 0x062E),
+    0xFCB3: (0x0635, 0x0645),
+    0xFCB4: (0x0636, 0x062C),
+    0xFCB5: (0x0636, 0x062D),
+    0xFCB6: (0x0636, 0x062E),
+    0xFCB7: (0x0636, 0x0645),
+    0xFCB8: (0x0637, 0x062D),
+    0xFCB9: (0x0638, 0x0645),
+    0xFCBA: (0x0639, 0x062C),
+    0xFCBB: (0x0639, 0x0645),
+    0xFCBC: (0x063A, 0x062C),
+    0xFCBD: (0x063A, 0x0645),
+    0xFCBE: (0x0641, 0x062C),
+    0xFCBF: (0x0641, 0x062D),
+    0xFCC0: (0x0641, 0x062E),
+    0xFCC1: (0x0641, 0x0645),
+    0xFCC2: (0x0642, 0x062D),
+    0xFCC3: (0x0642, 0x0645),
+    0xFCC4: (0x0643, 0x062C),
+    0xFCC5: (0x0643, 0x062D),
+    0xFCC6: (0x0643, 0x062E),
+    0xFCC7: (0x0643, 0x0644),
+    0xFCC8: (0x0643, 0x0645),
+    0xFCC9: (0x0644, 0x062C),
+    0xFCCA: (0x0644, 0x062D),
+    0xFCCB: (0x0644, 0x062E),
+    0xFCCC: (0x0644, 0x0645),
+    0xFCCD: (0x0644, 0x006F),
+    0xFCCE: (0x0645, 0x062C),
+    0xFCCF: (0x0645, 0x062D),
+    0xFCD0: (0x0645, 0x062E),
+    0xFCD1: (0x0645, 0x0645),
+    0xFCD2: (0x0628, 0x062E),
+    0xFCD3: (0x0646, 0x062D),
+    0xFCD4: (0x0646, 0x062E),
+    0xFCD5: (0x0646, 0x0645),
+    0xFCD6: (0x0646, 0x006F),
+    0xFCD7: (0x006F, 0x062C),
+    0xFCD8: (0x006F, 0x0645),
+    0xFCD9: (0x006F, 0x0670),
+    0xFCDA: (0x0649, 0x062C),
+    0xFCDB: (0x0649, 0x062D),
+    0xFCDC: (0x0649, 0x062E),
+    0xFCDD: (0x0649, 0x0645),
+    0xFCDE: (0x0649, 0x006F),
+    0xFCDF: (0x0649, 0x0674, 0x0645),
+    0xFCE0: (0x0649, 0x0674, 0x006F),
+    0xFCE1: (0x0628, 0x0645),
+    0xFCE2: (0x0628, 0x006F),
+    0xFCE3: (0x062A, 0x0645),
+    0xFCE4: (0x062A, 0x006F),
+    0xFCE5: (0x0649, 0x06DB, 0x0645),
+    0xFCE6: (0x0649, 0x06DB, 0x006F),
+    0xFCE7: (0x0633, 0x0645),
+    0xFCE8: (0x0633, 0x006F),
+    0xFCE9: (0x0633, 0x06DB, 0x0645),
+    0xFCEA: (0x0633, 0x06DB, 0x006F),
+    0xFCEB: (0x0643, 0x0644),
+    0xFCEC: (0x0643, 0x0645),
+    0xFCED: (0x0644, 0x0645),
+    0xFCEE: (0x0646, 0x0645),
+    0xFCEF: (0x0646, 0x006F),
+    0xFCF0: (0x0649, 0x0645),
+    0xFCF1: (0x0649, 0x006F),
+    0xFCF2: (0xFE77, 0x0651),
+    0xFCF3: (0xFE79, 0x0651),
+    0xFCF4: (0xFE7B, 0x0651),
+    0xFCF5: (0x0637, 0x0649),
+    0xFCF6: (0x0637, 0x0649),
+    0xFCF7: (0x0639, 0x0649),
+    0xFCF8: (0x0639, 0x0649),
+    0xFCF9: (0x063A, 0x0649),
+    0xFCFA: (0x063A, 0x0649),
+    0xFCFB: (0x0633, 0x0649),
+    0xFCFC: (0x0633, 0x0649),
+    0xFCFD: (0x0633, 0x06DB, 0x0649),
+    0xFCFE: (0x0633, 0x06DB, 0x0649),
+    0xFCFF: (0x062D, 0x0649),
+    0xFD00: (0x062D, 0x0649),
+    0xFD01: (0x062C, 0x0649),
+    0xFD02: (0x062C, 0x0649),
+    0xFD03: (0x062E, 0x0649),
+    0xFD04: (0x062E, 0x0649),
+    0xFD05: (0x0635, 0x0649),
+    0xFD06: (0x0635, 0x0649),
+    0xFD07: (0x0636, 0x0649),
+    0xFD08: (0x0636, 0x0649),
+    0xFD09: (0x0633, 0x06DB, 0x062C),
+    0xFD0A: (0x0633, 0x06DB, 0x062D),
+    0xFD0B: (0x0633, 0x06DB, 0x062E),
+    0xFD0C: (0x0633, 0x06DB, 0x0645),
+    0xFD0D: (0x0633, 0x06DB, 0x0631),
+    0xFD0E: (0x0633, 0x0631),
+    0xFD0F: (0x0635, 0x0631),
+    0xFD10: (0x0636, 0x0631),
+    0xFD11: (0x0637, 0x0649),
+    0xFD12: (0x0637, 0x0649),
+    0xFD13: (0x0639, 0x0649),
+    0xFD14: (0x0639, 0x0649),
+    0xFD15: (0x063A, 0x0649),
+    0xFD16: (0x063A, 0x0649),
+    0xFD17: (0x0633, 0x0649),
+    0xFD18: (0x0633, 0x0649),
+    0xFD19: (0x0633, 0x06DB, 0x0649),
+    0xFD1A: (0x0633, 0x06DB, 0x0649),
+    0xFD1B: (0x062D, 0x0649),
+    0xFD1C: (0x062D, 0x0649),
+    0xFD1D: (0x062C, 0x0649),
+    0xFD1E: (0x062C, 0x0649),
+    0xFD1F: (0x062E, 0x0649),
+    0xFD20: (0x062E, 0x0649),
+    0xFD21: (0x0635, 0x0649),
+    0xFD22: (0x0635, 0x0649),
+    0xFD23: (0x0636, 0x0649),
+    0xFD24: (0x0636, 0x0649),
+    0xFD25: (0x0633, 0x06DB, 0x062C),
+    0xFD26: (0x0633, 0x06DB, 0x062D),
+    0xFD27: (0x0633, 0x06DB, 0x062E),
+    0xFD28: (0x0633, 0x06DB, 0x0645),
+    0xFD29: (0x0633, 0x06DB, 0x0631),
+    0xFD2A: (0x0633, 0x0631),
+    0xFD2B: (0x0635, 0x0631),
+    0xFD2C: (0x0636, 0x0631),
+    0xFD2D: (0x0633, 0x06DB, 0x062C),
+    0xFD2E: (0x0633, 0x06DB, 0x062D),
+    0xFD2F: (0x0633, 0x06DB, 0x062E),
+    0xFD30: (0x0633, 0x06DB, 0x0645),
+    0xFD31: (0x0633, 0x006F),
+    0xFD32: (0x0633, 0x06DB, 0x006F),
+    0xFD33: (0x0637, 0x0645),
+    0xFD34: (0x0633, 0x062C),
+    0xFD35: (0x0633, 0x062D),
+    0xFD36: (0x0633, 0x062E),
+    0xFD37: (0x0633, 0x06DB, 0x062C),
+    0xFD38: (0x0633, 0x06DB, 0x062D),
+    0xFD39: (0x0633, 0x06DB, 0x062E),
+    0xFD3A: (0x0637, 0x0645),
+    0xFD3B: (0x0638, 0x0645),
+    0xFD3C: (0x006C, 0x030B),
+    0xFD3D: (0x006C, 0x030B),
+    0xFD3E: (0x0028,),
+    0xFD3F: (0x0029,),
+    0xFD50: (0x062A, 0x062C, 0x0645),
+    0xFD51: (0x062A, 0x062D, 0x062C),
+    0xFD52: (0x062A, 0x062D, 0x062C),
+    0xFD53: (0x062A, 0x062D, 0x0645),
+    0xFD54: (0x062A, 0x062E, 0x0645),
+    0xFD55: (0x062A, 0x0645, 0x062C),
+    0xFD56: (0x062A, 0x0645, 0x062D),
+    0xFD57: (0x062A, 0x0645, 0x062E),
+    0xFD58: (0x062C, 0x0645, 0x062D),
+    0xFD59: (0x062C, 0x0645, 0x062D),
+    0xFD5A: (0x062D, 0x0645, 0x0649),
+    0xFD5B: (0x062D, 0x0645, 0x0649),
+    0xFD5C: (0x0633, 0x062D, 0x062C),
+    0xFD5D: (0x0633, 0x062C, 0x062D),
+    0xFD5E: (0x0633, 0x062C, 0x0649),
+    0xFD5F: (0x0633, 0x0645, 0x062D),
+    0xFD60: (0x0633, 0x0645, 0x062D),
+    0xFD61: (0x0633, 0x0645, 0x062C),
+    0xFD62: (0x0633, 0x0645, 0x0645),
+    0xFD63: (0x0633, 0x0645, 0x0645),
+    0xFD64: (0x0635, 0x062D, 0x062D),
+    0xFD65: (0x0635, 0x062D, 0x062D),
+    0xFD66: (0x0635, 0x0645, 0x0645),
+    0xFD67: (0x0633, 0x06DB, 0x062D, 0x0645),
+    0xFD68: (0x0633, 0x06DB, 0x062D, 0x0645),
+    0xFD69: (0x0633, 0x06DB, 0x062C, 0x0649),
+    0xFD6A: (0x0633, 0x06DB, 0x0645, 0x062E),
+    0xFD6B: (0x0633, 0x06DB, 0x0645, 0x062E),
+    0xFD6C: (0x0633, 0x06DB, 0x0645, 0x0645),
+    0xFD6D: (0x0633, 0x06DB, 0x0645, 0x0645),
+    0xFD6E: (0x0636, 0x062D, 0x0649),
+    0xFD6F: (0x0636, 0x062E, 0x0645),
+    0xFD70: (0x0636, 0x062E, 0x0645),
+    0xFD71: (0x0637, 0x0645, 0x062D),
+    0xFD72: (0x0637, 0x0645, 0x062D),
+    0xFD73: (0x0637, 0x0645, 0x0645),
+    0xFD74: (0x0637, 0x0645, 0x0649),
+    0xFD75: (0x0639, 0x062C, 0x0645),
+    0xFD76: (0x0639, 0x0645, 0x0645),
+    0xFD77: (0x0639, 0x0645, 0x0645),
+    0xFD78: (0x0639, 0x0645, 0x0649),
+    0xFD79: (0x063A, 0x0645, 0x0645),
+    0xFD7A: (0x063A, 0x0645, 0x0649),
+    0xFD7B: (0x063A, 0x0645, 0x0649),
+    0xFD7C: (0x0641, 0x062E, 0x0645),
+    0xFD7D: (0x0641, 0x062E, 0x0645),
+    0xFD7E: (0x0642, 0x0645, 0x062D),
+    0xFD7F: (0x0642, 0x0645, 0x0645),
+    0xFD80: (0x0644, 0x062D, 0x0645),
+    0xFD81: (0x0644, 0x062D, 0x0649),
+    0xFD82: (0x0644, 0x062D, 0x0649),
+    0xFD83: (0x0644, 0x062C, 0x062C),
+    0xFD84: (0x0644, 0x062C, 0x062C),
+    0xFD85: (0x0644, 0x062E, 0x0645),
+    0xFD86: (0x0644, 0x062E, 0x0645),
+    0xFD87: (0x0644, 0x0645, 0x062D),
+    0xFD88: (0x0644, 0x0645, 0x062D),
+    0xFD89: (0x0645, 0x062D, 0x062C),
+    0xFD8A: (0x0645, 0x062D, 0x0645),
+    0xFD8B: (0x0645, 0x062D, 0x0649),
+    0xFD8C: (0x0645, 0x062C, 0x062D),
+    0xFD8D: (0x0645, 0x062C, 0x0645),
+    0xFD8E: (0x0645, 0x062E, 0x062C),
+    0xFD8F: (0x0645, 0x062E, 0x0645),
+    0xFD92: (0x0645, 0x062C, 0x062E),
+    0xFD93: (0x006F, 0x0645, 0x062C),
+    0xFD94: (0x006F, 0x0645, 0x0645),
+    0xFD95: (0x0646, 0x062D, 0x0645),
+    0xFD96: (0x0646, 0x062D, 0x0649),
+    0xFD97: (0x0646, 0x062C, 0x0645),
+    0xFD98: (0x0646, 0x062C, 0x0645),
+    0xFD99: (0x0646, 0x062C, 0x0649),
+    0xFD9A: (0x0646, 0x0645, 0x0649),
+    0xFD9B: (0x0646, 0x0645, 0x0649),
+    0xFD9C: (0x0649, 0x0645, 0x0645),
+    0xFD9D: (0x0649, 0x0645, 0x0645),
+    0xFD9E: (0x0628, 0x062E, 0x0649),
+    0xFD9F: (0x062A, 0x062C, 0x0649),
+    0xFDA0: (0x062A, 0x062C, 0x0649),
+    0xFDA1: (0x062A, 0x062E, 0x0649),
+    0xFDA2: (0x062A, 0x062E, 0x0649),
+    0xFDA3: (0x062A, 0x0645, 0x0649),
+    0xFDA4: (0x062A, 0x0645, 0x0649),
+    0xFDA5: (0x062C, 0x0645, 0x0649),
+    0xFDA6: (0x062C, 0x062D, 0x0649),
+    0xFDA7: (0x062C, 0x0645, 0x0649),
+    0xFDA8: (0x0633, 0x062E, 0x0649),
+    0xFDA9: (0x0635, 0x062D, 0x0649),
+    0xFDAA: (0x0633, 0x06DB, 0x062D, 0x0649),
+    0xFDAB: (0x0636, 0x062D, 0x0649),
+    0xFDAC: (0x0644, 0x062C, 0x0649),
+    0xFDAD: (0x0644, 0x0645, 0x0649),
+    0xFDAE: (0x0649, 0x062D, 0x0649),
+    0xFDAF: (0x0649, 0x062C, 0x0649),
+    0xFDB0: (0x0649, 0x0645, 0x0649),
+    0xFDB1: (0x0645, 0x0645, 0x0649),
+    0xFDB2: (0x0642, 0x0645, 0x0649),
+    0xFDB3: (0x0646, 0x062D, 0x0649),
+    0xFDB4: (0x0642, 0x0645, 0x062D),
+    0xFDB5: (0x0644, 0x062D, 0x0645),
+    0xFDB6: (0x0639, 0x0645, 0x0649),
+    0xFDB7: (0x0643, 0x0645, 0x0649),
+    0xFDB8: (0x0646, 0x062C, 0x062D),
+    0xFDB9: (0x0645, 0x062E, 0x0649),
+    0xFDBA: (0x0644, 0x062C, 0x0645),
+    0xFDBB: (0x0643, 0x0645, 0x0645),
+    0xFDBC: (0x0644, 0x062C, 0x0645),
+    0xFDBD: (0x0646, 0x062C, 0x062D),
+    0xFDBE: (0x062C, 0x062D, 0x0649),
+    0xFDBF: (0x062D, 0x062C, 0x0649),
+    0xFDC0: (0x0645, 0x062C, 0x0649),
+    0xFDC1: (0x0641, 0x0645, 0x0649),
+    0xFDC2: (0x0628, 0x062D, 0x0649),
+    0xFDC3: (0x0643, 0x0645, 0x0645),
+    0xFDC4: (0x0639, 0x062C, 0x0645),
+    0xFDC5: (0x0635, 0x0645, 0x0645),
+    0xFDC6: (0x0633, 0x062E, 0x0649),
+    0xFDC7: (0x0646, 0x062C, 0x0649),
+    0xFDF0: (0x0635, 0x0644, 0x0649),
+    0xFDF1: (0x0642, 0x0644, 0x0649),
+    0xFDF2: (0x006C, 0x0644, 0x0644, 0x0651, 0x0670, 0x006F),
+    0xFDF3: (0x006C, 0x0643, 0x0628, 0x0631),
+    0xFDF4: (0x0645, 0x062D, 0x0645, 0x062F),
+    0xFDF5: (0x0635, 0x0644, 0x0639, 0x0645),
+    0xFDF6: (0x0631, 0x0633, 0x0648, 0x0644),
+    0xFDF7: (0x0639, 0x0644, 0x0649, 0x006F),
+    0xFDF8: (0x0648, 0x0633, 0x0644, 0x0645),
+    0xFDF9: (0x0635, 0x0644, 0x0649),
+    0xFDFA: (0x0635, 0x0644, 0x0649, 0x0020, 0x006C, 0x0644, 0x0644, 0x006F, 0x0020, 0x0639, 0x0644, 0x0649, 0x006F, 0x0020, 0x0648, 0x0633, 0x0644, 0x0645),
+    0xFDFB: (0x062C, 0x0644, 0x0020, 0x062C, 0x0644, 0x006C, 0x0644, 0x006F),
+    0xFDFC: (0x0631, 0x0649, 0x006C, 0x0644),
+    0xFE19: (0x2D57,),
+    0xFE30: (0x003A,),
+    0xFE31: (0x2502,),
+    0xFE34: (0x2307,),
+    0xFE35: (0x23DC,),
+    0xFE36: (0x23DD,),
+    0xFE37: (0x23DE,),
+    0xFE38: (0x23DF,),
+    0xFE39: (0x23E0,),
+    0xFE3A: (0x23E1,),
+    0xFE49: (0x02C9,),
+    0xFE4A: (0x02C9,),
+    0xFE4B: (0x02C9,),
+    0xFE4C: (0x02C9,),
+    0xFE4D: (0x005F,),
+    0xFE4E: (0x005F,),
+    0xFE4F: (0x005F,),
+    0xFE58: (0x002D,),
+    0xFE68: (0x005C,),
+    0xFE80: (0x0621,),
+    0xFE81: (0x0622,),
+    0xFE82: (0x0622,),
+    0xFE83: (0x006C, 0x0674),
+    0xFE84: (0x006C, 0x0674),
+    0xFE85: (0x0648, 0x0674),
+    0xFE86: (0x0648, 0x0674),
+    0xFE87: (0x006C, 0x0655),
+    0xFE88: (0x006C, 0x0655),
+    0xFE89: (0x0649, 0x0674),
+    0xFE8A: (0x0649, 0x0674),
+    0xFE8B: (0x0649, 0x0674),
+    0xFE8C: (0x0649, 0x0674),
+    0xFE8D: (0x006C,),
+    0xFE8E: (0x006C,),
+    0xFE8F: (0x0628,),
+    0xFE90: (0x0628,),
+    0xFE91: (0x0628,),
+    0xFE92: (0x0628,),
+    0xFE93: (0x0629,),
+    0xFE94: (0x0629,),
+    0xFE95: (0x062A,),
+    0xFE96: (0x062A,),
+    0xFE97: (0x062A,),
+    0xFE98: (0x062A,),
+    0xFE99: (0x0649, 0x06DB),
+    0xFE9A: (0x0649, 0x06DB),
+    0xFE9B: (0x0649, 0x06DB),
+    0xFE9C: (0x0649, 0x06DB),
+    0xFE9D: (0x062C,),
+    0xFE9E: (0x062C,),
+    0xFE9F: (0x062C,),
+    0xFEA0: (0x062C,),
+    0xFEA1: (0x062D,),
+    0xFEA2: (0x062D,),
+    0xFEA3: (0x062D,),
+    0xFEA4: (0x062D,),
+    0xFEA5: (0x062E,),
+    0xFEA6: (0x062E,),
+    0xFEA7: (0x062E,),
+    0xFEA8: (0x062E,),
+    0xFEA9: (0x062F,),
+    0xFEAA: (0x062F,),
+    0xFEAB: (0x0630,),
+    0xFEAC: (0x0630,),
+    0xFEAD: (0x0631,),
+    0xFEAE: (0x0631,),
+    0xFEAF: (0x0632,),
+    0xFEB0: (0x0632,),
+    0xFEB1: (0x0633,),
+    0xFEB2: (0x0633,),
+    0xFEB3: (0x0633,),
+    0xFEB4: (0x0633,),
+    0xFEB5: (0x0633, 0x06DB),
+    0xFEB6: (0x0633, 0x06DB),
+    0xFEB7: (0x0633, 0x06DB),
+    0xFEB8: (0x0633, 0x06DB),
+    0xFEB9: (0x0635,),
+    0xFEBA: (0x0635,),
+    0xFEBB: (0x0635,),
+    0xFEBC: (0x0635,),
+    0xFEBD: (0x0636,),
+    0xFEBE: (0x0636,),
+    0xFEBF: (0x0636,),
+    0xFEC0: (0x0636,),
+    0xFEC1: (0x0637,),
+    0xFEC2: (0x0637,),
+    0xFEC3: (0x0637,),
+    0xFEC4: (0x0637,),
+    0xFEC5: (0x0638,),
+    0xFEC6: (0x0638,),
+    0xFEC7: (0x0638,),
+    0xFEC8: (0x0638,),
+    0xFEC9: (0x0639,),
+    0xFECA: (0x0639,),
+    0xFECB: (0x0639,),
+    0xFECC: (0x0639,),
+    0xFECD: (0x063A,),
+    0xFECE: (0x063A,),
+    0xFECF: (0x063A,),
+    0xFED0: (0x063A,),
+    0xFED1: (0x0641,),
+    0xFED2: (0x0641,),
+    0xFED3: (0x0641,),
+    0xFED4: (0x0641,),
+    0xFED5: (0x0642,),
+    0xFED6: (0x0642,),
+    0xFED7: (0x0642,),
+    0xFED8: (0x0642,),
+    0xFED9: (0x0643,),
+    0xFEDA: (0x0643,),
+    0xFEDB: (0x0643,),
+    0xFEDC: (0x0643,),
+    0xFEDD: (0x0644,),
+    0xFEDE: (0x0644,),
+    0xFEDF: (0x0644,),
+    0xFEE0: (0x0644,),
+    0xFEE1: (0x0645,),
+    0xFEE2: (0x0645,),
+    0xFEE3: (0x0645,),
+    0xFEE4: (0x0645,),
+    0xFEE5: (0x0646,),
+    0xFEE6: (0x0646,),
+    0xFEE7: (0x0646,),
+    0xFEE8: (0x0646,),
+    0xFEE9: (0x006F,),
+    0xFEEA: (0x006F,),
+    0xFEEB: (0x006F,),
+    0xFEEC: (0x006F,),
+    0xFEED: (0x0648,),
+    0xFEEE: (0x0648,),
+    0xFEEF: (0x0649,),
+    0xFEF0: (0x0649,),
+    0xFEF1: (0x0649,),
+    0xFEF2: (0x0649,),
+    0xFEF3: (0x0649,),
+    0xFEF4: (0x0649,),
+    0xFEF5: (0x0644, 0x0622),
+    0xFEF6: (0x0644, 0x0622),
+    0xFEF7: (0x0644, 0x006C, 0x0674),
+    0xFEF8: (0x0644, 0x006C, 0x0674),
+    0xFEF9: (0x0644, 0x006C, 0x0655),
+    0xFEFA: (0x0644, 0x006C, 0x0655),
+    0xFEFB: (0x0644, 0x006C),
+    0xFEFC: (0x0644, 0x006C),
+    0xFF01: (0x0021,),
+    0xFF02: (0x0027, 0x0027),
+    0xFF07: (0x0027,),
+    0xFF0D: (0x30FC,),
+    0xFF1A: (0x003A,),
+    0xFF21: (0x0041,),
+    0xFF22: (0x0042,),
+    0xFF23: (0x0043,),
+    0xFF25: (0x0045,),
+    0xFF28: (0x0048,),
+    0xFF29: (0x006C,),
+    0xFF2A: (0x004A,),
+    0xFF2B: (0x004B,),
+    0xFF2D: (0x004D,),
+    0xFF2E: (0x004E,),
+    0xFF2F: (0x004F,),
+    0xFF30: (0x0050,),
+    0xFF33: (0x0053,),
+    0xFF34: (0x0054,),
+    0xFF38: (0x0058,),
+    0xFF39: (0x0059,),
+    0xFF3A: (0x005A,),
+    0xFF3B: (0x0028,),
+    0xFF3C: (0x005C,),
+    0xFF3D: (0x0029,),
+    0xFF3E: (0xFE3F,),
+    0xFF40: (0x0027,),
+    0xFF41: (0x0061,),
+    0xFF43: (0x0063,),
+    0xFF45: (0x0065,),
+    0xFF47: (0x0067,),
+    0xFF48: (0x0068,),
+    0xFF49: (0x0069,),
+    0xFF4A: (0x006A,),
+    0xFF4C: (0x006C,),
+    0xFF4F: (0x006F,),
+    0xFF50: (0x0070,),
+    0xFF53: (0x0073,),
+    0xFF56: (0x0076,),
+    0xFF58: (0x0078,),
+    0xFF59: (0x0079,),
+    0xFF5C: (0x2502,),
+    0xFF5E: (0x301C,),
+    0xFF65: (0x00B7,),
+    0xFFE3: (0x02C9,),
+    0xFFE8: (0x006C,),
+    0xFFED: (0x25AA,),
+    0x10101: (0x00B7,),
+    0x10282: (0x0042,),
+    0x10285: (0x0394,),
+    0x10286: (0x0045,),
+    0x10287: (0x0046,),
+    0x1028A: (0x006C,),
+    0x1028D: (0x0245,),
+    0x10290: (0x0058,),
+    0x10292: (0x004F,),
+    0x10294: (0x16DC,),
+    0x10295: (0x0050,),
+    0x10296: (0x0053,),
+    0x10297: (0x0054,),
+    0x1029B: (0x002B,),
+    0x102A0: (0x0041,),
+    0x102A1: (0x0042,),
+    0x102A2: (0x0043,),
+    0x102A3: (0x0394,),
+    0x102A5: (0x0046,),
+    0x102AB: (0x004F,),
+    0x102AD: (0x03D8,),
+    0x102B0: (0x004D,),
+    0x102B1: (0x0054,),
+    0x102B2: (0x0059,),
+    0x102B3: (0x03A6,),
+    0x102B4: (0x0058,),
+    0x102B5: (0x03A8,),
+    0x102B6: (0x03A9,),
+    0x102B8: (0x2D40,),
+    0x102CF: (0x0048,),
+    0x102E1: (0x062F,),
+    0x102E4: (0x0648,),
+    0x102E8: (0x0637,),
+    0x102F2: (0x0635,),
+    0x102F5: (0x005A,),
+    0x10301: (0x0042,),
+    0x10302: (0x0043,),
+    0x10309: (0x006C,),
+    0x10311: (0x004D,),
+    0x10312: (0x03D8,),
+    0x10315: (0x0054,),
+    0x10317: (0x0058,),
+    0x1031A: (0x0038,),
+    0x1031F: (0x002A,),
+    0x10320: (0x006C,),
+    0x10322: (0x0058,),
+    0x103D1: (0x10382,),
+    0x103D3: (0x10393,),
+    0x10401: (0x0190,),
+    0x10404: (0x004F,),
+    0x10411: (0xA4F6,),
+    0x10415: (0x0043,),
+    0x1041B: (0x004C,),
+    0x1041F: (0x2C70,),
+    0x10420: (0x0053,),
+    0x10423: (0x0186,),
+    0x10425: (0x0418,),
+    0x10429: (0xA793,),
+    0x1042A: (0x029A,),
+    0x1042C: (0x006F,),
+    0x1043D: (0x0063,),
+    0x1043F: (0x0277,),
+    0x10442: (0x025E,),
+    0x10443: (0x029F,),
+    0x10448: (0x0073,),
+    0x1044B: (0x0254,),
+    0x1044D: (0x1D0E,),
+    0x104A0: (0x10486,),
+    0x10513: (0x004E,),
+    0x10516: (0x004F,),
+    0x10518: (0x004B,),
+    0x1051C: (0x0043,),
+    0x1051D: (0x0056,),
+    0x10525: (0x0046,),
+    0x10526: (0x004C,),
+    0x10527: (0x0058,),
+    0x10A3A: (0x0323,),
+    0x10A50: (0x002E,),
+    0x10A57: (0x10A56, 0x10A56),
+    0x110BB: (0x0970,),
+    0x111C7: (0x0970,),
+    0x111CA: (0x0323,),
+    0x111CB: (0x093A,),
+    0x111DB: (0xA8FC,),
+    0x111DC: (0xA8FB,),
+    0x111DE: (0x2248,),
+    0x11300: (0x030A,),
+    0x11413: (0x11434, 0x11442, 0x11412),
+    0x11419: (0x11434, 0x11442, 0x11418),
+    0x11424: (0x11434, 0x11442, 0x11423),
+    0x1142A: (0x11434, 0x11442, 0x11429),
+    0x1142D: (0x11434, 0x11442, 0x1142C),
+    0x1142F: (0x11434, 0x11442, 0x1142E),
+    0x11492: (0x0998,),
+    0x11494: (0x099A,),
+    0x11496: (0x099C,),
+    0x11498: (0x099E,),
+    0x11499: (0x099F,),
+    0x1149B: (0x09A1,),
+    0x1149D: (0x09B2,),
+    0x1149E: (0x09A4,),
+    0x1149F: (0x09A5,),
+    0x114A0: (0x09A6,),
+    0x114A1: (0x09A7,),
+    0x114A2: (0x09A8,),
+    0x114A3: (0x09AA,),
+    0x114A7: (0x09AE,),
+    0x114A8: (0x09AF,),
+    0x114A9: (0x09AC,),
+    0x114AA: (0x09A3,),
+    0x114AB: (0x09B0,),
+    0x114AD: (0x09B7,),
+    0x114AE: (0x09B8,),
+    0x114B0: (0x09BE,),
+    0x114B1: (0x09BF,),
+    0x114B9: (0x09C7,),
+    0x114BC: (0x09CB,),
+    0x114BD: (0x09D7,),
+    0x114BE: (0x09CC,),
+    0x114BF: (0x0306, 0x0307),
+    0x114C1: (0x0983,),
+    0x114C2: (0x09CD,),
+    0x114C3: (0x0323,),
+    0x114C4: (0x09BD,),
+    0x114C5: (0x0076, 0x0076, 0x0307),
+    0x114D0: (0x004F,),
+    0x114D1: (0x09E7,),
+    0x114D2: (0x09E8,),
+    0x114D6: (0x09EC,),
+    0x115D8: (0x11582,),
+    0x115D9: (0x11582,),
+    0x115DA: (0x11583,),
+    0x115DB: (0x11584,),
+    0x115DC: (0x115B2,),
+    0x115DD: (0x115B3,),
+    0x11700: (0x0072, 0x006E),
+    0x1170E: (0x0076, 0x0076),
+    0x1170F: (0x0076, 0x0076),
+    0x118A0: (0x0056,),
+    0x118A2: (0x0046,),
+    0x118A3: (0x004C,),
+    0x118A4: (0x0059,),
+    0x118A6: (0x0045,),
+    0x118A8: (0x2207,),
+    0x118A9: (0x005A,),
+    0x118AC: (0x0039,),
+    0x118AE: (0x0045,),
+    0x118AF: (0x0034,),
+    0x118B2: (0x004C,),
+    0x118B5: (0x004F,),
+    0x118B7: (0x16DC,),
+    0x118B8: (0x0055,),
+    0x118BB: (0x0035,),
+    0x118BC: (0x0054,),
+    0x118C0: (0x0076,),
+    0x118C1: (0x0073,),
+    0x118C2: (0x0046,),
+    0x118C3: (0x0069,),
+    0x118C4: (0x007A,),
+    0x118C6: (0x0037,),
+    0x118C8: (0x006F,),
+    0x118CA: (0x0033,),
+    0x118CC: (0x0039,),
+    0x118CE: (0xA793,),
+    0x118D5: (0x0036,),
+    0x118D6: (0x0039,),
+    0x118D7: (0x006F,),
+    0x118D8: (0x0075,),
+    0x118DC: (0x0079,),
+    0x118E0: (0x004F,),
+    0x118E3: (0x0072, 0x006E),
+    0x118E4: (0x0669,),
+    0x118E5: (0x005A,),
+    0x118E6: (0x0057,),
+    0x118E9: (0x0043,),
+    0x118EC: (0x0058,),
+    0x118EF: (0x0057,),
+    0x118F2: (0x0043,),
+    0x12038: (0x1039A,),
+    0x132F9: (0x1099E,),
+    0x1D114: (0x007B,),
+    0x1D16D: (0x002E,),
+    0x1D202: (0x04FE,),
+    0x1D206: (0x0033,),
+    0x1D20B: (0x0418,),
+    0x1D20D: (0x0056,),
+    0x1D20F: (0x005C,),
+    0x1D212: (0x0037,),
+    0x1D213: (0x0046,),
+    0x1D214: (0x102BC,),
+    0x1D215: (0xA4F6,),
+    0x1D216: (0x0052,),
+    0x1D217: (0x2C6F,),
+    0x1D21A: (0x004F, 0x0335),
+    0x1D21B: (0x2144,),
+    0x1D21C: (0xA4D5,),
+    0x1D221: (0x0190,),
+    0x1D222: (0x0460,),
+    0x1D22A: (0x004C,),
+    0x1D22B: (0xA4F6,),
+    0x1D230: (0xA7FB,),
+    0x1D236: (0x003C,),
+    0x1D237: (0x003E,),
+    0x1D238: (0x228F,),
+    0x1D239: (0x2290,),
+    0x1D23A: (0x002F,),
+    0x1D23B: (0x005C,),
+    0x1D23F: (0x16CB,),
+    0x1D245: (0x0548,),
+    0x1D400: (0x0041,),
+    0x1D401: (0x0042,),
+    0x1D402: (0x0043,),
+    0x1D403: (0x0044,),
+    0x1D404: (0x0045,),
+    0x1D405: (0x0046,),
+    0x1D406: (0x0047,),
+    0x1D407: (0x0048,),
+    0x1D408: (0x006C,),
+    0x1D409: (0x004A,),
+    0x1D40A: (0x004B,),
+    0x1D40B: (0x004C,),
+    0x1D40C: (0x004D,),
+    0x1D40D: (0x004E,),
+    0x1D40E: (0x004F,),
+    0x1D40F: (0x0050,),
+    0x1D410: (0x0051,),
+    0x1D411: (0x0052,),
+    0x1D412: (0x0053,),
+    0x1D413: (0x0054,),
+    0x1D414: (0x0055,),
+    0x1D415: (0x0056,),
+    0x1D416: (0x0057,),
+    0x1D417: (0x0058,),
+    0x1D418: (0x0059,),
+    0x1D419: (0x005A,),
+    0x1D41A: (0x0061,),
+    0x1D41B: (0x0062,),
+    0x1D41C: (0x0063,),
+    0x1D41D: (0x0064,),
+    0x1D41E: (0x0065,),
+    0x1D41F: (0x0066,),
+    0x1D420: (0x0067,),
+    0x1D421: (0x0068,),
+    0x1D422: (0x0069,),
+    0x1D423: (0x006A,),
+    0x1D424: (0x006B,),
+    0x1D425: (0x006C,),
+    0x1D426: (0x0072, 0x006E),
+    0x1D427: (0x006E,),
+    0x1D428: (0x006F,),
+    0x1D429: (0x0070,),
+    0x1D42A: (0x0071,),
+    0x1D42B: (0x0072,),
+    0x1D42C: (0x0073,),
+    0x1D42D: (0x0074,),
+    0x1D42E: (0x0075,),
+    0x1D42F: (0x0076,),
+    0x1D430: (0x0076, 0x0076),
+    0x1D431: (0x0078,),
+    0x1D432: (0x0079,),
+    0x1D433: (0x007A,),
+    0x1D434: (0x0041,),
+    0x1D435: (0x0042,),
+    0x1D436: (0x0043,),
+    0x1D437: (0x0044,),
+    0x1D438: (0x0045,),
+    0x1D439: (0x0046,),
+    0x1D43A: (0x0047,),
+    0x1D43B: (0x0048,),
+    0x1D43C: (0x006C,),
+    0x1D43D: (0x004A,),
+    0x1D43E: (0x004B,),
+    0x1D43F: (0x004C,),
+    0x1D440: (0x004D,),
+    0x1D441: (0x004E,),
+    0x1D442: (0x004F,),
+    0x1D443: (0x0050,),
+    0x1D444: (0x0051,),
+    0x1D445: (0x0052,),
+    0x1D446: (0x0053,),
+    0x1D447: (0x0054,),
+    0x1D448: (0x0055,),
+    0x1D449: (0x0056,),
+    0x1D44A: (0x0057,),
+    0x1D44B: (0x0058,),
+    0x1D44C: (0x0059,),
+    0x1D44D: (0x005A,),
+    0x1D44E: (0x0061,),
+    0x1D44F: (0x0062,),
+    0x1D450: (0x0063,),
+    0x1D451: (0x0064,),
+    0x1D452: (0x0065,),
+    0x1D453: (0x0066,),
+    0x1D454: (0x0067,),
+    0x1D456: (0x0069,),
+    0x1D457: (0x006A,),
+    0x1D458: (0x006B,),
+    0x1D459: (0x006C,),
+    0x1D45A: (0x0072, 0x006E),
+    0x1D45B: (0x006E,),
+    0x1D45C: (0x006F,),
+    0x1D45D: (0x0070,),
+    0x1D45E: (0x0071,),
+    0x1D45F: (0x0072,),
+    0x1D460: (0x0073,),
+    0x1D461: (0x0074,),
+    0x1D462: (0x0075,),
+    0x1D463: (0x0076,),
+    0x1D464: (0x0076, 0x0076),
+    0x1D465: (0x0078,),
+    0x1D466: (0x0079,),
+    0x1D467: (0x007A,),
+    0x1D468: (0x0041,),
+    0x1D469: (0x0042,),
+    0x1D46A: (0x0043,),
+    0x1D46B: (0x0044,),
+    0x1D46C: (0x0045,),
+    0x1D46D: (0x0046,),
+    0x1D46E: (0x0047,),
+    0x1D46F: (0x0048,),
+    0x1D470: (0x006C,),
+    0x1D471: (0x004A,),
+    0x1D472: (0x004B,),
+    0x1D473: (0x004C,),
+    0x1D474: (0x004D,),
+    0x1D475: (0x004E,),
+    0x1D476: (0x004F,),
+    0x1D477: (0x0050,),
+    0x1D478: (0x0051,),
+    0x1D479: (0x0052,),
+    0x1D47A: (0x0053,),
+    0x1D47B: (0x0054,),
+    0x1D47C: (0x0055,),
+    0x1D47D: (0x0056,),
+    0x1D47E: (0x0057,),
+    0x1D47F: (0x0058,),
+    0x1D480: (0x0059,),
+    0x1D481: (0x005A,),
+    0x1D482: (0x0061,),
+    0x1D483: (0x0062,),
+    0x1D484: (0x0063,),
+    0x1D485: (0x0064,),
+    0x1D486: (0x0065,),
+    0x1D487: (0x0066,),
+    0x1D488: (0x0067,),
+    0x1D489: (0x0068,),
+    0x1D48A: (0x0069,),
+    0x1D48B: (0x006A,),
+    0x1D48C: (0x006B,),
+    0x1D48D: (0x006C,),
+    0x1D48E: (0x0072, 0x006E),
+    0x1D48F: (0x006E,),
+    0x1D490: (0x006F,),
+    0x1D491: (0x0070,),
+    0x1D492: (0x0071,),
+    0x1D493: (0x0072,),
+    0x1D494: (0x0073,),
+    0x1D495: (0x0074,),
+    0x1D496: (0x0075,),
+    0x1D497: (0x0076,),
+    0x1D498: (0x0076, 0x0076),
+    0x1D499: (0x0078,),
+    0x1D49A: (0x0079,),
+    0x1D49B: (0x007A,),
+    0x1D49C: (0x0041,),
+    0x1D49E: (0x0043,),
+    0x1D49F: (0x0044,),
+    0x1D4A2: (0x0047,),
+    0x1D4A5: (0x004A,),
+    0x1D4A6: (0x004B,),
+    0x1D4A9: (0x004E,),
+    0x1D4AA: (0x004F,),
+    0x1D4AB: (0x0050,),
+    0x1D4AC: (0x0051,),
+    0x1D4AE: (0x0053,),
+    0x1D4AF: (0x0054,),
+    0x1D4B0: (0x0055,),
+    0x1D4B1: (0x0056,),
+    0x1D4B2: (0x0057,),
+    0x1D4B3: (0x0058,),
+    0x1D4B4: (0x0059,),
+    0x1D4B5: (0x005A,),
+    0x1D4B6: (0x0061,),
+    0x1D4B7: (0x0062,),
+    0x1D4B8: (0x0063,),
+    0x1D4B9: (0x0064,),
+    0x1D4BB: (0x0066,),
+    0x1D4BD: (0x0068,),
+    0x1D4BE: (0x0069,),
+    0x1D4BF: (0x006A,),
+    0x1D4C0: (0x006B,),
+    0x1D4C1: (0x006C,),
+    0x1D4C2: (0x0072, 0x006E),
+    0x1D4C3: (0x006E,),
+    0x1D4C5: (0x0070,),
+    0x1D4C6: (0x0071,),
+    0x1D4C7: (0x0072,),
+    0x1D4C8: (0x0073,),
+    0x1D4C9: (0x0074,),
+    0x1D4CA: (0x0075,),
+    0x1D4CB: (0x0076,),
+    0x1D4CC: (0x0076, 0x0076),
+    0x1D4CD: (0x0078,),
+    0x1D4CE: (0x0079,),
+    0x1D4CF: (0x007A,),
+    0x1D4D0: (0x0041,),
+    0x1D4D1: (0x0042,),
+    0x1D4D2: (0x0043,),
+    0x1D4D3: (0x0044,),
+    0x1D4D4: (0x0045,),
+    0x1D4D5: (0x0046,),
+    0x1D4D6: (0x0047,),
+    0x1D4D7: (0x0048,),
+    0x1D4D8: (0x006C,),
+    0x1D4D9: (0x004A,),
+    0x1D4DA: (0x004B,),
+    0x1D4DB: (0x004C,),
+    0x1D4DC: (0x004D,),
+    0x1D4DD: (0x004E,),
+    0x1D4DE: (0x004F,),
+    0x1D4DF: (0x0050,),
+    0x1D4E0: (0x0051,),
+    0x1D4E1: (0x0052,),
+    0x1D4E2: (0x0053,),
+    0x1D4E3: (0x0054,),
+    0x1D4E4: (0x0055,),
+    0x1D4E5: (0x0056,),
+    0x1D4E6: (0x0057,),
+    0x1D4E7: (0x0058,),
+    0x1D4E8: (0x0059,),
+    0x1D4E9: (0x005A,),
+    0x1D4EA: (0x0061,),
+    0x1D4EB: (0x0062,),
+    0x1D4EC: (0x0063,),
+    0x1D4ED: (0x0064,),
+    0x1D4EE: (0x0065,),
+    0x1D4EF: (0x0066,),
+    0x1D4F0: (0x0067,),
+    0x1D4F1: (0x0068,),
+    0x1D4F2: (0x0069,),
+    0x1D4F3: (0x006A,),
+    0x1D4F4: (0x006B,),
+    0x1D4F5: (0x006C,),
+    0x1D4F6: (0x0072, 0x006E),
+    0x1D4F7: (0x006E,),
+    0x1D4F8: (0x006F,),
+    0x1D4F9: (0x0070,),
+    0x1D4FA: (0x0071,),
+    0x1D4FB: (0x0072,),
+    0x1D4FC: (0x0073,),
+    0x1D4FD: (0x0074,),
+    0x1D4FE: (0x0075,),
+    0x1D4FF: (0x0076,),
+    0x1D500: (0x0076, 0x0076),
+    0x1D501: (0x0078,),
+    0x1D502: (0x0079,),
+    0x1D503: (0x007A,),
+    0x1D504: (0x0041,),
+    0x1D505: (0x0042,),
+    0x1D507: (0x0044,),
+    0x1D508: (0x0045,),
+    0x1D509: (0x0046,),
+    0x1D50A: (0x0047,),
+    0x1D50D: (0x004A,),
+    0x1D50E: (0x004B,),
+    0x1D50F: (0x004C,),
+    0x1D510: (0x004D,),
+    0x1D511: (0x004E,),
+    0x1D512: (0x004F,),
+    0x1D513: (0x0050,),
+    0x1D514: (0x0051,),
+    0x1D516: (0x0053,),
+    0x1D517: (0x0054,),
+    0x1D518: (0x0055,),
+    0x1D519: (0x0056,),
+    0x1D51A: (0x0057,),
+    0x1D51B: (0x0058,),
+    0x1D51C: (0x0059,),
+    0x1D51E: (0x0061,),
+    0x1D51F: (0x0062,),
+    0x1D520: (0x0063,),
+    0x1D521: (0x0064,),
+    0x1D522: (0x0065,),
+    0x1D523: (0x0066,),
+    0x1D524: (0x0067,),
+    0x1D525: (0x0068,),
+    0x1D526: (0x0069,),
+    0x1D527: (0x006A,),
+    0x1D528: (0x006B,),
+    0x1D529: (0x006C,),
+    0x1D52A: (0x0072, 0x006E),
+    0x1D52B: (0x006E,),
+    0x1D52C: (0x006F,),
+    0x1D52D: (0x0070,),
+    0x1D52E: (0x0071,),
+    0x1D52F: (0x0072,),
+    0x1D530: (0x0073,),
+    0x1D531: (0x0074,),
+    0x1D532: (0x0075,),
+    0x1D533: (0x0076,),
+    0x1D534: (0x0076, 0x0076),
+    0x1D535: (0x0078,),
+    0x1D536: (0x0079,),
+    0x1D537: (0x007A,),
+    0x1D538: (0x0041,),
+    0x1D539: (0x0042,),
+    0x1D53B: (0x0044,),
+    0x1D53C: (0x0045,),
+    0x1D53D: (0x0046,),
+    0x1D53E: (0x0047,),
+    0x1D540: (0x006C,),
+    0x1D541: (0x004A,),
+    0x1D542: (0x004B,),
+    0x1D543: (0x004C,),
+    0x1D544: (0x004D,),
+    0x1D546: (0x004F,),
+    0x1D54A: (0x0053,),
+    0x1D54B: (0x0054,),
+    0x1D54C: (0x0055,),
+    0x1D54D: (0x0056,),
+    0x1D54E: (0x0057,),
+    0x1D54F: (0x0058,),
+    0x1D550: (0x0059,),
+    0x1D552: (0x0061,),
+    0x1D553: (0x0062,),
+    0x1D554: (0x0063,),
+    0x1D555: (0x0064,),
+    0x1D556: (0x0065,),
+    0x1D557: (0x0066,),
+    0x1D558: (0x0067,),
+    0x1D559: (0x0068,),
+    0x1D55A: (0x0069,),
+    0x1D55B: (0x006A,),
+    0x1D55C: (0x006B,),
+    0x1D55D: (0x006C,),
+    0x1D55E: (0x0072, 0x006E),
+    0x1D55F: (0x006E,),
+    0x1D560: (0x006F,),
+    0x1D561: (0x0070,),
+    0x1D562: (0x0071,),
+    0x1D563: (0x0072,),
+    0x1D564: (0x0073,),
+    0x1D565: (0x0074,),
+    0x1D566: (0x0075,),
+    0x1D567: (0x0076,),
+    0x1D568: (0x0076, 0x0076),
+    0x1D569: (0x0078,),
+    0x1D56A: (0x0079,),
+    0x1D56B: (0x007A,),
+    0x1D56C: (0x0041,),
+    0x1D56D: (0x0042,),
+    0x1D56E: (0x0043,),
+    0x1D56F: (0x0044,),
+    0x1D570: (0x0045,),
+    0x1D571: (0x0046,),
+    0x1D572: (0x0047,),
+    0x1D573: (0x0048,),
+    0x1D574: (0x006C,),
+    0x1D575: (0x004A,),
+    0x1D576: (0x004B,),
+    0x1D577: (0x004C,),
+    0x1D578: (0x004D,),
+    0x1D579: (0x004E,),
+    0x1D57A: (0x004F,),
+    0x1D57B: (0x0050,),
+    0x1D57C: (0x0051,),
+    0x1D57D: (0x0052,),
+    0x1D57E: (0x0053,),
+    0x1D57F: (0x0054,),
+    0x1D580: (0x0055,),
+    0x1D581: (0x0056,),
+    0x1D582: (0x0057,),
+    0x1D583: (0x0058,),
+    0x1D584: (0x0059,),
+    0x1D585: (0x005A,),
+    0x1D586: (0x0061,),
+    0x1D587: (0x0062,),
+    0x1D588: (0x0063,),
+    0x1D589: (0x0064,),
+    0x1D58A: (0x0065,),
+    0x1D58B: (0x0066,),
+    0x1D58C: (0x0067,),
+    0x1D58D: (0x0068,),
+    0x1D58E: (0x0069,),
+    0x1D58F: (0x006A,),
+    0x1D590: (0x006B,),
+    0x1D591: (0x006C,),
+    0x1D592: (0x0072, 0x006E),
+    0x1D593: (0x006E,),
+    0x1D594: (0x006F,),
+    0x1D595: (0x0070,),
+    0x1D596: (0x0071,),
+    0x1D597: (0x0072,),
+    0x1D598: (0x0073,),
+    0x1D599: (0x0074,),
+    0x1D59A: (0x0075,),
+    0x1D59B: (0x0076,),
+    0x1D59C: (0x0076, 0x0076),
+    0x1D59D: (0x0078,),
+    0x1D59E: (0x0079,),
+    0x1D59F: (0x007A,),
+    0x1D5A0: (0x0041,),
+    0x1D5A1: (0x0042,),
+    0x1D5A2: (0x0043,),
+    0x1D5A3: (0x0044,),
+    0x1D5A4: (0x0045,),
+    0x1D5A5: (0x0046,),
+    0x1D5A6: (0x0047,),
+    0x1D5A7: (0x0048,),
+    0x1D5A8: (0x006C,),
+    0x1D5A9: (0x004A,),
+    0x1D5AA: (0x004B,),
+    0x1D5AB: (0x004C,),
+    0x1D5AC: (0x004D,),
+    0x1D5AD: (0x004E,),
+    0x1D5AE: (0x004F,),
+    0x1D5AF: (0x0050,),
+    0x1D5B0: (0x0051,),
+    0x1D5B1: (0x0052,),
+    0x1D5B2: (0x0053,),
+    0x1D5B3: (0x0054,),
+    0x1D5B4: (0x0055,),
+    0x1D5B5: (0x0056,),
+    0x1D5B6: (0x0057,),
+    0x1D5B7: (0x0058,),
+    0x1D5B8: (0x0059,),
+    0x1D5B9: (0x005A,),
+    0x1D5BA: (0x0061,),
+    0x1D5BB: (0x0062,),
+    0x1D5BC: (0x0063,),
+    0x1D5BD: (0x0064,),
+    0x1D5BE: (0x0065,),
+    0x1D5BF: (0x0066,),
+    0x1D5C0: (0x0067,),
+    0x1D5C1: (0x0068,),
+    0x1D5C2: (0x0069,),
+    0x1D5C3: (0x006A,),
+    0x1D5C4: (0x006B,),
+    0x1D5C5: (0x006C,),
+    0x1D5C6: (0x0072, 0x006E),
+    0x1D5C7: (0x006E,),
+    0x1D5C8: (0x006F,),
+    0x1D5C9: (0x0070,),
+    0x1D5CA: (0x0071,),
+    0x1D5CB: (0x0072,),
+    0x1D5CC: (0x0073,),
+    0x1D5CD: (0x0074,),
+    0x1D5CE: (0x0075,),
+    0x1D5CF: (0x0076,),
+    0x1D5D0: (0x0076, 0x0076),
+    0x1D5D1: (0x0078,),
+    0x1D5D2: (0x0079,),
+    0x1D5D3: (0x007A,),
+    0x1D5D4: (0x0041,),
+    0x1D5D5: (0x0042,),
+    0x1D5D6: (0x0043,),
+    0x1D5D7: (0x0044,),
+    0x1D5D8: (0x0045,),
+    0x1D5D9: (0x0046,),
+    0x1D5DA: (0x0047,),
+    0x1D5DB: (0x0048,),
+    0x1D5DC: (0x006C,),
+    0x1D5DD: (0x004A,),
+    0x1D5DE: (0x004B,),
+    0x1D5DF: (0x004C,),
+    0x1D5E0: (0x004D,),
+    0x1D5E1: (0x004E,),
+    0x1D5E2: (0x004F,),
+    0x1D5E3: (0x0050,),
+    0x1D5E4: (0x0051,),
+    0x1D5E5: (0x0052,),
+    0x1D5E6: (0x0053,),
+    0x1D5E7: (0x0054,),
+    0x1D5E8: (0x0055,),
+    0x1D5E9: (0x0056,),
+    0x1D5EA: (0x0057,),
+    0x1D5EB: (0x0058,),
+    0x1D5EC: (0x0059,),
+    0x1D5ED: (0x005A,),
+    0x1D5EE: (0x0061,),
+    0x1D5EF: (0x0062,),
+    0x1D5F0: (0x0063,),
+    0x1D5F1: (0x0064,),
+    0x1D5F2: (0x0065,),
+    0x1D5F3: (0x0066,),
+    0x1D5F4: (0x0067,),
+    0x1D5F5: (0x0068,),
+    0x1D5F6: (0x0069,),
+    0x1D5F7: (0x006A,),
+    0x1D5F8: (0x006B,),
+    0x1D5F9: (0x006C,),
+    0x1D5FA: (0x0072, 0x006E),
+    0x1D5FB: (0x006E,),
+    0x1D5FC: (0x006F,),
+    0x1D5FD: (0x0070,),
+    0x1D5FE: (0x0071,),
+    0x1D5FF: (0x0072,),
+    0x1D600: (0x0073,),
+    0x1D601: (0x0074,),
+    0x1D602: (0x0075,),
+    0x1D603: (0x0076,),
+    0x1D604: (0x0076, 0x0076),
+    0x1D605: (0x0078,),
+    0x1D606: (0x0079,),
+    0x1D607: (0x007A,),
+    0x1D608: (0x0041,),
+    0x1D609: (0x0042,),
+    0x1D60A: (0x0043,),
+    0x1D60B: (0x0044,),
+    0x1D60C: (0x0045,),
+    0x1D60D: (0x0046,),
+    0x1D60E: (0x0047,),
+    0x1D60F: (0x0048,),
+    0x1D610: (0x006C,),
+    0x1D611: (0x004A,),
+    0x1D612: (0x004B,),
+    0x1D613: (0x004C,),
+    0x1D614: (0x004D,),
+    0x1D615: (0x004E,),
+    0x1D616: (0x004F,),
+    0x1D617: (0x0050,),
+    0x1D618: (0x0051,),
+    0x1D619: (0x0052,),
+    0x1D61A: (0x0053,),
+    0x1D61B: (0x0054,),
+    0x1D61C: (0x0055,),
+    0x1D61D: (0x0056,),
+    0x1D61E: (0x0057,),
+    0x1D61F: (0x0058,),
+    0x1D620: (0x0059,),
+    0x1D621: (0x005A,),
+    0x1D622: (0x0061,),
+    0x1D623: (0x0062,),
+    0x1D624: (0x0063,),
+    0x1D625: (0x0064,),
+    0x1D626: (0x0065,),
+    0x1D627: (0x0066,),
+    0x1D628: (0x0067,),
+    0x1D629: (0x0068,),
+    0x1D62A: (0x0069,),
+    0x1D62B: (0x006A,),
+    0x1D62C: (0x006B,),
+    0x1D62D: (0x006C,),
+    0x1D62E: (0x0072, 0x006E),
+    0x1D62F: (0x006E,),
+    0x1D630: (0x006F,),
+    0x1D631: (0x0070,),
+    0x1D632: (0x0071,),
+    0x1D633: (0x0072,),
+    0x1D634: (0x0073,),
+    0x1D635: (0x0074,),
+    0x1D636: (0x0075,),
+    0x1D637: (0x0076,),
+    0x1D638: (0x0076, 0x0076),
+    0x1D639: (0x0078,),
+    0x1D63A: (0x0079,),
+    0x1D63B: (0x007A,),
+    0x1D63C: (0x0041,),
+    0x1D63D: (0x0042,),
+    0x1D63E: (0x0043,),
+    0x1D63F: (0x0044,),
+    0x1D640: (0x0045,),
+    0x1D641: (0x0046,),
+    0x1D642: (0x0047,),
+    0x1D643: (0x0048,),
+    0x1D644: (0x006C,),
+    0x1D645: (0x004A,),
+    0x1D646: (0x004B,),
+    0x1D647: (0x004C,),
+    0x1D648: (0x004D,),
+    0x1D649: (0x004E,),
+    0x1D64A: (0x004F,),
+    0x1D64B: (0x0050,),
+    0x1D64C: (0x0051,),
+    0x1D64D: (0x0052,),
+    0x1D64E: (0x0053,),
+    0x1D64F: (0x0054,),
+    0x1D650: (0x0055,),
+    0x1D651: (0x0056,),
+    0x1D652: (0x0057,),
+    0x1D653: (0x0058,),
+    0x1D654: (0x0059,),
+    0x1D655: (0x005A,),
+    0x1D656: (0x0061,),
+    0x1D657: (0x0062,),
+    0x1D658: (0x0063,),
+    0x1D659: (0x0064,),
+    0x1D65A: (0x0065,),
+    0x1D65B: (0x0066,),
+    0x1D65C: (0x0067,),
+    0x1D65D: (0x0068,),
+    0x1D65E: (0x0069,),
+    0x1D65F: (0x006A,),
+    0x1D660: (0x006B,),
+    0x1D661: (0x006C,),
+    0x1D662: (0x0072, 0x006E),
+    0x1D663: (0x006E,),
+    0x1D664: (0x006F,),
+    0x1D665: (0x0070,),
+    0x1D666: (0x0071,),
+    0x1D667: (0x0072,),
+    0x1D668: (0x0073,),
+    0x1D669: (0x0074,),
+    0x1D66A: (0x0075,),
+    0x1D66B: (0x0076,),
+    0x1D66C: (0x0076, 0x0076),
+    0x1D66D: (0x0078,),
+    0x1D66E: (0x0079,),
+    0x1D66F: (0x007A,),
+    0x1D670: (0x0041,),
+    0x1D671: (0x0042,),
+    0x1D672: (0x0043,),
+    0x1D673: (0x0044,),
+    0x1D674: (0x0045,),
+    0x1D675: (0x0046,),
+    0x1D676: (0x0047,),
+    0x1D677: (0x0048,),
+    0x1D678: (0x006C,),
+    0x1D679: (0x004A,),
+    0x1D67A: (0x004B,),
+    0x1D67B: (0x004C,),
+    0x1D67C: (0x004D,),
+    0x1D67D: (0x004E,),
+    0x1D67E: (0x004F,),
+    0x1D67F: (0x0050,),
+    0x1D680: (0x0051,),
+    0x1D681: (0x0052,),
+    0x1D682: (0x0053,),
+    0x1D683: (0x0054,),
+    0x1D684: (0x0055,),
+    0x1D685: (0x0056,),
+    0x1D686: (0x0057,),
+    0x1D687: (0x0058,),
+    0x1D688: (0x0059,),
+    0x1D689: (0x005A,),
+    0x1D68A: (0x0061,),
+    0x1D68B: (0x0062,),
+    0x1D68C: (0x0063,),
+    0x1D68D: (0x0064,),
+    0x1D68E: (0x0065,),
+    0x1D68F: (0x0066,),
+    0x1D690: (0x0067,),
+    0x1D691: (0x0068,),
+    0x1D692: (0x0069,),
+    0x1D693: (0x006A,),
+    0x1D694: (0x006B,),
+    0x1D695: (0x006C,),
+    0x1D696: (0x0072, 0x006E),
+    0x1D697: (0x006E,),
+    0x1D698: (0x006F,),
+    0x1D699: (0x0070,),
+    0x1D69A: (0x0071,),
+    0x1D69B: (0x0072,),
+    0x1D69C: (0x0073,),
+    0x1D69D: (0x0074,),
+    0x1D69E: (0x0075,),
+    0x1D69F: (0x0076,),
+    0x1D6A0: (0x0076, 0x0076),
+    0x1D6A1: (0x0078,),
+    0x1D6A2: (0x0079,),
+    0x1D6A3: (0x007A,),
+    0x1D6A4: (0x0069,),
+    0x1D6A5: (0x0237,),
+    0x1D6A8: (0x0041,),
+    0x1D6A9: (0x0042,),
+    0x1D6AA: (0x0393,),
+    0x1D6AB: (0x0394,),
+    0x1D6AC: (0x0045,),
+    0x1D6AD: (0x005A,),
+    0x1D6AE: (0x0048,),
+    0x1D6AF: (0x004F, 0x0335),
+    0x1D6B0: (0x006C,),
+    0x1D6B1: (0x004B,),
+    0x1D6B2: (0x0245,),
+    0x1D6B3: (0x004D,),
+    0x1D6B4: (0x004E,),
+    0x1D6B5: (0x039E,),
+    0x1D6B6: (0x004F,),
+    0x1D6B7: (0x03A0,),
+    0x1D6B8: (0x0050,),
+    0x1D6B9: (0x004F, 0x0335),
+    0x1D6BA: (0x01A9,),
+    0x1D6BB: (0x0054,),
+    0x1D6BC: (0x0059,),
+    0x1D6BD: (0x03A6,),
+    0x1D6BE: (0x0058,),
+    0x1D6BF: (0x03A8,),
+    0x1D6C0: (0x03A9,),
+    0x1D6C1: (0x2207,),
+    0x1D6C2: (0x0061,),
+    0x1D6C3: (0x00DF,),
+    0x1D6C4: (0x0079,),
+    0x1D6C5: (0x1E9F,),
+    0x1D6C6: (0xA793,),
+    0x1D6C7: (0x03B6,),
+    0x1D6C8: (0x006E, 0x0329),
+    0x1D6C9: (0x004F, 0x0335),
+    0x1D6CA: (0x0069,),
+    0x1D6CB: (0x006B,),
+    0x1D6CC: (0x03BB,),
+    0x1D6CD: (0x03BC,),
+    0x1D6CE: (0x0076,),
+    0x1D6CF: (0x03BE,),
+    0x1D6D0: (0x006F,),
+    0x1D6D1: (0x006E,),
+    0x1D6D2: (0x0070,),
+    0x1D6D3: (0x03C2,),
+    0x1D6D4: (0x006F,),
+    0x1D6D5: (0x0074,),
+    0x1D6D6: (0x0075,),
+    0x1D6D7: (0x0278,),
+    0x1D6D8: (0x03C7,),
+    0x1D6D9: (0x03C8,),
+    0x1D6DA: (0x03C9,),
+    0x1D6DB: (0x2202,),
+    0x1D6DC: (0xA793,),
+    0x1D6DD: (0x004F, 0x0335),
+    0x1D6DE: (0x006B,),
+    0x1D6DF: (0x0278,),
+    0x1D6E0: (0x0070,),
+    0x1D6E1: (0x006E,),
+    0x1D6E2: (0x0041,),
+    0x1D6E3: (0x0042,),
+    0x1D6E4: (0x0393,),
+    0x1D6E5: (0x0394,),
+    0x1D6E6: (0x0045,),
+    0x1D6E7: (0x005A,),
+    0x1D6E8: (0x0048,),
+    0x1D6E9: (0x004F, 0x0335),
+    0x1D6EA: (0x006C,),
+    0x1D6EB: (0x004B,),
+    0x1D6EC: (0x0245,),
+    0x1D6ED: (0x004D,),
+    0x1D6EE: (0x004E,),
+    0x1D6EF: (0x039E,),
+    0x1D6F0: (0x004F,),
+    0x1D6F1: (0x03A0,),
+    0x1D6F2: (0x0050,),
+    0x1D6F3: (0x004F, 0x0335),
+    0x1D6F4: (0x01A9,),
+    0x1D6F5: (0x0054,),
+    0x1D6F6: (0x0059,),
+    0x1D6F7: (0x03A6,),
+    0x1D6F8: (0x0058,),
+    0x1D6F9: (0x03A8,),
+    0x1D6FA: (0x03A9,),
+    0x1D6FB: (0x2207,),
+    0x1D6FC: (0x0061,),
+    0x1D6FD: (0x00DF,),
+    0x1D6FE: (0x0079,),
+    0x1D6FF: (0x1E9F,),
+    0x1D700: (0xA793,),
+    0x1D701: (0x03B6,),
+    0x1D702: (0x006E, 0x0329),
+    0x1D703: (0x004F, 0x0335),
+    0x1D704: (0x0069,),
+    0x1D705: (0x006B,),
+    0x1D706: (0x03BB,),
+    0x1D707: (0x03BC,),
+    0x1D708: (0x0076,),
+    0x1D709: (0x03BE,),
+    0x1D70A: (0x006F,),
+    0x1D70B: (0x006E,),
+    0x1D70C: (0x0070,),
+    0x1D70D: (0x03C2,),
+    0x1D70E: (0x006F,),
+    0x1D70F: (0x0074,),
+    0x1D710: (0x0075,),
+    0x1D711: (0x0278,),
+    0x1D712: (0x03C7,),
+    0x1D713: (0x03C8,),
+    0x1D714: (0x03C9,),
+    0x1D715: (0x2202,),
+    0x1D716: (0xA793,),
+    0x1D717: (0x004F, 0x0335),
+    0x1D718: (0x006B,),
+    0x1D719: (0x0278,),
+    0x1D71A: (0x0070,),
+    0x1D71B: (0x006E,),
+    0x1D71C: (0x0041,),
+    0x1D71D: (0x0042,),
+    0x1D71E: (0x0393,),
+    0x1D71F: (0x0394,),
+    0x1D720: (0x0045,),
+    0x1D721: (0x005A,),
+    0x1D722: (0x0048,),
+    0x1D723: (0x004F, 0x0335),
+    0x1D724: (0x006C,),
+    0x1D725: (0x004B,),
+    0x1D726: (0x0245,),
+    0x1D727: (0x004D,),
+    0x1D728: (0x004E,),
+    0x1D729: (0x039E,),
+    0x1D72A: (0x004F,),
+    0x1D72B: (0x03A0,),
+    0x1D72C: (0x0050,),
+    0x1D72D: (0x004F, 0x0335),
+    0x1D72E: (0x01A9,),
+    0x1D72F: (0x0054,),
+    0x1D730: (0x0059,),
+    0x1D731: (0x03A6,),
+    0x1D732: (0x0058,),
+    0x1D733: (0x03A8,),
+    0x1D734: (0x03A9,),
+    0x1D735: (0x2207,),
+    0x1D736: (0x0061,),
+    0x1D737: (0x00DF,),
+    0x1D738: (0x0079,),
+    0x1D739: (0x1E9F,),
+    0x1D73A: (0xA793,),
+    0x1D73B: (0x03B6,),
+    0x1D73C: (0x006E, 0x0329),
+    0x1D73D: (0x004F, 0x0335),
+    0x1D73E: (0x0069,),
+    0x1D73F: (0x006B,),
+    0x1D740: (0x03BB,),
+    0x1D741: (0x03BC,),
+    0x1D742: (0x0076,),
+    0x1D743: (0x03BE,),
+    0x1D744: (0x006F,),
+    0x1D745: (0x006E,),
+    0x1D746: (0x0070,),
+    0x1D747: (0x03C2,),
+    0x1D748: (0x006F,),
+    0x1D749: (0x0074,),
+    0x1D74A: (0x0075,),
+    0x1D74B: (0x0278,),
+    0x1D74C: (0x03C7,),
+    0x1D74D: (0x03C8,),
+    0x1D74E: (0x03C9,),
+    0x1D74F: (0x2202,),
+    0x1D750: (0xA793,),
+    0x1D751: (0x004F, 0x0335),
+    0x1D752: (0x006B,),
+    0x1D753: (0x0278,),
+    0x1D754: (0x0070,),
+    0x1D755: (0x006E,),
+    0x1D756: (0x0041,),
+    0x1D757: (0x0042,),
+    0x1D758: (0x0393,),
+    0x1D759: (0x0394,),
+    0x1D75A: (0x0045,),
+    0x1D75B: (0x005A,),
+    0x1D75C: (0x0048,),
+    0x1D75D: (0x004F, 0x0335),
+    0x1D75E: (0x006C,),
+    0x1D75F: (0x004B,),
+    0x1D760: (0x0245,),
+    0x1D761: (0x004D,),
+    0x1D762: (0x004E,),
+    0x1D763: (0x039E,),
+    0x1D764: (0x004F,),
+    0x1D765: (0x03A0,),
+    0x1D766: (0x0050,),
+    0x1D767: (0x004F, 0x0335),
+    0x1D768: (0x01A9,),
+    0x1D769: (0x0054,),
+    0x1D76A: (0x0059,),
+    0x1D76B: (0x03A6,),
+    0x1D76C: (0x0058,),
+    0x1D76D: (0x03A8,),
+    0x1D76E: (0x03A9,),
+    0x1D76F: (0x2207,),
+    0x1D770: (0x0061,),
+    0x1D771: (0x00DF,),
+    0x1D772: (0x0079,),
+    0x1D773: (0x1E9F,),
+    0x1D774: (0xA793,),
+    0x1D775: (0x03B6,),
+    0x1D776: (0x006E, 0x0329),
+    0x1D777: (0x004F, 0x0335),
+    0x1D778: (0x0069,),
+    0x1D779: (0x006B,),
+    0x1D77A: (0x03BB,),
+    0x1D77B: (0x03BC,),
+    0x1D77C: (0x0076,),
+    0x1D77D: (0x03BE,),
+    0x1D77E: (0x006F,),
+    0x1D77F: (0x006E,),
+    0x1D780: (0x0070,),
+    0x1D781: (0x03C2,),
+    0x1D782: (0x006F,),
+    0x1D783: (0x0074,),
+    0x1D784: (0x0075,),
+    0x1D785: (0x0278,),
+    0x1D786: (0x03C7,),
+    0x1D787: (0x03C8,),
+    0x1D788: (0x03C9,),
+    0x1D789: (0x2202,),
+    0x1D78A: (0xA793,),
+    0x1D78B: (0x004F, 0x0335),
+    0x1D78C: (0x006B,),
+    0x1D78D: (0x0278,),
+    0x1D78E: (0x0070,),
+    0x1D78F: (0x006E,),
+    0x1D790: (0x0041,),
+    0x1D791: (0x0042,),
+    0x1D792: (0x0393,),
+    0x1D793: (0x0394,),
+    0x1D794: (0x0045,),
+    0x1D795: (0x005A,),
+    0x1D796: (0x0048,),
+    0x1D797: (0x004F, 0x0335),
+    0x1D798: (0x006C,),
+    0x1D799: (0x004B,),
+    0x1D79A: (0x0245,),
+    0x1D79B: (0x004D,),
+    0x1D79C: (0x004E,),
+    0x1D79D: (0x039E,),
+    0x1D79E: (0x004F,),
+    0x1D79F: (0x03A0,),
+    0x1D7A0: (0x0050,),
+    0x1D7A1: (0x004F, 0x0335),
+    0x1D7A2: (0x01A9,),
+    0x1D7A3: (0x0054,),
+    0x1D7A4: (0x0059,),
+    0x1D7A5: (0x03A6,),
+    0x1D7A6: (0x0058,),
+    0x1D7A7: (0x03A8,),
+    0x1D7A8: (0x03A9,),
+    0x1D7A9: (0x2207,),
+    0x1D7AA: (0x0061,),
+    0x1D7AB: (0x00DF,),
+    0x1D7AC: (0x0079,),
+    0x1D7AD: (0x1E9F,),
+    0x1D7AE: (0xA793,),
+    0x1D7AF: (0x03B6,),
+    0x1D7B0: (0x006E, 0x0329),
+    0x1D7B1: (0x004F, 0x0335),
+    0x1D7B2: (0x0069,),
+    0x1D7B3: (0x006B,),
+    0x1D7B4: (0x03BB,),
+    0x1D7B5: (0x03BC,),
+    0x1D7B6: (0x0076,),
+    0x1D7B7: (0x03BE,),
+    0x1D7B8: (0x006F,),
+    0x1D7B9: (0x006E,),
+    0x1D7BA: (0x0070,),
+    0x1D7BB: (0x03C2,),
+    0x1D7BC: (0x006F,),
+    0x1D7BD: (0x0074,),
+    0x1D7BE: (0x0075,),
+    0x1D7BF: (0x0278,),
+    0x1D7C0: (0x03C7,),
+    0x1D7C1: (0x03C8,),
+    0x1D7C2: (0x03C9,),
+    0x1D7C3: (0x2202,),
+    0x1D7C4: (0xA793,),
+    0x1D7C5: (0x004F, 0x0335),
+    0x1D7C6: (0x006B,),
+    0x1D7C7: (0x0278,),
+    0x1D7C8: (0x0070,),
+    0x1D7C9: (0x006E,),
+    0x1D7CA: (0x0046,),
+    0x1D7CB: (0x03DD,),
+    0x1D7CE: (0x004F,),
+    0x1D7CF: (0x006C,),
+    0x1D7D0: (0x0032,),
+    0x1D7D1: (0x0033,),
+    0x1D7D2: (0x0034,),
+    0x1D7D3: (0x0035,),
+    0x1D7D4: (0x0036,),
+    0x1D7D5: (0x0037,),
+    0x1D7D6: (0x0038,),
+    0x1D7D7: (0x0039,),
+    0x1D7D8: (0x004F,),
+    0x1D7D9: (0x006C,),
+    0x1D7DA: (0x0032,),
+    0x1D7DB: (0x0033,),
+    0x1D7DC: (0x0034,),
+    0x1D7DD: (0x0035,),
+    0x1D7DE: (0x0036,),
+    0x1D7DF: (0x0037,),
+    0x1D7E0: (0x0038,),
+    0x1D7E1: (0x0039,),
+    0x1D7E2: (0x004F,),
+    0x1D7E3: (0x006C,),
+    0x1D7E4: (0x0032,),
+    0x1D7E5: (0x0033,),
+    0x1D7E6: (0x0034,),
+    0x1D7E7: (0x0035,),
+    0x1D7E8: (0x0036,),
+    0x1D7E9: (0x0037,),
+    0x1D7EA: (0x0038,),
+    0x1D7EB: (0x0039,),
+    0x1D7EC: (0x004F,),
+    0x1D7ED: (0x006C,),
+    0x1D7EE: (0x0032,),
+    0x1D7EF: (0x0033,),
+    0x1D7F0: (0x0034,),
+    0x1D7F1: (0x0035,),
+    0x1D7F2: (0x0036,),
+    0x1D7F3: (0x0037,),
+    0x1D7F4: (0x0038,),
+    0x1D7F5: (0x0039,),
+    0x1D7F6: (0x004F,),
+    0x1D7F7: (0x006C,),
+    0x1D7F8: (0x0032,),
+    0x1D7F9: (0x0033,),
+    0x1D7FA: (0x0034,),
+    0x1D7FB: (0x0035,),
+    0x1D7FC: (0x0036,),
+    0x1D7FD: (0x0037,),
+    0x1D7FE: (0x0038,),
+    0x1D7FF: (0x0039,),
+    0x1E8C7: (0x006C,),
+    0x1E8C8: (0x2220,),
+    0x1E8C9: (0x0663,),
+    0x1E8CB: (0x0038,),
+    0x1E8CC: (0x2202,),
+    0x1E8CD: (0x2202, 0x0335),
+    0x1EE00: (0x006C,),
+    0x1EE01: (0x0628,),
+    0x1EE02: (0x062C,),
+    0x1EE03: (0x062F,),
+    0x1EE05: (0x0648,),
+    0x1EE06: (0x0632,),
+    0x1EE07: (0x062D,),
+    0x1EE08: (0x0637,),
+    0x1EE09: (0x0649,),
+    0x1EE0A: (0x0643,),
+    0x1EE0B: (0x0644,),
+    0x1EE0C: (0x0645,),
+    0x1EE0D: (0x0646,),
+    0x1EE0E: (0x0633,),
+    0x1EE0F: (0x0639,),
+    0x1EE10: (0x0641,),
+    0x1EE11: (0x0635,),
+    0x1EE12: (0x0642,),
+    0x1EE13: (0x0631,),
+    0x1EE14: (0x0633, 0x06DB),
+    0x1EE15: (0x062A,),
+    0x1EE16: (0x0649, 0x06DB),
+    0x1EE17: (0x062E,),
+    0x1EE18: (0x0630,),
+    0x1EE19: (0x0636,),
+    0x1EE1A: (0x0638,),
+    0x1EE1B: (0x063A,),
+    0x1EE1C: (0x0649,),
+    0x1EE1D: (0x0649,),
+    0x1EE1E: (0x06A1,),
+    0x1EE1F: (0x06A1,),
+    0x1EE21: (0x0628,),
+    0x1EE22: (0x062C,),
+    0x1EE24: (0x006F,),
+    0x1EE27: (0x062D,),
+    0x1EE29: (0x0649,),
+    0x1EE2A: (0x0643,),
+    0x1EE2B: (0x0644,),
+    0x1EE2C: (0x0645,),
+    0x1EE2D: (0x0646,),
+    0x1EE2E: (0x0633,),
+    0x1EE2F: (0x0639,),
+    0x1EE30: (0x0641,),
+    0x1EE31: (0x0635,),
+    0x1EE32: (0x0642,),
+    0x1EE34: (0x0633, 0x06DB),
+    0x1EE35: (0x062A,),
+    0x1EE36: (0x0649, 0x06DB),
+    0x1EE37: (0x062E,),
+    0x1EE39: (0x0636,),
+    0x1EE3B: (0x063A,),
+    0x1EE42: (0x062C,),
+    0x1EE47: (0x062D,),
+    0x1EE49: (0x0649,),
+    0x1EE4B: (0x0644,),
+    0x1EE4D: (0x0646,),
+    0x1EE4E: (0x0633,),
+    0x1EE4F: (0x0639,),
+    0x1EE51: (0x0635,),
+    0x1EE52: (0x0642,),
+    0x1EE54: (0x0633, 0x06DB),
+    0x1EE57: (0x062E,),
+    0x1EE59: (0x0636,),
+    0x1EE5B: (0x063A,),
+    0x1EE5D: (0x0649,),
+    0x1EE5F: (0x06A1,),
+    0x1EE61: (0x0628,),
+    0x1EE62: (0x062C,),
+    0x1EE64: (0x006F,),
+    0x1EE67: (0x062D,),
+    0x1EE68: (0x0637,),
+    0x1EE69: (0x0649,),
+    0x1EE6A: (0x0643,),
+    0x1EE6C: (0x0645,),
+    0x1EE6D: (0x0646,),
+    0x1EE6E: (0x0633,),
+    0x1EE6F: (0x0639,),
+    0x1EE70: (0x0641,),
+    0x1EE71: (0x0635,),
+    0x1EE72: (0x0642,),
+    0x1EE74: (0x0633, 0x06DB),
+    0x1EE75: (0x062A,),
+    0x1EE76: (0x0649, 0x06DB),
+    0x1EE77: (0x062E,),
+    0x1EE79: (0x0636,),
+    0x1EE7A: (0x0638,),
+    0x1EE7B: (0x063A,),
+    0x1EE7C: (0x0649,),
+    0x1EE7E: (0x06A1,),
+    0x1EE80: (0x006C,),
+    0x1EE81: (0x0628,),
+    0x1EE82: (0x062C,),
+    0x1EE83: (0x062F,),
+    0x1EE84: (0x006F,),
+    0x1EE85: (0x0648,),
+    0x1EE86: (0x0632,),
+    0x1EE87: (0x062D,),
+    0x1EE88: (0x0637,),
+    0x1EE89: (0x0649,),
+    0x1EE8B: (0x0644,),
+    0x1EE8C: (0x0645,),
+    0x1EE8D: (0x0646,),
+    0x1EE8E: (0x0633,),
+    0x1EE8F: (0x0639,),
+    0x1EE90: (0x0641,),
+    0x1EE91: (0x0635,),
+    0x1EE92: (0x0642,),
+    0x1EE93: (0x0631,),
+    0x1EE94: (0x0633, 0x06DB),
+    0x1EE95: (0x062A,),
+    0x1EE96: (0x0649, 0x06DB),
+    0x1EE97: (0x062E,),
+    0x1EE98: (0x0630,),
+    0x1EE99: (0x0636,),
+    0x1EE9A: (0x0638,),
+    0x1EE9B: (0x063A,),
+    0x1EEA1: (0x0628,),
+    0x1EEA2: (0x062C,),
+    0x1EEA3: (0x062F,),
+    0x1EEA5: (0x0648,),
+    0x1EEA6: (0x0632,),
+    0x1EEA7: (0x062D,),
+    0x1EEA8: (0x0637,),
+    0x1EEA9: (0x0649,),
+    0x1EEAB: (0x0644,),
+    0x1EEAC: (0x0645,),
+    0x1EEAD: (0x0646,),
+    0x1EEAE: (0x0633,),
+    0x1EEAF: (0x0639,),
+    0x1EEB0: (0x0641,),
+    0x1EEB1: (0x0635,),
+    0x1EEB2: (0x0642,),
+    0x1EEB3: (0x0631,),
+    0x1EEB4: (0x0633, 0x06DB),
+    0x1EEB5: (0x062A,),
+    0x1EEB6: (0x0649, 0x06DB),
+    0x1EEB7: (0x062E,),
+    0x1EEB8: (0x0630,),
+    0x1EEB9: (0x0636,),
+    0x1EEBA: (0x0638,),
+    0x1EEBB: (0x063A,),
+    0x1F100: (0x004F, 0x002E),
+    0x1F101: (0x004F, 0x002C),
+    0x1F102: (0x006C, 0x002C),
+    0x1F103: (0x0032, 0x002C),
+    0x1F104: (0x0033, 0x002C),
+    0x1F105: (0x0034, 0x002C),
+    0x1F106: (0x0035, 0x002C),
+    0x1F107: (0x0036, 0x002C),
+    0x1F108: (0x0037, 0x002C),
+    0x1F109: (0x0038, 0x002C),
+    0x1F10A: (0x0039, 0x002C),
+    0x1F110: (0x0028, 0x0041, 0x0029),
+    0x1F111: (0x0028, 0x0042, 0x0029),
+    0x1F112: (0x0028, 0x0043, 0x0029),
+    0x1F113: (0x0028, 0x0044, 0x0029),
+    0x1F114: (0x0028, 0x0045, 0x0029),
+    0x1F115: (0x0028, 0x0046, 0x0029),
+    0x1F116: (0x0028, 0x0047, 0x0029),
+    0x1F117: (0x0028, 0x0048, 0x0029),
+    0x1F118: (0x0028, 0x006C, 0x0029),
+    0x1F119: (0x0028, 0x004A, 0x0029),
+    0x1F11A: (0x0028, 0x004B, 0x0029),
+    0x1F11B: (0x0028, 0x004C, 0x0029),
+    0x1F11C: (0x0028, 0x004D, 0x0029),
+    0x1F11D: (0x0028, 0x004E, 0x0029),
+    0x1F11E: (0x0028, 0x004F, 0x0029),
+    0x1F11F: (0x0028, 0x0050, 0x0029),
+    0x1F120: (0x0028, 0x0051, 0x0029),
+    0x1F121: (0x0028, 0x0052, 0x0029),
+    0x1F122: (0x0028, 0x0053, 0x0029),
+    0x1F123: (0x0028, 0x0054, 0x0029),
+    0x1F124: (0x0028, 0x0055, 0x0029),
+    0x1F125: (0x0028, 0x0056, 0x0029),
+    0x1F126: (0x0028, 0x0057, 0x0029),
+    0x1F127: (0x0028, 0x0058, 0x0029),
+    0x1F128: (0x0028, 0x0059, 0x0029),
+    0x1F129: (0x0028, 0x005A, 0x0029),
+    0x1F12A: (0x0028, 0x0053, 0x0029),
+    0x1F240: (0x0028, 0x672C, 0x0029),
+    0x1F241: (0x0028, 0x4E09, 0x0029),
+    0x1F242: (0x0028, 0x4E8C, 0x0029),
+    0x1F243: (0x0028, 0x5B89, 0x0029),
+    0x1F244: (0x0028, 0x70B9, 0x0029),
+    0x1F245: (0x0028, 0x6253, 0x0029),
+    0x1F246: (0x0028, 0x76D7, 0x0029),
+    0x1F247: (0x0028, 0x52DD, 0x0029),
+    0x1F248: (0x0028, 0x6557, 0x0029),
+    0x1F312: (0x263D,),
+    0x1F318: (0x263E,),
+    0x1F319: (0x263D,),
+    0x1F700: (0x0051, 0x0045),
+    0x1F701: (0xA658,),
+    0x1F702: (0x0394,),
+    0x1F704: (0x102BC,),
+    0x1F707: (0x0041, 0x0052),
+    0x1F708: (0x0056, 0x1DE4),
+    0x1F70A: (0x2629,),
+    0x1F714: (0x004F, 0x0335),
+    0x1F728: (0x102A8,),
+    0x1F73A: (0x29DF,),
+    0x1F74C: (0x0043,),
+    0x1F754: (0x16DC,),
+    0x1F755: (0x22A1,),
+    0x1F75C: (0x0073, 0x0073, 0x0073),
+    0x1F75E: (0x224F,),
+    0x1F768: (0x0054,),
+    0x1F76B: (0x004D, 0x0042),
+    0x1F76C: (0x0056, 0x0042),
+    0x1F771: (0x22A0,),
+    0x21FE8: (0x276C,),
+    0x2F800: (0x4E3D,),
+    0x2F801: (0x4E38,),
+    0x2F802: (0x4E41,),
+    0x2F803: (0x20122,),
+    0x2F804: (0x4F60,),
+    0x2F805: (0x4FAE,),
+    0x2F806: (0x4FBB,),
+    0x2F807: (0x4F75,),
+    0x2F808: (0x507A,),
+    0x2F809: (0x5099,),
+    0x2F80A: (0x50E7,),
+    0x2F80B: (0x50CF,),
+    0x2F80C: (0x349E,),
+    0x2F80D: (0x2063A,),
+    0x2F80E: (0x514D,),
+    0x2F80F: (0x5154,),
+    0x2F810: (0x5164,),
+    0x2F811: (0x5177,),
+    0x2F812: (0x2051C,),
+    0x2F813: (0x34B9,),
+    0x2F814: (0x5167,),
+    0x2F815: (0x518D,),
+    0x2F816: (0x2054B,),
+    0x2F817: (0x5197,),
+    0x2F818: (0x51A4,),
+    0x2F819: (0x4ECC,),
+    0x2F81A: (0x51AC,),
+    0x2F81B: (0x51B5,),
+    0x2F81C: (0x291DF,),
+    0x2F81D: (0x51F5,),
+    0x2F81E: (0x5203,),
+    0x2F81F: (0x34DF,),
+    0x2F820: (0x523B,),
+    0x2F821: (0x5246,),
+    0x2F822: (0x5272,),
+    0x2F823: (0x5277,),
+    0x2F824: (0x3515,),
+    0x2F825: (0x52C7,),
+    0x2F826: (0x52C9,),
+    0x2F827: (0x52E4,),
+    0x2F828: (0x52FA,),
+    0x2F829: (0x5305,),
+    0x2F82A: (0x5306,),
+    0x2F82B: (0x5317,),
+    0x2F82C: (0x5349,),
+    0x2F82D: (0x5351,),
+    0x2F82E: (0x535A,),
+    0x2F82F: (0x5373,),
+    0x2F830: (0x537D,),
+    0x2F831: (0x537F,),
+    0x2F832: (0x537F,),
+    0x2F833: (0x537F,),
+    0x2F834: (0x20A2C,),
+    0x2F835: (0x7070,),
+    0x2F836: (0x53CA,),
+    0x2F837: (0x53DF,),
+    0x2F838: (0x20B63,),
+    0x2F839: (0x53EB,),
+    0x2F83A: (0x53F1,),
+    0x2F83B: (0x5406,),
+    0x2F83C: (0x549E,),
+    0x2F83D: (0x5438,),
+    0x2F83E: (0x5448,),
+    0x2F83F: (0x5468,),
+    0x2F840: (0x54A2,),
+    0x2F841: (0x54F6,),
+    0x2F842: (0x5510,),
+    0x2F843: (0x5553,),
+    0x2F844: (0x5563,),
+    0x2F845: (0x5584,),
+    0x2F846: (0x5584,),
+    0x2F847: (0x5599,),
+    0x2F848: (0x55AB,),
+    0x2F849: (0x55B3,),
+    0x2F84A: (0x55C2,),
+    0x2F84B: (0x5716,),
+    0x2F84C: (0x5606,),
+    0x2F84D: (0x5717,),
+    0x2F84E: (0x5651,),
+    0x2F84F: (0x5674,),
+    0x2F850: (0x5207,),
+    0x2F851: (0x58EE,),
+    0x2F852: (0x57CE,),
+    0x2F853: (0x57F4,),
+    0x2F854: (0x580D,),
+    0x2F855: (0x578B,),
+    0x2F856: (0x5832,),
+    0x2F857: (0x5831,),
+    0x2F858: (0x58AC,),
+    0x2F859: (0x214E4,),
+    0x2F85A: (0x58F2,),
+    0x2F85B: (0x58F7,),
+    0x2F85C: (0x5906,),
+    0x2F85D: (0x591A,),
+    0x2F85E: (0x5922,),
+    0x2F85F: (0x5962,),
+    0x2F860: (0x216A8,),
+    0x2F861: (0x216EA,),
+    0x2F862: (0x59EC,),
+    0x2F863: (0x5A1B,),
+    0x2F864: (0x5A27,),
+    0x2F865: (0x59D8,),
+    0x2F866: (0x5A66,),
+    0x2F867: (0x36EE,),
+    0x2F868: (0x36FC,),
+    0x2F869: (0x5B08,),
+    0x2F86A: (0x5B3E,),
+    0x2F86B: (0x5B3E,),
+    0x2F86C: (0x219C8,),
+    0x2F86D: (0x5BC3,),
+    0x2F86E: (0x5BD8,),
+    0x2F86F: (0x5BE7,),
+    0x2F870: (0x5BF3,),
+    0x2F871: (0x21B18,),
+    0x2F872: (0x5BFF,),
+    0x2F873: (0x5C06,),
+    0x2F874: (0x5F53,),
+    0x2F875: (0x5C22,),
+    0x2F876: (0x3781,),
+    0x2F877: (0x5C60,),
+    0x2F878: (0x5C6E,),
+    0x2F879: (0x5CC0,),
+    0x2F87A: (0x5C8D,),
+    0x2F87B: (0x21DE4,),
+    0x2F87C: (0x5D43,),
+    0x2F87D: (0x21DE6,),
+    0x2F87E: (0x5D6E,),
+    0x2F87F: (0x5D6B,),
+    0x2F880: (0x5D7C,),
+    0x2F881: (0x5DE1,),
+    0x2F882: (0x5DE2,),
+    0x2F883: (0x382F,),
+    0x2F884: (0x5DFD,),
+    0x2F885: (0x5E28,),
+    0x2F886: (0x5E3D,),
+    0x2F887: (0x5E69,),
+    0x2F888: (0x3862,),
+    0x2F889: (0x22183,),
+    0x2F88A: (0x387C,),
+    0x2F88B: (0x5EB0,),
+    0x2F88C: (0x5EB3,),
+    0x2F88D: (0x5EB6,),
+    0x2F88E: (0x5ECA,),
+    0x2F88F: (0x2A392,),
+    0x2F890: (0x5EFE,),
+    0x2F891: (0x22331,),
+    0x2F892: (0x22331,),
+    0x2F893: (0x8201,),
+    0x2F894: (0x5F22,),
+    0x2F895: (0x5F22,),
+    0x2F896: (0x38C7,),
+    0x2F897: (0x232B8,),
+    0x2F898: (0x261DA,),
+    0x2F899: (0x5F62,),
+    0x2F89A: (0x5F6B,),
+    0x2F89B: (0x38E3,),
+    0x2F89C: (0x5F9A,),
+    0x2F89D: (0x5FCD,),
+    0x2F89E: (0x5FD7,),
+    0x2F89F: (0x5FF9,),
+    0x2F8A0: (0x6081,),
+    0x2F8A1: (0x393A,),
+    0x2F8A2: (0x391C,),
+    0x2F8A3: (0x6094,),
+    0x2F8A4: (0x226D4,),
+    0x2F8A5: (0x60C7,),
+    0x2F8A6: (0x6148,),
+    0x2F8A7: (0x614C,),
+    0x2F8A8: (0x614E,),
+    0x2F8A9: (0x614C,),
+    0x2F8AA: (0x617A,),
+    0x2F8AB: (0x618E,),
+    0x2F8AC: (0x61B2,),
+    0x2F8AD: (0x61A4,),
+    0x2F8AE: (0x61AF,),
+    0x2F8AF: (0x61DE,),
+    0x2F8B0: (0x61F2,),
+    0x2F8B1: (0x61F6,),
+    0x2F8B2: (0x6210,),
+    0x2F8B3: (0x621B,),
+    0x2F8B4: (0x625D,),
+    0x2F8B5: (0x62B1,),
+    0x2F8B6: (0x62D4,),
+    0x2F8B7: (0x6350,),
+    0x2F8B8: (0x22B0C,),
+    0x2F8B9: (0x633D,),
+    0x2F8BA: (0x62FC,),
+    0x2F8BB: (0x6368,),
+    0x2F8BC: (0x6383,),
+    0x2F8BD: (0x63E4,),
+    0x2F8BE: (0x22BF1,),
+    0x2F8BF: (0x6422,),
+    0x2F8C0: (0x63C5,),
+    0x2F8C1: (0x63A9,),
+    0x2F8C2: (0x3A2E,),
+    0x2F8C3: (0x6469,),
+    0x2F8C4: (0x647E,),
+    0x2F8C5: (0x649D,),
+    0x2F8C6: (0x6477,),
+    0x2F8C7: (0x3A6C,),
+    0x2F8C8: (0x654F,),
+    0x2F8C9: (0x656C,),
+    0x2F8CA: (0x2300A,),
+    0x2F8CB: (0x65E3,),
+    0x2F8CC: (0x66F8,),
+    0x2F8CD: (0x6649,),
+    0x2F8CE: (0x3B19,),
+    0x2F8CF: (0x6691,),
+    0x2F8D0: (0x3B08,),
+    0x2F8D1: (0x3AE4,),
+    0x2F8D2: (0x5192,),
+    0x2F8D3: (0x5195,),
+    0x2F8D4: (0x6700,),
+    0x2F8D5: (0x669C,),
+    0x2F8D6: (0x80AD,),
+    0x2F8D7: (0x43D9,),
+    0x2F8D8: (0x6717,),
+    0x2F8D9: (0x671B,),
+    0x2F8DA: (0x6721,),
+    0x2F8DB: (0x675E,),
+    0x2F8DC: (0x6753,),
+    0x2F8DD: (0x233C3,),
+    0x2F8DE: (0x3B49,),
+    0x2F8DF: (0x67FA,),
+    0x2F8E0: (0x6785,),
+    0x2F8E1: (0x6852,),
+    0x2F8E2: (0x6885,),
+    0x2F8E3: (0x2346D,),
+    0x2F8E4: (0x688E,),
+    0x2F8E5: (0x681F,),
+    0x2F8E6: (0x6914,),
+    0x2F8E7: (0x3B9D,),
+    0x2F8E8: (0x6942,),
+    0x2F8E9: (0x69A3,),
+    0x2F8EA: (0x69EA,),
+    0x2F8EB: (0x6AA8,),
+    0x2F8EC: (0x236A3,),
+    0x2F8ED: (0x6ADB,),
+    0x2F8EE: (0x3C18,),
+    0x2F8EF: (0x6B21,),
+    0x2F8F0: (0x238A7,),
+    0x2F8F1: (0x6B54,),
+    0x2F8F2: (0x3C4E,),
+    0x2F8F3: (0x6B72,),
+    0x2F8F4: (0x6B9F,),
+    0x2F8F5: (0x6BBA,),
+    0x2F8F6: (0x6BBB,),
+    0x2F8F7: (0x23A8D,),
+    0x2F8F8: (0x21D0B,),
+    0x2F8F9: (0x23AFA,),
+    0x2F8FA: (0x6C4E,),
+    0x2F8FB: (0x23CBC,),
+    0x2F8FC: (0x6CBF,),
+    0x2F8FD: (0x6CCD,),
+    0x2F8FE: (0x6C67,),
+    0x2F8FF: (0x6D16,),
+    0x2F900: (0x6D3E,),
+    0x2F901: (0x6D77,),
+    0x2F902: (0x6D41,),
+    0x2F903: (0x6D69,),
+    0x2F904: (0x6D78,),
+    0x2F905: (0x6D85,),
+    0x2F906: (0x23D1E,),
+    0x2F907: (0x6D34,),
+    0x2F908: (0x6E2F,),
+    0x2F909: (0x6E6E,),
+    0x2F90A: (0x3D33,),
+    0x2F90B: (0x6ECB,),
+    0x2F90C: (0x6EC7,),
+    0x2F90D: (0x23ED1,),
+    0x2F90E: (0x6DF9,),
+    0x2F90F: (0x6F6E,),
+    0x2F910: (0x23F5E,),
+    0x2F911: (0x23F8E,),
+    0x2F912: (0x6FC6,),
+    0x2F913: (0x7039,),
+    0x2F914: (0x701E,),
+    0x2F915: (0x701B,),
+    0x2F916: (0x3D96,),
+    0x2F917: (0x704A,),
+    0x2F918: (0x707D,),
+    0x2F919: (0x7077,),
+    0x2F91A: (0x70AD,),
+    0x2F91B: (0x20525,),
+    0x2F91C: (0x7145,),
+    0x2F91D: (0x24263,),
+    0x2F91E: (0x719C,),
+    0x2F91F: (0x243AB,),
+    0x2F920: (0x7228,),
+    0x2F921: (0x7235,),
+    0x2F922: (0x7250,),
+    0x2F923: (0x24608,),
+    0x2F924: (0x7280,),
+    0x2F925: (0x7295,),
+    0x2F926: (0x24735,),
+    0x2F927: (0x24814,),
+    0x2F928: (0x737A,),
+    0x2F929: (0x738B,),
+    0x2F92A: (0x3EAC,),
+    0x2F92B: (0x73A5,),
+    0x2F92C: (0x3EB8,),
+    0x2F92D: (0x3EB8,),
+    0x2F92E: (0x7447,),
+    0x2F92F: (0x745C,),
+    0x2F930: (0x7471,),
+    0x2F931: (0x7485,),
+    0x2F932: (0x74CA,),
+    0x2F933: (0x3F1B,),
+    0x2F934: (0x7524,),
+    0x2F935: (0x24C36,),
+    0x2F936: (0x753E,),
+    0x2F937: (0x24C92,),
+    0x2F938: (0x7570,),
+    0x2F939: (0x2219F,),
+    0x2F93A: (0x7610,),
+    0x2F93B: (0x24FA1,),
+    0x2F93C: (0x24FB8,),
+    0x2F93D: (0x25044,),
+    0x2F93E: (0x3FFC,),
+    0x2F93F: (0x4008,),
+    0x2F940: (0x76F4,),
+    0x2F941: (0x250F3,),
+    0x2F942: (0x250F2,),
+    0x2F943: (0x25119,),
+    0x2F944: (0x25133,),
+    0x2F945: (0x771E,),
+    0x2F946: (0x771F,),
+    0x2F947: (0x771F,),
+    0x2F948: (0x774A,),
+    0x2F949: (0x4039,),
+    0x2F94A: (0x778B,),
+    0x2F94B: (0x4046,),
+    0x2F94C: (0x4096,),
+    0x2F94D: (0x2541D,),
+    0x2F94E: (0x784E,),
+    0x2F94F: (0x788C,),
+    0x2F950: (0x78CC,),
+    0x2F951: (0x40E3,),
+    0x2F952: (0x25626,),
+    0x2F953: (0x7956,),
+    0x2F954: (0x2569A,),
+    0x2F955: (0x256C5,),
+    0x2F956: (0x798F,),
+    0x2F957: (0x79EB,),
+    0x2F958: (0x412F,),
+    0x2F959: (0x7A40,),
+    0x2F95A: (0x7A4A,),
+    0x2F95B: (0x7A4F,),
+    0x2F95C: (0x2597C,),
+    0x2F95D: (0x25AA7,),
+    0x2F95E: (0x25AA7,),
+    0x2F95F: (0x7AEE,),
+    0x2F960: (0x4202,),
+    0x2F961: (0x25BAB,),
+    0x2F962: (0x7BC6,),
+    0x2F963: (0x7BC9,),
+    0x2F964: (0x4227,),
+    0x2F965: (0x25C80,),
+    0x2F966: (0x7CD2,),
+    0x2F967: (0x42A0,),
+    0x2F968: (0x7CE8,),
+    0x2F969: (0x7CE3,),
+    0x2F96A: (0x7D00,),
+    0x2F96B: (0x25F86,),
+    0x2F96C: (0x7D63,),
+    0x2F96D: (0x4301,),
+    0x2F96E: (0x7DC7,),
+    0x2F96F: (0x7E02,),
+    0x2F970: (0x7E45,),
+    0x2F971: (0x4334,),
+    0x2F972: (0x26228,),
+    0x2F973: (0x26247,),
+    0x2F974: (0x4359,),
+    0x2F975: (0x262D9,),
+    0x2F976: (0x7F7A,),
+    0x2F977: (0x2633E,),
+    0x2F978: (0x7F95,),
+    0x2F979: (0x7FFA,),
+    0x2F97A: (0x8005,),
+    0x2F97B: (0x264DA,),
+    0x2F97C: (0x26523,),
+    0x2F97D: (0x8060,),
+    0x2F97E: (0x265A8,),
+    0x2F97F: (0x8070,),
+    0x2F980: (0x2335F,),
+    0x2F981: (0x43D5,),
+    0x2F982: (0x80B2,),
+    0x2F983: (0x8103,),
+    0x2F984: (0x440B,),
+    0x2F985: (0x813E,),
+    0x2F986: (0x5AB5,),
+    0x2F987: (0x267A7,),
+    0x2F988: (0x267B5,),
+    0x2F989: (0x23393,),
+    0x2F98A: (0x2339C,),
+    0x2F98B: (0x8201,),
+    0x2F98C: (0x8204,),
+    0x2F98D: (0x8F9E,),
+    0x2F98E: (0x446B,),
+    0x2F98F: (0x8291,),
+    0x2F990: (0x828B,),
+    0x2F991: (0x829D,),
+    0x2F992: (0x52B3,),
+    0x2F993: (0x82B1,),
+    0x2F994: (0x82B3,),
+    0x2F995: (0x82BD,),
+    0x2F996: (0x82E6,),
+    0x2F997: (0x26B3C,),
+    0x2F998: (0x82E5,),
+    0x2F999: (0x831D,),
+    0x2F99A: (0x8363,),
+    0x2F99B: (0x83AD,),
+    0x2F99C: (0x8323,),
+    0x2F99D: (0x83BD,),
+    0x2F99E: (0x83E7,),
+    0x2F99F: (0x8457,),
+    0x2F9A0: (0x8353,),
+    0x2F9A1: (0x83CA,),
+    0x2F9A2: (0x83CC,),
+    0x2F9A3: (0x83DC,),
+    0x2F9A4: (0x26C36,),
+    0x2F9A5: (0x26D6B,),
+    0x2F9A6: (0x26CD5,),
+    0x2F9A7: (0x452B,),
+    0x2F9A8: (0x84F1,),
+    0x2F9A9: (0x84F3,),
+    0x2F9AA: (0x8516,),
+    0x2F9AB: (0x273CA,),
+    0x2F9AC: (0x8564,),
+    0x2F9AD: (0x26F2C,),
+    0x2F9AE: (0x455D,),
+    0x2F9AF: (0x4561,),
+    0x2F9B0: (0x26FB1,),
+    0x2F9B1: (0x270D2,),
+    0x2F9B2: (0x456B,),
+    0x2F9B3: (0x8650,),
+    0x2F9B4: (0x865C,),
+    0x2F9B5: (0x8667,),
+    0x2F9B6: (0x8669,),
+    0x2F9B7: (0x86A9,),
+    0x2F9B8: (0x8688,),
+    0x2F9B9: (0x870E,),
+    0x2F9BA: (0x86E2,),
+    0x2F9BB: (0x8779,),
+    0x2F9BC: (0x8728,),
+    0x2F9BD: (0x876B,),
+    0x2F9BE: (0x8786,),
+    0x2F9BF: (0x45D7,),
+    0x2F9C0: (0x87E1,),
+    0x2F9C1: (0x8801,),
+    0x2F9C2: (0x45F9,),
+    0x2F9C3: (0x8860,),
+    0x2F9C4: (0x8863,),
+    0x2F9C5: (0x27667,),
+    0x2F9C6: (0x88D7,),
+    0x2F9C7: (0x88DE,),
+    0x2F9C8: (0x4635,),
+    0x2F9C9: (0x88FA,),
+    0x2F9CA: (0x34BB,),
+    0x2F9CB: (0x278AE,),
+    0x2F9CC: (0x27966,),
+    0x2F9CD: (0x46BE,),
+    0x2F9CE: (0x46C7,),
+    0x2F9CF: (0x8AA0,),
+    0x2F9D0: (0x8AED,),
+    0x2F9D1: (0x8B8A,),
+    0x2F9D2: (0x8C55,),
+    0x2F9D3: (0x27CA8,),
+    0x2F9D4: (0x8CAB,),
+    0x2F9D5: (0x8CC1,),
+    0x2F9D6: (0x8D1B,),
+    0x2F9D7: (0x8D77,),
+    0x2F9D8: (0x27F2F,),
+    0x2F9D9: (0x20804,),
+    0x2F9DA: (0x8DCB,),
+    0x2F9DB: (0x8DBC,),
+    0x2F9DC: (0x8DF0,),
+    0x2F9DD: (0x208DE,),
+    0x2F9DE: (0x8ED4,),
+    0x2F9DF: (0x8F38,),
+    0x2F9E0: (0x285D2,),
+    0x2F9E1: (0x285ED,),
+    0x2F9E2: (0x9094,),
+    0x2F9E3: (0x90F1,),
+    0x2F9E4: (0x9111,),
+    0x2F9E5: (0x2872E,),
+    0x2F9E6: (0x911B,),
+    0x2F9E7: (0x9238,),
+    0x2F9E8: (0x92D7,),
+    0x2F9E9: (0x92D8,),
+    0x2F9EA: (0x927C,),
+    0x2F9EB: (0x93F9,),
+    0x2F9EC: (0x9415,),
+    0x2F9ED: (0x28BFA,),
+    0x2F9EE: (0x958B,),
+    0x2F9EF: (0x4995,),
+    0x2F9F0: (0x95B7,),
+    0x2F9F1: (0x28D77,),
+    0x2F9F2: (0x49E6,),
+    0x2F9F3: (0x96C3,),
+    0x2F9F4: (0x5DB2,),
+    0x2F9F5: (0x9723,),
+    0x2F9F6: (0x29145,),
+    0x2F9F7: (0x2921A,),
+    0x2F9F8: (0x4A6E,),
+    0x2F9F9: (0x4A76,),
+    0x2F9FA: (0x97E0,),
+    0x2F9FB: (0x2940A,),
+    0x2F9FC: (0x4AB2,),
+    0x2F9FD: (0x29496,),
+    0x2F9FE: (0x980B,),
+    0x2F9FF: (0x980B,),
+    0x2FA00: (0x9829,),
+    0x2FA01: (0x295B6,),
+    0x2FA02: (0x98E2,),
+    0x2FA03: (0x4B33,),
+    0x2FA04: (0x9929,),
+    0x2FA05: (0x99A7,),
+    0x2FA06: (0x99C2,),
+    0x2FA07: (0x99FE,),
+    0x2FA08: (0x4BCE,),
+    0x2FA09: (0x29B30,),
+    0x2FA0A: (0x9B12,),
+    0x2FA0B: (0x9C40,),
+    0x2FA0C: (0x9CFD,),
+    0x2FA0D: (0x4CCE,),
+    0x2FA0E: (0x4CED,),
+    0x2FA0F: (0x9D67,),
+    0x2FA10: (0x2A0CE,),
+    0x2FA11: (0x4CF8,),
+    0x2FA12: (0x2A105,),
+    0x2FA13: (0x2A20E,),
+    0x2FA14: (0x2A291,),
+    0x2FA15: (0x9EBB,),
+    0x2FA16: (0x4D56,),
+    0x2FA17: (0x9EF9,),
+    0x2FA18: (0x9EFE,),
+    0x2FA19: (0x9F05,),
+    0x2FA1A: (0x9F0F,),
+    0x2FA1B: (0x9F16,),
+    0x2FA1C: (0x9F3B,),
+    0x2FA1D: (0x2A600,),
+}
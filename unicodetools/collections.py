@@ -23,7 +23,18 @@ from __future__ import (division, print_function, absolute_import,
 import sys
 from . import err
 from . import coding
+import array
+import bisect
 import itertools
+import operator
+if sys.version_info.major == 2:
+    import collections as _collections_abc
+else:
+    import collections.abc as _collections_abc
+try:
+    import numpy as _numpy
+except ImportError:
+    _numpy = None
 
 
 # pylint: disable=E0602, W0622, E1101
@@ -283,6 +294,441 @@ class CodePointRange(object):
 
 
 
+class CodePointRangeMapping(object):
+    '''
+    A read-only, dict-like mapping from code points to values, stored as
+    sorted, non-overlapping ranges of code points with one value per range.
+
+    Unicode data files typically assign values to ranges of code points, so
+    storing one `(first, last, value)` entry per range rather than one dict
+    entry per code point reduces memory use by orders of magnitude for large
+    properties.  Range bounds are kept in parallel arrays of integers, and
+    lookup uses binary search, which is competitive with dict hashing for
+    the few hundred to few thousand ranges in a typical data file.
+
+    Initialization requires an iterable of `(first, last, value)` tuples, in
+    which `first` and `last` are integer code points.  Ranges must not
+    overlap.  All code points within a range share a single value object.
+
+    A typical property has only a handful of distinct value objects shared
+    by many ranges, so values are stored as a pool of distinct objects
+    (deduplicated by identity) plus a small per-range index into the pool,
+    rather than one object reference per range.
+
+    The mapping interface follows dict: `in`, `[]`, `get()`, iteration,
+    `len()`, `keys()`, `values()`, and `items()` are supported.  Iteration
+    yields individual code points in ascending order, and `len()` gives the
+    total number of code points, so that the mapping is interchangeable with
+    a dict keyed by code point.
+    '''
+    __slots__ = ['_firsts', '_lasts', '_value_pool', '_value_idx', '_len', '__weakref__']
+
+    def __init__(self, range_value_tuples):
+        sorted_tuples = sorted(range_value_tuples, key=lambda t: t[0])
+        # Bulk-construct the packed arrays and validate them with `map()`
+        # over the arrays, so that construction stays at the C level; the
+        # per-range Python scan only runs to produce an exact message once
+        # a problem has been detected.
+        firsts = array.array('l', (t[0] for t in sorted_tuples))
+        lasts = array.array('l', (t[1] for t in sorted_tuples))
+        if not all(map(operator.le, firsts, lasts)):
+            for first, last in zip(firsts, lasts):
+                if not first <= last:
+                    raise ValueError('Must have "first" <= "last" (U+{0:04X} > U+{1:04X})'.format(first, last))
+        if not all(map(operator.lt, lasts, firsts[1:])):
+            prev_last = -1
+            for first, last in zip(firsts, lasts):
+                if first <= prev_last:
+                    raise err.DataError('Overlapping code point ranges (U+{0:04X} <= U+{1:04X})'.format(first, prev_last))
+                prev_last = last
+        # Identity-based pooling:  equal values that are distinct objects
+        # stay distinct, so parsers that want maximal sharing intern or
+        # memoize value objects before constructing the mapping.  Pool
+        # indexes usually fit in an unsigned short.
+        pool_indexes = {}
+        value_pool = []
+        idx_list = []
+        for t in sorted_tuples:
+            value = t[2]
+            key = id(value)
+            try:
+                idx = pool_indexes[key]
+            except KeyError:
+                idx = pool_indexes[key] = len(value_pool)
+                value_pool.append(value)
+            idx_list.append(idx)
+        self._firsts = firsts
+        self._lasts = lasts
+        self._value_pool = value_pool
+        self._value_idx = array.array('H' if len(value_pool) <= 0xFFFF else 'l', idx_list)
+        self._len = (sum(lasts) - sum(firsts)) + len(firsts)
+
+    def __repr__(self):
+        return '{0}.{1}(<{2} ranges, {3} code points>)'.format(self.__module__, type(self).__name__, len(self._value_idx), self._len)
+
+    def __len__(self):
+        return self._len
+
+    def __contains__(self, value):
+        if not isinstance(value, int):
+            return False
+        i = bisect.bisect_right(self._firsts, value) - 1
+        return i >= 0 and value <= self._lasts[i]
+
+    def __getitem__(self, cp):
+        i = bisect.bisect_right(self._firsts, cp) - 1
+        if i < 0 or cp > self._lasts[i]:
+            raise KeyError(cp)
+        return self._value_pool[self._value_idx[i]]
+
+    def get(self, cp, default=None):
+        i = bisect.bisect_right(self._firsts, cp) - 1
+        if i < 0 or cp > self._lasts[i]:
+            return default
+        return self._value_pool[self._value_idx[i]]
+
+    def __iter__(self):
+        for first, last in zip(self._firsts, self._lasts):
+            for cp in range(first, last+1):
+                yield cp
+
+    def keys(self):
+        return iter(self)
+
+    def values(self):
+        pool = self._value_pool
+        idx = self._value_idx
+        for n, (first, last) in enumerate(zip(self._firsts, self._lasts)):
+            value = pool[idx[n]]
+            for cp in range(first, last+1):
+                yield value
+
+    def items(self):
+        pool = self._value_pool
+        idx = self._value_idx
+        for n, (first, last) in enumerate(zip(self._firsts, self._lasts)):
+            value = pool[idx[n]]
+            for cp in range(first, last+1):
+                yield (cp, value)
+
+    def __eq__(self, other):
+        if isinstance(other, type(self)):
+            return (self._firsts == other._firsts and self._lasts == other._lasts and
+                    [self._value_pool[i] for i in self._value_idx] == [other._value_pool[i] for i in other._value_idx])
+        if isinstance(other, dict):
+            return len(self) == len(other) and all(cp in other and other[cp] == v for cp, v in self.items())
+        return NotImplemented
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        if eq is NotImplemented:
+            return eq
+        return not eq
+
+
+
+
+class CodePointDenseMapping(object):
+    '''
+    A dict-like mapping from code points to values, backed by a dense list
+    of length 0x110000 indexed directly by code point.
+
+    When most code points are assigned values, as with UnicodeData.txt, a
+    dense list is far more compact than a dict with one hashed entry per
+    code point, and lookup is direct indexing with no hashing or probing.
+    Unassigned code points hold None and are not considered part of the
+    mapping.
+
+    Initialization requires a list of length 0x110000 in which the entry
+    for each unassigned code point is None.  The list is used directly, not
+    copied.
+
+    The mapping interface follows dict: `in`, `[]`, `get()`, iteration,
+    `len()`, `keys()`, `values()`, and `items()` are supported.  Iteration
+    yields assigned code points in ascending order.
+    '''
+    __slots__ = ['_dense', '_len', '__weakref__']
+
+    def __init__(self, dense):
+        if len(dense) != 0x110000:
+            raise ValueError('A list of length 0x110000 is required')
+        self._dense = dense
+        self._len = sum(1 for v in dense if v is not None)
+
+    def __repr__(self):
+        return '{0}.{1}(<{2} code points>)'.format(self.__module__, type(self).__name__, self._len)
+
+    def __len__(self):
+        return self._len
+
+    def __contains__(self, value):
+        if not isinstance(value, int):
+            return False
+        return 0 <= value <= 0x10FFFF and self._dense[value] is not None
+
+    def __getitem__(self, cp):
+        value = self._dense[cp]
+        if value is None:
+            raise KeyError(cp)
+        return value
+
+    def get(self, cp, default=None):
+        if not 0 <= cp <= 0x10FFFF:
+            return default
+        value = self._dense[cp]
+        if value is None:
+            return default
+        return value
+
+    def __iter__(self):
+        for cp, value in enumerate(self._dense):
+            if value is not None:
+                yield cp
+
+    def keys(self):
+        return iter(self)
+
+    def values(self):
+        for value in self._dense:
+            if value is not None:
+                yield value
+
+    def items(self):
+        for cp, value in enumerate(self._dense):
+            if value is not None:
+                yield (cp, value)
+
+    def __eq__(self, other):
+        if isinstance(other, type(self)):
+            return self._dense == other._dense
+        if isinstance(other, dict):
+            return len(self) == len(other) and all(cp in other and other[cp] == v for cp, v in self.items())
+        return NotImplemented
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        if eq is NotImplemented:
+            return eq
+        return not eq
+
+
+
+
+class CodePointBitset(object):
+    '''
+    A read-only set of code points, stored as a two-stage lookup table over
+    a bitmap.
+
+    Membership of every code point is encoded as one bit in a bitmap of
+    0x110000 bits.  The bitmap is split into 64-byte blocks (512 code points
+    each), duplicate blocks are stored only once, and a first-stage array
+    maps the high bits of a code point to its block's offset in the
+    deduplicated second stage.  Because large spans of the code space are
+    uniformly inside or outside a typical property, deduplication collapses
+    the 136 KB bitmap to a few KB, so that lookups are two indexed loads
+    and a bit test on data that stays cache-resident.
+
+    Initialization requires an iterable of `(first, last)` tuples of integer
+    code points; ranges may overlap or repeat, since each simply sets bits.
+
+    The container interface follows set: `in`, iteration, and `len()` are
+    supported, with iteration yielding code points in ascending order.
+    '''
+    __slots__ = ['_stage1', '_stage2', '_len', '__weakref__']
+
+    _popcounts = [bin(n).count('1') for n in range(256)]
+
+    def __init__(self, code_point_ranges):
+        bitmap = bytearray(0x110000 >> 3)
+        for first, last in code_point_ranges:
+            if not 0 <= first <= last <= 0x10FFFF:
+                raise ValueError('Must have 0 <= "first" <= "last" <= 0x10FFFF')
+            # Set bits `first` through `last` a byte at a time:  partial
+            # bytes at the ends get masks, and whole bytes in between are
+            # filled with a single slice assignment
+            first_byte = first >> 3
+            last_byte = last >> 3
+            first_mask = (0xFF << (first & 7)) & 0xFF
+            last_mask = 0xFF >> (7 - (last & 7))
+            if first_byte == last_byte:
+                bitmap[first_byte] |= first_mask & last_mask
+            else:
+                bitmap[first_byte] |= first_mask
+                bitmap[last_byte] |= last_mask
+                if last_byte - first_byte > 1:
+                    bitmap[first_byte+1:last_byte] = b'\xff' * (last_byte - first_byte - 1)
+        stage1 = array.array('l', [0]*(len(bitmap)//64))
+        stage2 = bytearray()
+        block_offsets = {}
+        for n in range(len(stage1)):
+            block = bytes(bitmap[n*64:(n+1)*64])
+            try:
+                offset = block_offsets[block]
+            except KeyError:
+                offset = block_offsets[block] = len(stage2)
+                stage2.extend(block)
+            stage1[n] = offset
+        self._stage1 = stage1
+        self._stage2 = stage2
+        popcounts = self._popcounts
+        self._len = sum(popcounts[b] for b in bitmap)
+
+    def __repr__(self):
+        return '{0}.{1}(<{2} code points>)'.format(self.__module__, type(self).__name__, self._len)
+
+    def __len__(self):
+        return self._len
+
+    def __contains__(self, value):
+        if not isinstance(value, int) or not 0 <= value <= 0x10FFFF:
+            return False
+        return bool((self._stage2[self._stage1[value >> 9] + ((value >> 3) & 0x3F)] >> (value & 7)) & 1)
+
+    def contains_array(self, code_points):
+        '''
+        Test membership of a sequence of integer code points at once,
+        returning one bool per code point.  Out-of-range values test as
+        not contained, as with `in`.
+
+        If NumPy is available and `code_points` is a NumPy array, the bit
+        tests are vectorized over the whole array and a NumPy bool array
+        is returned; otherwise a list of bools is returned.
+        '''
+        if _numpy is not None and isinstance(code_points, _numpy.ndarray):
+            cps = code_points.astype(_numpy.int64, copy=False)
+            stage1 = _numpy.asarray(self._stage1)
+            stage2 = _numpy.frombuffer(self._stage2, dtype=_numpy.uint8)
+            valid = (cps >= 0) & (cps <= 0x10FFFF)
+            safe = _numpy.where(valid, cps, 0)
+            bits = (stage2[stage1[safe >> 9] + ((safe >> 3) & 0x3F)] >> (safe & 7)) & 1
+            return (bits != 0) & valid
+        contains = self.__contains__
+        return [contains(cp) for cp in code_points]
+
+    def __iter__(self):
+        stage2 = self._stage2
+        for block_n, offset in enumerate(self._stage1):
+            base = block_n << 9
+            for byte_n in range(64):
+                byte = stage2[offset + byte_n]
+                if byte:
+                    cp = base + (byte_n << 3)
+                    for bit in range(8):
+                        if (byte >> bit) & 1:
+                            yield cp + bit
+
+    def __eq__(self, other):
+        if isinstance(other, type(self)):
+            return self._stage1 == other._stage1 and self._stage2 == other._stage2
+        if isinstance(other, (set, frozenset)):
+            return self._len == len(other) and all(cp in other for cp in self)
+        return NotImplemented
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        if eq is NotImplemented:
+            return eq
+        return not eq
+
+
+
+
+class CodePointBitsetMapping(object):
+    '''
+    A read-only, dict-like mapping from code points to dicts of boolean
+    properties, backed by one CodePointBitset per property.
+
+    Boolean property files assign multiple named properties to overlapping
+    ranges of code points.  Storing each property as a bitset keeps the
+    total size at a few KB per property, instead of one dict of property
+    names per code point; the per-code-point dicts are built on demand
+    from the bitsets.
+
+    Initialization requires an iterable of `(property_name, code point
+    ranges)` pairs, in which the ranges are `(first, last)` tuples of
+    integer code points suitable for CodePointBitset.
+
+    The mapping interface follows dict: `in`, `[]`, `get()`, iteration,
+    `len()`, `keys()`, `values()`, and `items()` are supported.  Iteration
+    yields code points with at least one property, in ascending order.
+    '''
+    __slots__ = ['_bitsets', '_union', '__weakref__']
+
+    def __init__(self, property_ranges):
+        if isinstance(property_ranges, dict):
+            property_ranges = property_ranges.items()
+        bitsets = {}
+        all_ranges = []
+        for prop, ranges in property_ranges:
+            if prop in bitsets:
+                raise err.DataError('Duplicate property "{0}"'.format(prop))
+            ranges = list(ranges)
+            bitsets[prop] = CodePointBitset(ranges)
+            all_ranges.extend(ranges)
+        self._bitsets = bitsets
+        self._union = CodePointBitset(all_ranges)
+
+    def __repr__(self):
+        return '{0}.{1}(<{2} properties, {3} code points>)'.format(self.__module__, type(self).__name__, len(self._bitsets), len(self._union))
+
+    def __len__(self):
+        return len(self._union)
+
+    def __contains__(self, value):
+        return value in self._union
+
+    def __getitem__(self, cp):
+        if cp not in self._union:
+            raise KeyError(cp)
+        return dict((prop, True) for prop, bitset in self._bitsets.items() if cp in bitset)
+
+    def get(self, cp, default=None):
+        if cp not in self._union:
+            return default
+        return self[cp]
+
+    def __iter__(self):
+        return iter(self._union)
+
+    def keys(self):
+        return iter(self)
+
+    def values(self):
+        for cp in self._union:
+            yield self[cp]
+
+    def items(self):
+        for cp in self._union:
+            yield (cp, self[cp])
+
+    def __eq__(self, other):
+        if isinstance(other, type(self)):
+            return self._bitsets == other._bitsets
+        if isinstance(other, dict):
+            return len(self) == len(other) and all(cp in other and other[cp] == v for cp, v in self.items())
+        return NotImplemented
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        if eq is NotImplemented:
+            return eq
+        return not eq
+
+
+
+
+# The code point mappings implement the read-only dict interface and the
+# bitset implements the read-only set interface, so register them as
+# virtual subclasses; isinstance() checks against the abstract base
+# classes then accept them wherever a plain dict or set would be used.
+_collections_abc.Mapping.register(CodePointRangeMapping)
+_collections_abc.Mapping.register(CodePointDenseMapping)
+_collections_abc.Mapping.register(CodePointBitsetMapping)
+_collections_abc.Set.register(CodePointBitset)
+
+
+
+
 def codepoints_to_codepointranges(*containers, **kwargs):
     '''
     Convert containers of code points into a list of CodePointRange
@@ -30,13 +30,27 @@ from __future__ import (division, print_function, absolute_import,
 import sys
 import os
 import io
-import collections
+import array
+import contextlib
+import functools
+import importlib
+import mmap
 import zipfile
 import re
 import pkgutil
 import fractions
+import hashlib
+import pickle
+import tempfile
+import threading
+import weakref
 from . import coding
 from . import err
+from .collections import CodePointBitsetMapping, CodePointRangeMapping
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 # pylint: disable=E0602, W0622
@@ -54,6 +68,424 @@ if sys.maxunicode == 0xFFFF:
 UNICODE_VERSION = '9.0.0'
 
 
+# Newest modification time of the modules that determine the form of
+# processed data.  On-disk caches of processed data older than this are
+# considered stale, so that caches never outlive format changes.
+try:
+    from . import collections as _collections_module
+    _PARSED_DATA_MTIME = max(os.path.getmtime(os.path.abspath(__file__)),
+                             os.path.getmtime(os.path.abspath(_collections_module.__file__)))
+    del _collections_module
+except (OSError, AttributeError):
+    _PARSED_DATA_MTIME = None
+
+
+# Opt-in consistency checking.  When the environment variable is set,
+# parsers cross-check fast code paths against slower reference
+# implementations and raise err.DataError on any disagreement.
+_VALIDATE = bool(os.environ.get('UNICODETOOLS_VALIDATE'))
+
+
+# Accumulators of parsed data must preserve data file order.  The built-in
+# dict guarantees insertion order on Python 3.7+ and is smaller and faster
+# than collections.OrderedDict, which is only needed on older versions.
+if sys.version_info[:2] >= (3, 7):
+    _OrderedDict = dict
+else:
+    import collections
+    _OrderedDict = collections.OrderedDict
+
+
+def _default_cache_dir():
+    '''
+    Return the directory for on-disk caches of processed data.
+
+    The environment variable UNICODETOOLS_CACHE_DIR takes precedence when
+    set.  Otherwise the platform's per-user cache location is used
+    (XDG_CACHE_HOME or ~/.cache on Linux and similar systems,
+    ~/Library/Caches on macOS, LOCALAPPDATA on Windows), with a per-user
+    directory under the system temp directory as a last resort.
+    '''
+    env_dir = os.environ.get('UNICODETOOLS_CACHE_DIR')
+    if env_dir:
+        return env_dir
+    if sys.platform.startswith('win'):
+        base = os.environ.get('LOCALAPPDATA')
+        if base:
+            return os.path.join(base, 'unicodetools', 'Cache')
+    elif sys.platform == 'darwin':
+        home = os.path.expanduser('~')
+        if home != '~':
+            return os.path.join(home, 'Library', 'Caches', 'unicodetools')
+    else:
+        base = os.environ.get('XDG_CACHE_HOME')
+        if not base:
+            home = os.path.expanduser('~')
+            if home != '~':
+                base = os.path.join(home, '.cache')
+        if base:
+            return os.path.join(base, 'unicodetools')
+    if hasattr(os, 'getuid'):
+        return os.path.join(tempfile.gettempdir(), 'unicodetools-cache-{0}'.format(os.getuid()))
+    return os.path.join(tempfile.gettempdir(), 'unicodetools-cache')
+
+
+# pylint: disable=E0602
+if sys.version_info.major == 2:
+    def _hex_to_int(s):
+        '''
+        Convert a hex string representing a code point into an integer.
+        '''
+        return int(s, 16)
+else:
+    def _hex_to_int(s, _fromhex=bytes.fromhex, _from_bytes=int.from_bytes):
+        '''
+        Convert a hex string representing a code point into an integer.
+
+        Padding to 8 hex digits and then decoding as a big-endian 32-bit
+        uint is significantly faster than `int(s, 16)` for the 4-6 digit
+        code points that appear in the data files.
+        '''
+        return _from_bytes(_fromhex(s.zfill(8)), 'big')
+# pylint: enable=E0602
+
+
+# Memoization for hex-to-int conversion on parse hot paths.  The data files
+# contain only tens of thousands of distinct hex tokens, many of which
+# appear several times, and a dict hit is several times faster than
+# re-parsing a string.  The cache is module level so that it persists
+# across parses; it is bounded by the number of distinct tokens in the data
+# files, which is small compared to the parsed data itself.
+_hex_to_int_cache = {}
+
+def _hex_to_int_cached(s, _cache=_hex_to_int_cache):
+    '''
+    Memoized version of `_hex_to_int()` for repeatedly occurring tokens.
+    '''
+    try:
+        return _cache[s]
+    except KeyError:
+        value = _cache[s] = _hex_to_int(s)
+        return value
+
+
+# Interning for heavily repeated short string values (general categories,
+# bidi classes, decomposition types, block and script names, ...).  Rows
+# then share one string object per distinct value instead of owning an
+# independent copy, and downstream equality checks can short-circuit on
+# identity.  Py2's intern() rejects unicode strings, so a dedup dict is
+# used there instead.
+# pylint: disable=E0602
+if sys.version_info.major == 2:
+    _string_intern_cache = {}
+    def _intern(s):
+        '''
+        Return a canonical shared copy of a string.
+        '''
+        return _string_intern_cache.setdefault(s, s)
+else:
+    _intern = sys.intern
+# pylint: enable=E0602
+
+
+# Value sets of the enumerated single-value properties, taken from the
+# UCD documentation.  They pre-seed the raw-token memo in
+# `_iter_single_value_lines()`, so lines carrying these values look up an
+# interned string from a raw bytes token instead of decoding and
+# interning per line.  Unlisted values are simply memoized on first use,
+# so these constants never need to be exhaustive.
+_EAST_ASIAN_WIDTH_VALUES = ('A', 'F', 'H', 'N', 'Na', 'W')
+_JOINING_TYPE_VALUES = ('C', 'D', 'L', 'R', 'T', 'U')
+_BIDI_CLASS_VALUES = ('AL', 'AN', 'B', 'BN', 'CS', 'EN', 'ES', 'ET', 'FSI',
+                      'L', 'LRE', 'LRI', 'LRO', 'NSM', 'ON', 'PDF', 'PDI',
+                      'R', 'RLE', 'RLI', 'RLO', 'S', 'WS')
+_NUMERIC_TYPE_VALUES = ('Decimal', 'Digit', 'Numeric')
+_known_value_tokens = dict((v.encode('ascii'), _intern(v))
+                           for v in (_EAST_ASIAN_WIDTH_VALUES +
+                                     _JOINING_TYPE_VALUES +
+                                     _BIDI_CLASS_VALUES +
+                                     _NUMERIC_TYPE_VALUES))
+
+
+if numpy is None:
+    def _hex_seq_to_tuple(s):
+        '''
+        Convert a space-separated sequence of hex code points into a tuple
+        of integers.
+        '''
+        return tuple(_hex_to_int(x) for x in s.split('\x20'))
+else:
+    def _hex_seq_to_tuple(s):
+        '''
+        Convert a space-separated sequence of hex code points into a tuple
+        of integers.
+
+        When NumPy is available, all code points in the sequence are packed
+        into a single buffer and decoded with one vectorized `frombuffer()`
+        call, instead of one Python-level int conversion per code point.
+        '''
+        packed = bytearray.fromhex(''.join(x.zfill(8) for x in s.split('\x20')))
+        return tuple(numpy.frombuffer(packed, dtype='>u4').tolist())
+
+
+class _LazyCodePoints(object):
+    '''
+    A lazily decoded, immutable sequence of code points, created from a
+    space-separated string of hex values.
+
+    Decoding to integers is deferred until the sequence is first used, and
+    the decoded tuple is then cached.  This avoids decoding every code point
+    in a data file when only a small subset is ever accessed.  The sequence
+    compares equal to the corresponding tuple of integers.
+    '''
+    __slots__ = ['_raw', '_decoded']
+
+    def __init__(self, raw):
+        self._raw = raw
+        self._decoded = None
+
+    def _as_tuple(self):
+        decoded = self._decoded
+        if decoded is None:
+            decoded = self._decoded = _hex_seq_to_tuple(self._raw)
+        return decoded
+
+    def __repr__(self):
+        return repr(self._as_tuple())
+
+    def __len__(self):
+        return len(self._as_tuple())
+
+    def __getitem__(self, index):
+        return self._as_tuple()[index]
+
+    def __iter__(self):
+        return iter(self._as_tuple())
+
+    def __hash__(self):
+        return hash(self._as_tuple())
+
+    def __eq__(self, other):
+        if isinstance(other, type(self)):
+            return self._as_tuple() == other._as_tuple()
+        if isinstance(other, tuple):
+            return self._as_tuple() == other
+        return NotImplemented
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        if eq is NotImplemented:
+            return eq
+        return not eq
+
+
+
+
+# Fields stored for each code point in parsed UnicodeData.  The simple case
+# mappings are always integer code points, so they get packed integer
+# columns; the other fields are stored in plain list columns.
+_UNICODEDATA_INT_FIELDS = ('Simple_Uppercase_Mapping',
+                           'Simple_Lowercase_Mapping',
+                           'Simple_Titlecase_Mapping')
+_UNICODEDATA_FIELDS = ('Name', 'General_Category', 'Canonical_Combining_Class',
+                       'Bidi_Class', 'Decomposition_Type', 'Decomposition_Mapping',
+                       'Numeric_Type', 'Numeric_Value', 'Bidi_Mirrored',
+                       'Unicode_1_Name', 'ISO_Comment') + _UNICODEDATA_INT_FIELDS
+
+
+class _UnicodeDataRow(object):
+    '''
+    A dict-like view of the UnicodeData fields for a single code point,
+    reading from and writing through to the column storage of a
+    `_UnicodeDataTable`.
+    '''
+    __slots__ = ['_columns', '_cp']
+
+    def __init__(self, columns, cp):
+        self._columns = columns
+        self._cp = cp
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+    def __len__(self):
+        return len(_UNICODEDATA_FIELDS)
+
+    def __contains__(self, field):
+        return field in self._columns
+
+    def __getitem__(self, field):
+        return self._columns[field][self._cp]
+
+    def __setitem__(self, field, value):
+        self._columns[field][self._cp] = value
+
+    def get(self, field, default=None):
+        try:
+            column = self._columns[field]
+        except KeyError:
+            return default
+        return column[self._cp]
+
+    def __iter__(self):
+        return iter(_UNICODEDATA_FIELDS)
+
+    def keys(self):
+        return iter(_UNICODEDATA_FIELDS)
+
+    def values(self):
+        cp = self._cp
+        columns = self._columns
+        return iter([columns[field][cp] for field in _UNICODEDATA_FIELDS])
+
+    def items(self):
+        cp = self._cp
+        columns = self._columns
+        return iter([(field, columns[field][cp]) for field in _UNICODEDATA_FIELDS])
+
+    def __eq__(self, other):
+        if isinstance(other, type(self)):
+            return dict(self.items()) == dict(other.items())
+        if isinstance(other, dict):
+            return dict(self.items()) == other
+        return NotImplemented
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        if eq is NotImplemented:
+            return eq
+        return not eq
+
+
+class _UnicodeDataTable(object):
+    '''
+    Column-oriented storage for parsed UnicodeData.
+
+    Instead of one dict per code point, the table keeps one column per
+    field:  packed arrays of integers for the simple case mappings and
+    plain lists for the other fields.  This eliminates per-code-point dict
+    overhead, which dominates memory use once the ~1M-code-point surrogate,
+    private-use, and ideograph ranges are expanded, and makes per-field
+    iteration cache friendly.
+
+    Indexing by code point returns a lightweight `_UnicodeDataRow` view
+    with the usual dict interface, so `table[cp]['Name']` and
+    `table[cp]['Numeric_Type'] = value` work as they did with dict
+    storage.  The mapping interface otherwise follows dict: `in`, `get()`,
+    iteration, `len()`, `keys()`, `values()`, and `items()` are supported,
+    with iteration yielding assigned code points in ascending order.
+    '''
+
+    def __init__(self):
+        columns = {}
+        for field in _UNICODEDATA_FIELDS:
+            if field in _UNICODEDATA_INT_FIELDS:
+                columns[field] = array.array('l', [0])*0x110000
+            else:
+                columns[field] = [None]*0x110000
+        self._columns = columns
+        self._assigned = bytearray(0x110000)
+        self._len = None
+
+    def __repr__(self):
+        return '{0}.{1}(<{2} code points>)'.format(self.__module__, type(self).__name__, len(self))
+
+    def __len__(self):
+        if self._len is None:
+            self._len = sum(self._assigned)
+        return self._len
+
+    def __contains__(self, value):
+        if not isinstance(value, int):
+            return False
+        return 0 <= value <= 0x10FFFF and self._assigned[value] == 1
+
+    def __getitem__(self, cp):
+        if not self._assigned[cp]:
+            raise KeyError(cp)
+        return _UnicodeDataRow(self._columns, cp)
+
+    def __setitem__(self, cp, fields):
+        columns = self._columns
+        for field, value in fields.items():
+            columns[field][cp] = value
+        self._assigned[cp] = 1
+        self._len = None
+
+    def get(self, cp, default=None):
+        if not 0 <= cp <= 0x10FFFF or not self._assigned[cp]:
+            return default
+        return _UnicodeDataRow(self._columns, cp)
+
+    def fill_range(self, first, last, fields, names, decomposition_mappings=None):
+        '''
+        Assign a range of code points in bulk with slice assignment per
+        column, rather than one `__setitem__()` call per code point.
+
+        `fields` gives the field values shared by every code point in the
+        range.  `names` gives the per-code-point Name column values, and
+        `decomposition_mappings` optionally the Decomposition_Mapping
+        values; when the latter is omitted, each code point decomposes to
+        itself.  The simple case mappings are always the identity for the
+        ranges expanded this way.
+        '''
+        n = last - first + 1
+        columns = self._columns
+        for field, value in fields.items():
+            if field == 'Name' or field == 'Decomposition_Mapping' or field in _UNICODEDATA_INT_FIELDS:
+                continue
+            columns[field][first:last+1] = [value]*n
+        columns['Name'][first:last+1] = list(names)
+        if decomposition_mappings is None:
+            decomposition_mappings = [(cp,) for cp in range(first, last+1)]
+        columns['Decomposition_Mapping'][first:last+1] = list(decomposition_mappings)
+        identity = array.array('l', range(first, last+1))
+        for field in _UNICODEDATA_INT_FIELDS:
+            columns[field][first:last+1] = identity
+        self._assigned[first:last+1] = b'\x01'*n
+        self._len = None
+
+    def as_columns(self):
+        '''
+        Return the underlying column storage as a dict mapping field names
+        to columns, for vectorized processing of entire fields.
+        '''
+        return self._columns
+
+    def __iter__(self):
+        for cp, assigned in enumerate(self._assigned):
+            if assigned:
+                yield cp
+
+    def keys(self):
+        return iter(self)
+
+    def values(self):
+        columns = self._columns
+        for cp, assigned in enumerate(self._assigned):
+            if assigned:
+                yield _UnicodeDataRow(columns, cp)
+
+    def items(self):
+        columns = self._columns
+        for cp, assigned in enumerate(self._assigned):
+            if assigned:
+                yield (cp, _UnicodeDataRow(columns, cp))
+
+    def __eq__(self, other):
+        if isinstance(other, type(self)):
+            return self._assigned == other._assigned and self._columns == other._columns
+        if isinstance(other, dict):
+            return len(self) == len(other) and all(cp in other and other[cp] == v for cp, v in self.items())
+        return NotImplemented
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        if eq is NotImplemented:
+            return eq
+        return not eq
+
+
 
 
 # Assemble data file grammar
@@ -133,6 +565,130 @@ for d in (ucd_subexpression_regex_patterns, ucd_property_regex_patterns, ucd_oth
     ucd_regex_patterns.update(d)
 
 
+# Shared line patterns, assembled from the common sub-expression patterns
+# exactly once at module level.  Only the pattern strings are built at import
+# time; compiling the large interpolated character classes is measurable, so
+# compilation is deferred to `_compile_line_re()`/`_as_bytes_pattern()` on
+# first use by a parser.
+#
+# Line patterns for `_get_single_string_property()` are anchored at the start
+# of a line and compiled with re.MULTILINE, so that an entire data file can
+# be processed with a single `finditer()` rather than a Python-level loop
+# over lines.
+_codepoint_single_property_line_pattern = r'(?P<Code_Point>{codePoint}|{codePoint}\.\.{codePoint})\s*;\s*(?P<Property>{Generic_Property})\s*#.*$'.format(**ucd_regex_patterns)
+
+_codepoint_single_value_line_pattern = r'^(?P<Code_Point>{codePoint}|{codePoint}\.\.{codePoint})\s*;\s*(?P<Value>{Generic_Value})\s*#.*$'.format(**ucd_regex_patterns)
+
+_blocks_line_pattern = r'^(?P<Code_Point>{codePoint}|{codePoint}\.\.{codePoint})\s*;\s*(?P<Value>{Block})$'.format(**ucd_regex_patterns)
+
+_derived_numeric_values_line_pattern = r'^(?P<Code_Point>{codePoint}|{codePoint}\.\.{codePoint})\s*;\s*{decimal}\s*;\s*;\s*(?P<Value>{rational})\s*#.*$'.format(**ucd_regex_patterns)
+
+_script_extensions_line_pattern = r'^(?P<Code_Point>{codePoint}|{codePoint}\.\.{codePoint})\s*;\s*(?P<Scripts>{Script}(\x20{Script})*)\s*#.*$'.format(**ucd_regex_patterns)
+
+_confusables_line_pattern = r'^(?P<Code_Point>{codePoint})\s*;\s*(?P<confusable>{codePoints})\s*;\s*MA\s*#.*$'.format(**ucd_regex_patterns)
+
+# Verbose template for UnicodeData.txt lines; whitespace is stripped before
+# compiling (all significant spaces are written as `\x20`)
+_unicodedata_pattern = r'''
+                      (?P<Code_Point> {codePoint});
+                      (?P<Name> {name}|<{name}(?:,\x20(?:First|Last))?>);
+                      (?P<General_Category> {General_Category_Abbr});
+                      (?P<Canonical_Combining_Class> {name});
+                      (?P<Bidi_Class> {Bidi_Class_Abbr});
+                      (?: (?:<(?P<Decomposition_Type> {name})>\x20)? (?P<Decomposition_Mapping> {Decomposition_Mapping}) )?;
+                      (?P<Numeric> ;;|{digits};{digits};{digits}|;{digits};{digits}|;;{rational});
+                      (?P<Bidi_Mirrored> Y|N);
+                      (?P<Unicode_1_Name> {annotatedName}|);
+                      (?P<ISO_Comment>);
+                      (?P<Simple_Uppercase_Mapping> {Simple_Uppercase_Mapping})?;
+                      (?P<Simple_Lowercase_Mapping> {Simple_Lowercase_Mapping})?;
+                      (?P<Simple_Titlecase_Mapping> {Simple_Titlecase_Mapping})?
+                      \s*$
+                      '''.format(**ucd_regex_patterns)
+
+
+
+# re.ASCII does not exist under Python 2, where str patterns already have
+# ASCII semantics by default
+_RE_ASCII = getattr(re, 'ASCII', 0)
+
+
+_line_re_cache = {}
+
+def _compile_line_re(pattern, flags=re.MULTILINE):
+    '''
+    Compile a line pattern as a string regex on first use and cache the
+    result.  Line patterns are pure ASCII, so re.ASCII (when available)
+    skips Unicode-aware matching.
+    '''
+    try:
+        return _line_re_cache[pattern]
+    except KeyError:
+        line_re = re.compile(pattern, flags | _RE_ASCII)
+        _line_re_cache[pattern] = line_re
+        return line_re
+
+
+_bytes_pattern_cache = {}
+
+def _as_bytes_pattern(pattern, flags=re.MULTILINE):
+    '''
+    Compile a line pattern as a bytes regex on first use and cache the
+    result.  All data file patterns are pure ASCII, so matching raw bytes
+    directly avoids decoding entire files; only matched substrings need
+    decoding.
+    '''
+    try:
+        return _bytes_pattern_cache[pattern]
+    except KeyError:
+        bytes_re = re.compile(pattern.encode('ascii'), flags)
+        _bytes_pattern_cache[pattern] = bytes_re
+        return bytes_re
+
+
+
+
+# Tables for deriving Hangul syllable names, from The Unicode Standard,
+# Version 9.0, Chapter 3.12.
+_JAMO_L_TABLE = ('G', 'GG', 'N', 'D', 'DD', 'R', 'M', 'B', 'BB',
+                 'S', 'SS', '', 'J', 'JJ', 'C', 'K', 'T', 'P', 'H')
+_JAMO_V_TABLE = ('A', 'AE', 'YA', 'YAE', 'EO', 'E', 'YEO', 'YE', 'O',
+                 'WA', 'WAE', 'OE', 'YO', 'U', 'WEO', 'WE', 'WI',
+                 'YU', 'EU', 'YI', 'I')
+_JAMO_T_TABLE = ('', 'G', 'GG', 'GS', 'N', 'NJ', 'NH', 'D', 'L', 'LG', 'LM',
+                 'LB', 'LS', 'LT', 'LP', 'LH', 'M', 'B', 'BS',
+                 'S', 'SS', 'NG', 'J', 'C', 'K', 'T', 'P', 'H')
+
+# Precomputed names and decomposition mappings for the 11,172 Hangul
+# syllables, indexed by `cp - 0xAC00`.  These follow the algorithms given in
+# The Unicode Standard, Version 9.0, Chapter 3.12, in the section "Sample
+# Code for Hangul Algorithms"; <LVT> syllables decompose into <LV, T> and
+# <LV> syllables into <L, V>, in accordance with the section "Hangul
+# Syllable Decomposition."  Computing all syllables once at import time
+# replaces per-code-point arithmetic and string formatting in the
+# UnicodeData parse with plain tuple indexing.
+_HANGUL_NAMES = tuple('HANGUL SYLLABLE {0}{1}{2}'.format(l, v, t)
+                      for l in _JAMO_L_TABLE
+                      for v in _JAMO_V_TABLE
+                      for t in _JAMO_T_TABLE)
+_HANGUL_DM = tuple((0xAC00 + (l*21 + v)*28, 0x11A7 + t) if t else (0x1100 + l, 0x1161 + v)
+                   for l in range(19) for v in range(21) for t in range(28))
+
+
+
+
+def _warm_worker(files_class, unicode_version, data_path, name):
+    '''
+    Build one property in a worker process, so that its processed data is
+    stored in the on-disk cache; see `Files.warm()`.  This must be a
+    module-level function so that it pickles for use with
+    ProcessPoolExecutor.
+    '''
+    files = files_class(unicode_version=unicode_version, data_path=data_path)
+    getattr(files, name)
+    files.close()
+
+
 
 
 class Files(object):
@@ -144,8 +700,14 @@ class Files(object):
     package data directory.  Files outside the package directory may also be
     used by providing `data_path`.  Note that data files for other versions
     must currently have a format that is strictly compatible with 9.0.0.
+
+    When `background_prefetch` is true, a daemon thread is started that
+    reads and decompresses all known data files into the instance's
+    raw-data cache, overlapping the I/O with whatever the constructing
+    thread does next; see `_background_prefetch()`.
     '''
-    def __init__(self, unicode_version=None, data_path=None):
+    def __init__(self, unicode_version=None, data_path=None,
+                 background_prefetch=False):
         if any(x is not None and not isinstance(x, str) for x in (unicode_version, data_path)):
             raise TypeError('Options "unicode_version" and "data_path" must be None or strings')
         if unicode_version is None and data_path is None:
@@ -153,43 +715,369 @@ class Files(object):
         else:
             self.unicode_version = unicode_version
         self.data_path = data_path
+        # Opened data file archives, keyed by data file name; see
+        # `_open_zip()`.
+        self._zip_cache = {}
+        # Decompressed raw data staged by `prefetch()`, keyed by data file
+        # name; entries are consumed by the loaders on first use.
+        self._raw_cache = {}
+        # Loaded raw data, keyed by data file name; see
+        # `_load_data_bytes()`.
+        self._data_bytes_cache = {}
+        self._background_prefetch_thread = None
+        if background_prefetch:
+            thread = threading.Thread(target=self._background_prefetch)
+            thread.daemon = True
+            thread.start()
+            self._background_prefetch_thread = thread
+
+
+    def _open_zip(self, fname):
+        '''
+        Return an open zipfile.ZipFile for a data file's zip archive,
+        cached for the lifetime of the instance (or until `close()`).
 
+        Without caching, every property load re-reads the archive and
+        re-parses its central directory; with a dozen data files per
+        instance, that is a dozen redundant archive opens per session.
+        '''
+        try:
+            return self._zip_cache[fname]
+        except KeyError:
+            pass
+        if self.data_path is not None:
+            z = zipfile.ZipFile(os.path.join(self.data_path, '{0}.zip'.format(fname)))
+        else:
+            # Only zipped data is assumed in the package data directory.
+            # When the package is installed as unpacked files (the common
+            # case), open the archive directly from disk, so that ZipFile
+            # reads just the central directory and the members actually
+            # used, instead of `pkgutil.get_data()` copying the entire
+            # archive into memory first.  `pkgutil.get_data()` remains as a
+            # fallback for zipped installs (egg/zipapp), where the data
+            # files are not on the filesystem.
+            zip_path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    'data', self.unicode_version, '{0}.zip'.format(fname))
+            if os.path.isfile(zip_path):
+                z = zipfile.ZipFile(zip_path)
+            else:
+                zipped_raw_data = pkgutil.get_data('unicodetools', 'data/{0}/{1}.zip'.format(self.unicode_version, fname))
+                if zipped_raw_data is None:
+                    raise err.DataError('Could not find unicodetools package data file "data/{0}/{1}.zip"'.format(self.unicode_version, fname))
+                z = zipfile.ZipFile(io.BytesIO(zipped_raw_data))
+        self._zip_cache[fname] = z
+        return z
 
-    def _load_data(self, fname):
+
+    def close(self):
         '''
-        Load data file, either from the package data directory or from
-        a specified data path.
+        Close any cached data file archives and release cached raw data.
+        Data files may still be loaded afterward; their archives are simply
+        reopened.
+        '''
+        for z in self._zip_cache.values():
+            z.close()
+        self._zip_cache = {}
+        self._data_bytes_cache = {}
+
+
+    # Parsed data shared between instances, keyed by
+    # (unicode_version, data_path, data file name).  Weak values ensure that
+    # shared data is reclaimed once no instance that loaded it remains live.
+    # Only parsed data that supports weak references is shared (plain dicts
+    # do not).  The data is treated as immutable once parsed, which is what
+    # makes sharing safe; callers must not mutate it.  The lock guards
+    # against first-populate races when several threads (for example, a
+    # prefetch pool) process the same file concurrently.
+    _parsed_data_cache = weakref.WeakValueDictionary()
+    _parsed_data_lock = threading.Lock()
+
+
+    def _get_shared_parsed_data(self, fname):
+        '''
+        Return parsed data for a data file that another live instance with
+        the same settings has already processed, or None.
+        '''
+        with self._parsed_data_lock:
+            return self._parsed_data_cache.get((self.unicode_version, self.data_path, fname))
+
+
+    def _set_shared_parsed_data(self, fname, parsed_data):
+        '''
+        Share parsed data for a data file with other instances that have the
+        same settings, if the data supports weak references.
+        '''
+        try:
+            with self._parsed_data_lock:
+                self._parsed_data_cache[(self.unicode_version, self.data_path, fname)] = parsed_data
+        except TypeError:
+            pass
+
+
+    def _data_source_path(self, fname):
+        '''
+        Return the path of the on-disk source for a data file, or None if
+        the source is not an individual file on disk (for example, package
+        data loaded from a zipped package).
         '''
+        if self.data_path is not None:
+            fpath_fname = os.path.join(self.data_path, fname)
+            for ext in ('.zip', '.txt'):
+                if os.path.isfile(fpath_fname + ext):
+                    return fpath_fname + ext
+            return None
+        fpath = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data',
+                             self.unicode_version, '{0}.zip'.format(fname))
+        if os.path.isfile(fpath):
+            return fpath
+        return None
+
+
+    def _disk_cache_path(self, fname):
+        '''
+        Return the path at which processed data for a data file is cached on
+        disk; see `_default_cache_dir()` for how the cache directory is
+        determined.
+        '''
+        key = '{0}|{1}'.format(self.unicode_version, self.data_path)
+        digest = hashlib.md5(key.encode('utf8')).hexdigest()[:12]
+        return os.path.join(_default_cache_dir(),
+                            '{0}-{1}.pkl'.format(digest, fname))
+
+
+    def _load_cached_parsed_data(self, fname):
+        '''
+        Load processed data for a data file from the on-disk cache,
+        returning None if no valid cached version exists.
+
+        A cached version is only valid if it is newer than both the source
+        data file and the modules that determine the form of processed
+        data, so stale caches are never loaded after the data or the
+        processed data format changes.
+        '''
+        if _PARSED_DATA_MTIME is None:
+            return None
+        source_path = self._data_source_path(fname)
+        if source_path is None:
+            return None
+        cache_path = self._disk_cache_path(fname)
+        try:
+            cache_mtime = os.path.getmtime(cache_path)
+            if cache_mtime <= os.path.getmtime(source_path) or cache_mtime <= _PARSED_DATA_MTIME:
+                return None
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            return None
+
+
+    def _store_cached_parsed_data(self, fname, parsed_data):
+        '''
+        Store processed data for a data file in the on-disk cache.  The
+        cache file is written via a temporary file plus rename, so that
+        concurrent processes never load partially written data.  Caching is
+        best-effort; failures are silently ignored.
+        '''
+        if _PARSED_DATA_MTIME is None or self._data_source_path(fname) is None:
+            return
+        cache_path = self._disk_cache_path(fname)
+        try:
+            cache_dir = os.path.dirname(cache_path)
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir)
+            handle, temp_path = tempfile.mkstemp(dir=cache_dir)
+            try:
+                with os.fdopen(handle, 'wb') as f:
+                    pickle.dump(parsed_data, f, pickle.HIGHEST_PROTOCOL)
+                getattr(os, 'replace', os.rename)(temp_path, cache_path)
+            except Exception:
+                os.remove(temp_path)
+                raise
+        except Exception:
+            pass
+
+
+    def _load_data_bytes(self, fname):
+        '''
+        Load a data file as a read-only buffer of raw bytes, either from the
+        package data directory or from a specified data path.  On-disk .txt
+        files are memory-mapped rather than copied into memory.
+
+        Data files are pure ASCII apart from an optional UTF-8 BOM
+        ("confusables.txt" and possibly other files), so bytes regexes may
+        be run directly on the returned buffer, with only matched substrings
+        ever being decoded.  A leading BOM never needs stripping on this
+        path, because the first line of every data file is a comment, which
+        line-anchored regexes skip anyway.
+        '''
+        raw_data = self._raw_cache.pop(fname, None)
+        if raw_data is not None:
+            self._data_bytes_cache[fname] = raw_data
+            return raw_data
+        # Several properties can be backed by the same data file
+        # (for example, the unicodedata property also reads the derived
+        # numeric files), so loaded raw data is cached for the lifetime of
+        # the instance (or until `close()`); mmapped files cost no heap
+        # memory, and decompressed archive members are at most a few MB.
+        raw_data = self._data_bytes_cache.get(fname)
+        if raw_data is not None:
+            return raw_data
         if self.data_path is not None:
             # Work with both data files and zipped data files
             fpath_fname = os.path.join(self.data_path, fname)
             if os.path.isfile('{0}.zip'.format(fpath_fname)):
-                with zipfile.ZipFile('{0}.zip'.format(fpath_fname)) as z:
-                    if '{0}.txt'.format(fname) in z.namelist():
-                        with z.open('{0}.txt'.format(fname)) as f:
-                            raw_data = f.read()
-                    else:
-                        raise ValueError('Could not find data file "{0}.txt" in zip archive "{1}.zip"'.format(fname, fpath_fname))
+                z = self._open_zip(fname)
+                if '{0}.txt'.format(fname) not in z.namelist():
+                    raise ValueError('Could not find data file "{0}.txt" in zip archive "{1}.zip"'.format(fname, fpath_fname))
+                raw_data = z.read('{0}.txt'.format(fname))
             elif os.path.isfile('{0}.txt'.format(fpath_fname)):
                 with open('{0}.txt'.format(fpath_fname), 'rb') as f:
-                    raw_data = f.read()
+                    raw_data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
             else:
                 raise ValueError('Could not find data file "{0}" in .txt or .zip forms in directory "{1}"'.format(fname, self.data_path))
         else:
-            # Only zipped data is assumed in the package data directory
-            zipped_raw_data = pkgutil.get_data('unicodetools', 'data/{0}/{1}.zip'.format(self.unicode_version, fname))
-            if zipped_raw_data is None:
-                raise err.DataError('Could not find unicodetools package data file "data/{0}/{1}.zip"'.format(self.unicode_version, fname))
-            with zipfile.ZipFile(io.BytesIO(zipped_raw_data)) as z:
-                with z.open('{0}.txt'.format(fname)) as f:
-                    raw_data = f.read()
-        # Use codec that can handle BOM, to deal with "confusables.txt" and
-        # possibly other files.
-        data = raw_data.decode('utf_8_sig')
+            raw_data = self._open_zip(fname).read('{0}.txt'.format(fname))
+        self._data_bytes_cache[fname] = raw_data
+        return raw_data
+
+
+    def _load_data(self, fname):
+        '''
+        Load data file as a decoded string, either from the package data
+        directory or from a specified data path.
+        '''
+        # Slicing gives bytes for both bytes and mmap buffers.  Use codec
+        # that can handle BOM, to deal with "confusables.txt" and possibly
+        # other files.
+        data = self._load_data_bytes(fname)[:].decode('utf_8_sig')
         return data
 
 
-    _codepoint_single_property_line_re = re.compile(r'(?P<Code_Point>{codePoint}|{codePoint}\.\.{codePoint})\s*;\s*(?P<Property>{Generic_Property})\s*#.*$'.format(**ucd_regex_patterns))
+    @contextlib.contextmanager
+    def _open_data_text(self, fname):
+        '''
+        Open a data file for streaming text reading, either from the
+        package data directory or from a specified data path.
+
+        The file is decoded incrementally through io.TextIOWrapper instead
+        of being materialized as one large decoded string plus a list of
+        lines, so iterating over lines touches the data once and
+        parse-temporary buffers can be reclaimed early.  Lines keep their
+        newline characters.
+        '''
+        raw_data = self._raw_cache.pop(fname, None)
+        if raw_data is None:
+            raw_data = self._data_bytes_cache.get(fname)
+        if raw_data is not None:
+            yield io.TextIOWrapper(io.BytesIO(raw_data), encoding='utf_8_sig')
+            return
+        if self.data_path is not None:
+            # Work with both data files and zipped data files
+            fpath_fname = os.path.join(self.data_path, fname)
+            if os.path.isfile('{0}.zip'.format(fpath_fname)):
+                z = self._open_zip(fname)
+                if '{0}.txt'.format(fname) not in z.namelist():
+                    raise ValueError('Could not find data file "{0}.txt" in zip archive "{1}.zip"'.format(fname, fpath_fname))
+                with z.open('{0}.txt'.format(fname)) as f:
+                    yield io.TextIOWrapper(f, encoding='utf_8_sig')
+            elif os.path.isfile('{0}.txt'.format(fpath_fname)):
+                with io.open('{0}.txt'.format(fpath_fname), 'r', encoding='utf_8_sig') as f:
+                    yield f
+            else:
+                raise ValueError('Could not find data file "{0}" in .txt or .zip forms in directory "{1}"'.format(fname, self.data_path))
+        else:
+            with self._open_zip(fname).open('{0}.txt'.format(fname)) as f:
+                yield io.TextIOWrapper(f, encoding='utf_8_sig')
+
+
+    # Data files backing each property, used by `prefetch()` to stage raw
+    # data concurrently before parsing.  Subclasses override.
+    _property_data_files = {}
+
+    def prefetch(self, *names):
+        '''
+        Load and process the specified properties concurrently with a small
+        thread pool, returning once all of them are available.
+
+        The data files backing the properties are decompressed first, in
+        parallel — zlib decompression and file I/O release the GIL, so this
+        phase scales across cores — and staged in the raw-data cache that
+        the loaders consume.  The parse phase then runs over in-memory
+        data.  Each property stores its processed data in a distinct
+        instance attribute, so concurrent first accesses are independent,
+        and subsequent attribute access returns the cached data as usual.
+        '''
+        from concurrent.futures import ThreadPoolExecutor
+        for name in names:
+            if not isinstance(getattr(type(self), name, None), property):
+                raise ValueError('Unknown property "{0}"'.format(name))
+        data_files = []
+        for name in names:
+            for fname in self._property_data_files.get(name, ()):
+                if fname not in data_files:
+                    data_files.append(fname)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            for fname, raw_data in zip(data_files, executor.map(self._load_data_bytes, data_files)):
+                self._raw_cache[fname] = raw_data
+            # Consume the iterator so that any exceptions propagate
+            for _ in executor.map(functools.partial(getattr, self), names):
+                pass
+        # Any staged data left over (because parsed data came from a cache
+        # instead) is dropped rather than held indefinitely.
+        self._raw_cache.clear()
+
+
+    def _background_prefetch(self):
+        '''
+        Read and decompress every known data file into the raw-data cache.
+        Runs in a daemon thread started by `__init__` when
+        `background_prefetch` is set; file I/O and zlib decompression
+        release the GIL, so the reads overlap whatever the constructing
+        thread does next, and later property accesses find their data
+        already in memory.  Staging is best-effort:  on any error the
+        thread simply stops, leaving the error to be raised by a normal
+        property access.
+        '''
+        data_files = []
+        for fnames in self._property_data_files.values():
+            for fname in fnames:
+                if fname not in data_files:
+                    data_files.append(fname)
+        for fname in data_files:
+            try:
+                self._load_data_bytes(fname)
+            except Exception:
+                return
+
+
+    def warm(self, names=None, jobs=None):
+        '''
+        Build the specified properties (by default, all properties with
+        known data files) in parallel worker processes, so that their
+        processed data is stored in the on-disk cache.  Returns once all
+        workers finish; subsequent accesses, in this process or any other,
+        then load from the cache.
+
+        Unlike `prefetch()`, which parses in the current process and keeps
+        the results, `warm()` only populates the on-disk cache, and parsing
+        scales across cores because each property is built in its own
+        process.  `jobs` limits the number of worker processes.
+        '''
+        from concurrent.futures import ProcessPoolExecutor
+        if names is None:
+            names = tuple(self._property_data_files)
+        for name in names:
+            if not isinstance(getattr(type(self), name, None), property):
+                raise ValueError('Unknown property "{0}"'.format(name))
+        worker = functools.partial(_warm_worker, type(self),
+                                   self.unicode_version, self.data_path)
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            # Consume the iterator so that any exceptions propagate
+            for _ in executor.map(worker, names):
+                pass
+
+
+    _codepoint_single_property_line_pattern = _codepoint_single_property_line_pattern
 
 
     def _get_multiple_boolean_properties(self, properties_file):
@@ -197,32 +1085,103 @@ class Files(object):
         Load and process a properties file containing multiple properties
         per code point with boolean values.
         '''
+        cached = self._load_cached_parsed_data(properties_file)
+        if cached is not None:
+            return cached
         data = self._load_data(properties_file)
-        cp_properties = collections.OrderedDict()
+        # Skip comment and blank lines with an O(1) first-character check.
+        # Data lines have the simple form `<codepoint(s)> ; <property>`,
+        # optionally followed by a comment, so they are split with
+        # `partition()` rather than the line regex; a hand-written scan of
+        # this kind is a plain memory-bound string operation, while the
+        # regex engine pays per-character state transitions.  The line regex
+        # is kept as a cross-check when the environment variable
+        # UNICODETOOLS_VALIDATE is set.
+        #
+        # Ranges are accumulated per property and then packed into bitsets,
+        # so that the million or so expanded code points in these files are
+        # never materialized as individual dict entries; the resulting
+        # mapping answers lookups from a few KB of bitmap per property while
+        # remaining dict-compatible.
+        property_ranges = _OrderedDict()
+        setdefault = property_ranges.setdefault
+        hex_to_int = _hex_to_int_cached
+        intern = _intern
         for line in data.splitlines():
-            line = line.strip()
-            if line and line[:1] != '#':
-                gd = self._codepoint_single_property_line_re.match(line).groupdict()
-                codepoint = gd['Code_Point']
-                prop = gd['Property']
-                if '..' in codepoint:
-                    first, last = codepoint.split('..')
-                    for cp in range(int(first, 16), int(last, 16)+1):
-                        if cp not in cp_properties:
-                            cp_properties[cp] = {}
-                        cp_properties[cp][prop] = True
-                else:
-                    cp = int(codepoint, 16)
-                    if cp not in cp_properties:
-                        cp_properties[cp] = {}
-                    cp_properties[cp][prop] = True
+            if not line or line[0] == '#':
+                continue
+            codepoint, _, prop = line.partition('#')[0].partition(';')
+            codepoint = codepoint.strip()
+            prop = intern(prop.strip())
+            if _VALIDATE and _compile_line_re(self._codepoint_single_property_line_pattern, 0).match(line).groupdict() != {'Code_Point': codepoint, 'Property': prop}:
+                raise err.DataError('Field splitting disagrees with the reference regex for line:\n  "{0}"'.format(line))
+            if '..' in codepoint:
+                first, last = codepoint.split('..')
+                first = hex_to_int(first)
+                last = hex_to_int(last)
+            else:
+                first = last = hex_to_int(codepoint)
+            setdefault(prop, []).append((first, last))
+        cp_properties = CodePointBitsetMapping(property_ranges)
+        self._store_cached_parsed_data(properties_file, cp_properties)
         return cp_properties
 
 
-    _codepoint_single_value_line_re = re.compile(r'(?P<Code_Point>{codePoint}|{codePoint}\.\.{codePoint})\s*;\s*(?P<Value>{Generic_Value})\s*#.*$'.format(**ucd_regex_patterns))
+    _codepoint_single_value_line_pattern = _codepoint_single_value_line_pattern
 
 
-    def _get_single_string_property(self, property_file, property_name, postprocess=None, line_re=None):
+    def _iter_single_value_lines(self, data, line_pattern, value_field):
+        '''
+        Iterate over the data lines of a single-value property file,
+        yielding `(first, last, value)` tuples with interned value strings.
+
+        Data lines have the simple form `<codepoint(s)> ; <fields>`,
+        optionally followed by a comment, so they are split with
+        `partition()`/`split()` rather than the line regex; the regex is
+        kept as a cross-check when the environment variable
+        UNICODETOOLS_VALIDATE is set.  Splitting works on raw bytes, so
+        only the code point and value tokens are ever decoded.
+
+        Value tokens are memoized per distinct raw bytes token, with the
+        known enumerated value sets pre-seeded, so the decode and intern
+        of a value run once per distinct value instead of once per line.
+        '''
+        hex_to_int = _hex_to_int_cached
+        intern = _intern
+        value_cache = dict(_known_value_tokens)
+        validate_re = _as_bytes_pattern(line_pattern) if _VALIDATE else None
+        if not isinstance(data, bytes):
+            # mmap and other buffers lack splitlines()
+            data = bytes(data)
+        for line in data.splitlines():
+            head = line.partition(b'#')[0]
+            if not head:
+                continue
+            fields = head.split(b';')
+            if len(fields) <= value_field:
+                continue
+            codepoint = fields[0].strip().decode('ascii')
+            if not codepoint:
+                continue
+            token = fields[value_field].strip()
+            try:
+                value = value_cache[token]
+            except KeyError:
+                value = value_cache[token] = intern(token.decode('ascii'))
+            if validate_re is not None:
+                match = validate_re.match(line)
+                if (match is None or match.group('Code_Point').decode('ascii') != codepoint or
+                        match.group('Value').decode('ascii') != value):
+                    raise err.DataError('Field splitting disagrees with the reference regex for line:\n  "{0}"'.format(line.decode('ascii')))
+            if '..' in codepoint:
+                first, last = codepoint.split('..')
+                yield hex_to_int(first), hex_to_int(last), value
+            else:
+                cp = hex_to_int(codepoint)
+                yield cp, cp, value
+
+
+    def _get_single_string_property(self, property_file, property_name, postprocess=None, line_pattern=None, ranges=False, value_field=1):
         '''
         Load and process a properties file containing a single property
         per code point with string values.
@@ -231,41 +1190,128 @@ class Files(object):
         of the form {<property_name>: <value>}.  If property_name is None,
         then each code point is given <value> directly.
 
-        Keyword arguments `postprocess` and `line_re` allow a special
-        processing function and a special line regex to be specified.
+        Keyword arguments `postprocess` and `line_pattern` allow a special
+        processing function and a special line pattern to be specified, and
+        `value_field` gives the semicolon-separated field holding the value
+        (for files such as DerivedNumericValues.txt with several fields).
+
+        If `ranges` is True, the processed data is returned as a
+        CodePointRangeMapping rather than a dict, so that each range of code
+        points in the data file is stored as a single entry with a shared
+        value.  The mapping interface is dict-compatible.
         '''
-        data = self._load_data(property_file)
-        cp_property = {}
+        shared = self._get_shared_parsed_data(property_file)
+        if shared is not None:
+            return shared
+        cached = self._load_cached_parsed_data(property_file)
+        if cached is not None:
+            self._set_shared_parsed_data(property_file, cached)
+            return cached
+        data = self._load_data_bytes(property_file)
         if postprocess is not None and not hasattr(postprocess, '__call__'):
             raise TypeError('Invalid argument "postprocess"; must be callable')
-        if line_re is None:
-            line_re = self._codepoint_single_value_line_re
-        if property_name is None:
-            if postprocess is None:
-                fval = lambda gd: gd['Value']
-            else:
+        if line_pattern is None:
+            line_pattern = self._codepoint_single_value_line_pattern
+        if postprocess is not None:
+            if property_name is None:
                 fval = postprocess
-        else:
-            if postprocess is None:
-                fval = lambda gd: {property_name: gd['Value']}
             else:
                 fval = lambda gd: {property_name: postprocess(gd)}
-        for line in data.splitlines():
-            line = line.strip()
-            if line and line[:1] != '#':
-                gd = line_re.match(line).groupdict()
+            # Postprocess functions receive the full groupdict of the line
+            # regex, so those loops process the entire file with a single
+            # `finditer()` over raw bytes, which keeps the match loop in
+            # the regex engine; comment and blank lines simply produce no
+            # matches.  The common no-postprocess case skips the regex
+            # engine entirely via `_iter_single_value_lines()`.
+            line_re = _as_bytes_pattern(line_pattern)
+        hex_to_int = _hex_to_int_cached
+        intern = _intern
+        pname = property_name
+        # In the no-postprocess loops, the row object for a value is built
+        # once per distinct value and shared across all lines that carry
+        # that value, so that a property with a handful of values allocates
+        # a handful of rows; identity-based pooling in
+        # CodePointRangeMapping then stores each row once.
+        row_cache = {}
+        if ranges:
+            range_value_tuples = []
+            append = range_value_tuples.append
+            if postprocess is None:
+                for first, last, value in self._iter_single_value_lines(data, line_pattern, value_field):
+                    try:
+                        row = row_cache[value]
+                    except KeyError:
+                        row = row_cache[value] = {pname: value} if pname is not None else value
+                    append((first, last, row))
+            else:
+                for match in line_re.finditer(data):
+                    gd = dict((k, v.decode('ascii') if v is not None else None) for k, v in match.groupdict().items())
+                    value = gd.get('Value')
+                    if value is not None:
+                        gd['Value'] = intern(value)
+                    codepoint = gd['Code_Point']
+                    if '..' in codepoint:
+                        first, last = codepoint.split('..')
+                        first = hex_to_int(first)
+                        last = hex_to_int(last)
+                    else:
+                        first = last = hex_to_int(codepoint)
+                    append((first, last, fval(gd)))
+            try:
+                cp_property = CodePointRangeMapping(range_value_tuples)
+            except err.DataError:
+                raise err.DataError('Multiple properties encountered for a code point in "{0}"; only a single property was expected'.format(property_file))
+            self._set_shared_parsed_data(property_file, cp_property)
+            self._store_cached_parsed_data(property_file, cp_property)
+            return cp_property
+        # The value object for a data line is built once and shared by every
+        # code point in the line's range (and, without postprocess, across
+        # lines via `row_cache`), just as ranges in a CodePointRangeMapping
+        # share a single value; `postprocess` in particular is invariant
+        # across a range, so it runs per line rather than per code point.  For range lines, the duplicate check and the
+        # assignments are also lifted out of the per-code-point loop:
+        # `any(map(...))` keeps the check at the C level, and
+        # `dict.fromkeys()` fans the shared value out across the range in a
+        # single C-level call.
+        cp_property = {}
+        contains = cp_property.__contains__
+        store = cp_property.__setitem__
+        update = cp_property.update
+        if postprocess is None:
+            for first, last, value in self._iter_single_value_lines(data, line_pattern, value_field):
+                try:
+                    row = row_cache[value]
+                except KeyError:
+                    row = row_cache[value] = {pname: value} if pname is not None else value
+                if first != last:
+                    cps = range(first, last+1)
+                    if any(map(contains, cps)):
+                        raise err.DataError('Multiple properties encountered for a code point in "{0}"; only a single property was expected'.format(property_file))
+                    update(dict.fromkeys(cps, row))
+                else:
+                    if contains(first):
+                        raise err.DataError('Multiple properties encountered for U+{0:04X}; only a single property was expected'.format(first))
+                    store(first, row)
+        else:
+            for match in line_re.finditer(data):
+                gd = dict((k, v.decode('ascii') if v is not None else None) for k, v in match.groupdict().items())
+                value = gd.get('Value')
+                if value is not None:
+                    gd['Value'] = intern(value)
                 codepoint = gd['Code_Point']
+                row = fval(gd)
                 if '..' in codepoint:
                     first, last = codepoint.split('..')
-                    for cp in range(int(first, 16), int(last, 16)+1):
-                        if cp in cp_property:
-                            raise err.DataError('Multiple properties encountered for U+{0:04X}; only a single property was expected'.format(cp))
-                        cp_property[cp] = fval(gd)
+                    cps = range(hex_to_int(first), hex_to_int(last)+1)
+                    if any(map(contains, cps)):
+                        raise err.DataError('Multiple properties encountered for a code point in "{0}"; only a single property was expected'.format(property_file))
+                    update(dict.fromkeys(cps, row))
                 else:
-                    cp = int(codepoint, 16)
-                    if cp in cp_property:
+                    cp = hex_to_int(codepoint)
+                    if contains(cp):
                         raise err.DataError('Multiple properties encountered for U+{0:04X}; only a single property was expected'.format(cp))
-                    cp_property[cp] = fval(gd)
+                    store(cp, row)
+        self._store_cached_parsed_data(property_file, cp_property)
         return cp_property
 
 
@@ -299,34 +1345,41 @@ class UCDFiles(Files):
         self._unicodedata = None
 
 
+    # Data files backing each property, for `prefetch()`.
+    _property_data_files = {'blocks': ('Blocks',),
+                            'derivedbidiclass': ('DerivedBidiClass',),
+                            'derivedcoreproperties': ('DerivedCoreProperties',),
+                            'derivedeastasianwidth': ('DerivedEastAsianWidth',),
+                            'derivedjoiningtype': ('DerivedJoiningType',),
+                            'derivednumerictype': ('DerivedNumericType',),
+                            'derivednumericvalues': ('DerivedNumericValues',),
+                            'eastasianwidth': ('EastAsianWidth',),
+                            'proplist': ('PropList',),
+                            'scriptextensions': ('ScriptExtensions',),
+                            'scripts': ('Scripts',),
+                            'unicodedata': ('UnicodeData', 'DerivedNumericType',
+                                            'DerivedNumericValues')}
+
+
     # Tables for deriving Hangul syllable names.
-    _JAMO_L_TABLE = ('G', 'GG', 'N', 'D', 'DD', 'R', 'M', 'B', 'BB',
-                     'S', 'SS', '', 'J', 'JJ', 'C', 'K', 'T', 'P', 'H')
-    _JAMO_V_TABLE = ('A', 'AE', 'YA', 'YAE', 'EO', 'E', 'YEO', 'YE', 'O',
-                     'WA', 'WAE', 'OE', 'YO', 'U', 'WEO', 'WE', 'WI',
-                     'YU', 'EU', 'YI', 'I')
-    _JAMO_T_TABLE = ('', 'G', 'GG', 'GS', 'N', 'NJ', 'NH', 'D', 'L', 'LG', 'LM',
-                     'LB', 'LS', 'LT', 'LP', 'LH', 'M', 'B', 'BS',
-                     'S', 'SS', 'NG', 'J', 'C', 'K', 'T', 'P', 'H')
+    _JAMO_L_TABLE = _JAMO_L_TABLE
+    _JAMO_V_TABLE = _JAMO_V_TABLE
+    _JAMO_T_TABLE = _JAMO_T_TABLE
 
     @classmethod
     def hangul_syllable_name(cls, cp):
         '''
-        Algorithmically determine the name for a Hangul Syllable.
+        Determine the name for a Hangul Syllable.
 
-        This code is a direct translation of the algorithm given in
-        The Unicode Standard, Version 9.0, Chapter 3.12, in the section
-        "Sample Code for Hangul Algorithms."
+        Names for all Hangul Syllables are precomputed at import time in
+        `_HANGUL_NAMES`, following the algorithm given in The Unicode
+        Standard, Version 9.0, Chapter 3.12, in the section "Sample Code
+        for Hangul Algorithms."
         '''
         cp_index = cp - 0xAC00
         if cp_index < 0 or cp_index >= 11172:
             raise ValueError('The code point {0:04X} is not a Hangul Syllable'.format(cp))
-        l_index = cp_index // 588
-        v_index = (cp_index % 588) // 28
-        t_index = cp_index % 28
-        return 'HANGUL SYLLABLE {0}{1}{2}'.format(cls._JAMO_L_TABLE[l_index],
-                                                  cls._JAMO_V_TABLE[v_index],
-                                                  cls._JAMO_T_TABLE[t_index])
+        return _HANGUL_NAMES[cp_index]
 
 
     @classmethod
@@ -334,67 +1387,122 @@ class UCDFiles(Files):
         '''
         Decompose a Hangul Syllable to obtain the Decomposition_Mapping.
 
-        This code is a combination of the decomposition and composition
-        algorithms given in The Unicode Standard, Version 9.0, Chapter 3.12,
-        in the section "Sample Code for Hangul Algorithms."  The code
-        decomposes <LV> syllables into <L, V> and <LVT> syllables into
+        Decomposition mappings for all Hangul Syllables are precomputed at
+        import time in `_HANGUL_DM`, combining the decomposition and
+        composition algorithms given in The Unicode Standard, Version 9.0,
+        Chapter 3.12, in the section "Sample Code for Hangul Algorithms."
+        <LV> syllables decompose into <L, V> and <LVT> syllables into
         <LV, T>, in accordance with the section "Hangul Syllable
         Decomposition."
         '''
         cp_index = cp - 0xAC00
         if cp_index < 0 or cp_index >= 11172:
             raise ValueError('The code point {0:04X} is not a Hangul Syllable'.format(cp))
-        cp_t = 0x11A7 + cp_index % 28
-        if cp_t != 0x11A7:
-            # Using integer arithmetic here, so can't simplify math further
-            cp_lv = 0xAC00 + (cp_index // 588 * 21 + (cp_index % 588) // 28) * 28
-            decomposition_mapping = (cp_lv, cp_t)
+        return _HANGUL_DM[cp_index]
+
+
+    _unicodedata_pattern = _unicodedata_pattern
+
+    # The full UnicodeData pattern is only needed by the
+    # UNICODETOOLS_VALIDATE cross-check in `_unicodedata_fields()`, so it is
+    # compiled lazily; compiling a pattern this large at import time is
+    # measurable.  The verbose template above is kept for readability, and
+    # its whitespace is stripped before compiling so that the engine
+    # processes a lean, non-verbose pattern (all significant spaces in the
+    # pattern are written as `\x20`).
+    _unicodedata_re = None
+
+    @classmethod
+    def _get_unicodedata_re(cls):
+        if cls._unicodedata_re is None:
+            cls._unicodedata_re = re.compile(re.sub(r'\s+', '', cls._unicodedata_pattern))
+        return cls._unicodedata_re
+
+    def _unicodedata_fields(self, line):
+        '''
+        Split a line of UnicodeData.txt into the field dict that matching
+        the line against `_unicodedata_re` would produce.
+
+        UnicodeData.txt has a fixed, 15-field, semicolon-delimited format
+        with no embedded semicolons, so splitting on ';' and indexing
+        positionally is much faster than the large verbose regex.  The
+        regex is kept as a cross-check that runs when the environment
+        variable UNICODETOOLS_VALIDATE is set.
+        '''
+        f = line.split(';')
+        if len(f) != 15:
+            raise err.DataError('Invalid line in UnicodeData.txt:\n  "{0}"'.format(line))
+        decomposition = f[5]
+        if not decomposition:
+            decomposition_type = None
+            decomposition_mapping = None
+        elif decomposition[0] == '<':
+            decomposition_type, _, decomposition_mapping = decomposition[1:].partition('>\x20')
         else:
-            cp_l = 0x1100 + cp_index // 588
-            cp_v = 0x1161 + (cp_index % 588) // 28
-            decomposition_mapping = (cp_l, cp_v)
-        return decomposition_mapping
-
-
-    _unicodedata_pattern = r'''
-                            (?P<Code_Point> {codePoint});
-                            (?P<Name> {name}|<{name}(?:,\x20(?:First|Last))?>);
-                            (?P<General_Category> {General_Category_Abbr});
-                            (?P<Canonical_Combining_Class> {name});
-                            (?P<Bidi_Class> {Bidi_Class_Abbr});
-                            (?: (?:<(?P<Decomposition_Type> {name})>\x20)? (?P<Decomposition_Mapping> {Decomposition_Mapping}) )?;
-                            (?P<Numeric> ;;|{digits};{digits};{digits}|;{digits};{digits}|;;{rational});
-                            (?P<Bidi_Mirrored> Y|N);
-                            (?P<Unicode_1_Name> {annotatedName}|);
-                            (?P<ISO_Comment>);
-                            (?P<Simple_Uppercase_Mapping> {Simple_Uppercase_Mapping})?;
-                            (?P<Simple_Lowercase_Mapping> {Simple_Lowercase_Mapping})?;
-                            (?P<Simple_Titlecase_Mapping> {Simple_Titlecase_Mapping})?
-                            \s*$
-                            '''.format(**ucd_regex_patterns)
-
-    _unicodedata_re = re.compile(_unicodedata_pattern, re.VERBOSE)
+            decomposition_type = None
+            decomposition_mapping = decomposition
+        # Values drawn from small, fixed sets are interned; Name is mostly
+        # unique, so it is not.
+        gd = {'Code_Point': f[0],
+              'Name': f[1],
+              'General_Category': _intern(f[2]),
+              'Canonical_Combining_Class': _intern(f[3]),
+              'Bidi_Class': _intern(f[4]),
+              'Decomposition_Type': decomposition_type if decomposition_type is None else _intern(decomposition_type),
+              'Decomposition_Mapping': decomposition_mapping,
+              'Numeric': f[6] + ';' + f[7] + ';' + f[8],
+              'Bidi_Mirrored': f[9],
+              'Unicode_1_Name': f[10],
+              'ISO_Comment': f[11],
+              'Simple_Uppercase_Mapping': f[12] or None,
+              'Simple_Lowercase_Mapping': f[13] or None,
+              'Simple_Titlecase_Mapping': f[14] or None}
+        if _VALIDATE and self._get_unicodedata_re().match(line).groupdict() != gd:
+            raise err.DataError('Field splitting disagrees with the reference regex for line:\n  "{0}"'.format(line))
+        return gd
 
     @property
     def unicodedata(self):
         '''
         Data from UnicodeData.txt.
+
+        Processed data is shared between live instances with the same
+        settings and cached on disk, so the full parse only runs when both
+        caches are cold.
         '''
         if self._unicodedata is None:
-            data = self._load_data('UnicodeData')
-            unicodedata = collections.OrderedDict()
-            try:
-                # Create an iterator, so that when the first line of a code
-                # point range is encountered, `next()` can be used to look
-                # ahead to the last line of the range.
-                line_iter = iter(data.splitlines())
+            unicodedata = self._get_shared_parsed_data('UnicodeData')
+            if unicodedata is None:
+                unicodedata = self._load_cached_parsed_data('UnicodeData')
+                if unicodedata is None:
+                    unicodedata = self._parse_unicodedata()
+                    self._store_cached_parsed_data('UnicodeData', unicodedata)
+                self._set_shared_parsed_data('UnicodeData', unicodedata)
+            self._unicodedata = unicodedata
+        return self._unicodedata
+
+
+    def _parse_unicodedata(self):
+        '''
+        Parse UnicodeData.txt, expanding code point ranges and merging in
+        derived numeric data.
+        '''
+        # Column-oriented storage indexed directly by code point; see
+        # _UnicodeDataTable.
+        unicodedata = _UnicodeDataTable()
+        try:
+            # Create an iterator, so that when the first line of a code
+            # point range is encountered, `next()` can be used to look
+            # ahead to the last line of the range.
+            with self._open_data_text('UnicodeData') as f:
+                line_iter = (line.rstrip('\n') for line in f)
                 for line in line_iter:
-                    gd = self._unicodedata_re.match(line).groupdict()
+                    gd = self._unicodedata_fields(line)
                     # Defaults values according to Unicode Standard Annex #44,
                     # Table 4 and elsewhere
                     # http://unicode.org/reports/tr44/#Format_Conventions
                     codepoint = gd['Code_Point']
-                    cp = int(codepoint, 16)
+                    cp = _hex_to_int_cached(codepoint)
                     del gd['Code_Point']  # Not needed in final data
                     # Process Name later, because that makes it more
                     # convenient to deal with ranges.
@@ -403,7 +1511,9 @@ class UCDFiles(Files):
                     if gd['Decomposition_Mapping'] is None:
                         gd['Decomposition_Mapping'] = (cp,)
                     else:
-                        gd['Decomposition_Mapping'] = tuple(int(x, 16) for x in gd['Decomposition_Mapping'].split('\x20'))
+                        # `map()` runs the memoized hex parser at the C
+                        # level, with no generator frame per line
+                        gd['Decomposition_Mapping'] = tuple(map(_hex_to_int_cached, gd['Decomposition_Mapping'].split('\x20')))
                     numeric = gd['Numeric']
                     del gd['Numeric']  # Only temp data
                     # Numeric_Value is always stored as a string rather than
@@ -411,18 +1521,23 @@ class UCDFiles(Files):
                     # etc.  This gives users access to the raw data while
                     # preventing any loss of precision or preferring a
                     # particular rational number implementation.
+                    # The field has the form "decimal;digit;numeric"; which
+                    # subfields are non-empty determines the type.  One
+                    # partition pair classifies it without the prefix
+                    # checks and rsplit of the obvious approach.
                     if numeric == ';;':
                         gd['Numeric_Type'] = 'None'
                         gd['Numeric_Value'] = 'NaN'
-                    elif numeric.startswith(';;'):
-                        gd['Numeric_Type'] = 'Numeric'
-                        gd['Numeric_Value'] = numeric.rsplit(';', 1)[1]
-                    elif numeric.startswith(';'):
-                        gd['Numeric_Type'] = 'Digit'
-                        gd['Numeric_Value'] = numeric.rsplit(';', 1)[1]
                     else:
-                        gd['Numeric_Type'] = 'Decimal'
-                        gd['Numeric_Value'] = numeric.rsplit(';', 1)[1]
+                        decimal, _, rest = numeric.partition(';')
+                        digit, _, value = rest.partition(';')
+                        if decimal:
+                            gd['Numeric_Type'] = 'Decimal'
+                        elif digit:
+                            gd['Numeric_Type'] = 'Digit'
+                        else:
+                            gd['Numeric_Type'] = 'Numeric'
+                        gd['Numeric_Value'] = value
                     if gd['Bidi_Mirrored'] == 'Y':
                         gd['Bidi_Mirrored'] = True
                     else:
@@ -430,15 +1545,15 @@ class UCDFiles(Files):
                     if gd['Simple_Uppercase_Mapping'] is None:
                         gd['Simple_Uppercase_Mapping'] = cp
                     else:
-                        gd['Simple_Uppercase_Mapping'] = int(gd['Simple_Uppercase_Mapping'], 16)
+                        gd['Simple_Uppercase_Mapping'] = _hex_to_int_cached(gd['Simple_Uppercase_Mapping'])
                     if gd['Simple_Lowercase_Mapping'] is None:
                         gd['Simple_Lowercase_Mapping'] = cp
                     else:
-                        gd['Simple_Lowercase_Mapping'] = int(gd['Simple_Lowercase_Mapping'], 16)
+                        gd['Simple_Lowercase_Mapping'] = _hex_to_int_cached(gd['Simple_Lowercase_Mapping'])
                     if gd['Simple_Titlecase_Mapping'] is None:
                         gd['Simple_Titlecase_Mapping'] = gd['Simple_Uppercase_Mapping']
                     else:
-                        gd['Simple_Titlecase_Mapping'] = int(gd['Simple_Titlecase_Mapping'], 16)
+                        gd['Simple_Titlecase_Mapping'] = _hex_to_int_cached(gd['Simple_Titlecase_Mapping'])
                     if not gd['Name'].startswith('<'):
                         unicodedata[cp] = gd
                     else:
@@ -448,34 +1563,28 @@ class UCDFiles(Files):
                         else:
                             if not gd['Name'].endswith(',\x20First>'):
                                 raise err.DataError('Invalid unnamed code point or invalid code point range:\n  "{0}"'.format(line))
-                            cp_first = int(codepoint, 16)
+                            cp_first = _hex_to_int_cached(codepoint)
                             base_name = gd['Name'].strip('<>').rsplit(',', 1)[0]
                             next_line = next(line_iter)
-                            gd_last = self._unicodedata_re.match(next_line).groupdict()
+                            gd_last = self._unicodedata_fields(next_line)
                             if not gd_last['Name'].endswith(',\x20Last>') or gd_last['Name'].strip('<>').rsplit(',', 1)[0] != base_name:
                                 raise err.DataError('Invalid code point range:\n  "{0}"'.format(next_line))
-                            cp_last = int(gd_last['Code_Point'], 16)
+                            cp_last = _hex_to_int_cached(gd_last['Code_Point'])
+                            # The range expansions below fill entire columns
+                            # with slice assignment via `fill_range()`, rather
+                            # than constructing one dict per code point; the
+                            # surrogate and private-use ranges alone cover about
+                            # a million code points.
                             if 'Surrogate' in base_name or 'Private' in base_name:
-                                for cp in range(cp_first, cp_last+1):
-                                    cp_gd = gd.copy()
-                                    cp_gd['Name'] = ''
-                                    cp_gd['Decomposition_Mapping'] = (cp,)
-                                    cp_gd['Simple_Uppercase_Mapping'] = cp
-                                    cp_gd['Simple_Lowercase_Mapping'] = cp
-                                    cp_gd['Simple_Titlecase_Mapping'] = cp
-                                    unicodedata[cp] = cp_gd
+                                unicodedata.fill_range(cp_first, cp_last, gd,
+                                                       names=['']*(cp_last-cp_first+1))
                             elif base_name == 'Hangul Syllable':
                                 # See UAX #44, as well as the parts of The
                                 # Unicode Standard, Version 9.0, Chapter 3.12
                                 # that are referenced in the Hangul functions
-                                for cp in range(cp_first, cp_last+1):
-                                    cp_gd = gd.copy()
-                                    cp_gd['Name'] = self.hangul_syllable_name(cp)
-                                    cp_gd['Decomposition_Mapping'] = self.hangul_syllable_decomposition_mapping(cp)
-                                    cp_gd['Simple_Uppercase_Mapping'] = cp
-                                    cp_gd['Simple_Lowercase_Mapping'] = cp
-                                    cp_gd['Simple_Titlecase_Mapping'] = cp
-                                    unicodedata[cp] = cp_gd
+                                unicodedata.fill_range(cp_first, cp_last, gd,
+                                                       names=_HANGUL_NAMES,
+                                                       decomposition_mappings=_HANGUL_DM)
                             else:
                                 # Naming from The Unicode Standard, Version 9.0, Chapter 4.8, section "Unicode Name Property".
                                 # Don't have to check `first in (0xF900, 0xFA70, 0x2F800)` for 'CJK COMPATIBILITY IDEOGRAPH',
@@ -486,36 +1595,38 @@ class UCDFiles(Files):
                                     base_name = 'TANGUT IDEOGRAPH'
                                 else:
                                     raise err.DataError('Unknown name for code point range U+{0:04X} - U+{1:04X}'.format(cp_first, cp_last))
-                                for cp in range(cp_first, cp_last+1):
-                                    cp_gd = gd.copy()
-                                    cp_gd['Name'] = '{0}-{1:04X}'.format(base_name, cp)
-                                    cp_gd['Decomposition_Mapping'] = (cp,)
-                                    cp_gd['Simple_Uppercase_Mapping'] = cp
-                                    cp_gd['Simple_Lowercase_Mapping'] = cp
-                                    cp_gd['Simple_Titlecase_Mapping'] = cp
-                                    unicodedata[cp] = cp_gd
-            except Exception as e:
-                raise err.DataError('Failed to parse UnicodeData.txt:\n  {0}'.format(e))
-            # Update to account for derived numeric data
-            derived_numeric_type = self.derivednumerictype
-            derived_numeric_values = self.derivednumericvalues
-            for cp, dnt in derived_numeric_type.items():
-                if unicodedata[cp]['Numeric_Type'] == 'None':
-                    unicodedata[cp]['Numeric_Type'] = dnt['Numeric_Type']
-                    unicodedata[cp]['Numeric_Value'] = derived_numeric_values[cp]['Numeric_Value']
-                elif (unicodedata[cp]['Numeric_Type'] != dnt['Numeric_Type'] or
-                      fractions.Fraction(unicodedata[cp]['Numeric_Value']) != fractions.Fraction(derived_numeric_values[cp]['Numeric_Value'])):
-                    msg = 'Mismatched "Numeric_Type" and/or "Numeric_Value" between "UnicodeData.txt" and "DerivedNumericType.txt" or "DerivedNumericValues.txt."'
-                    msg += '\n  {0}, {1} vs. {2}, {3}'.format(unicodedata[cp]['Numeric_Type'],
-                                                              unicodedata[cp]['Numeric_Value'],
-                                                              dnt['Numeric_Type'],
-                                                              derived_numeric_values[cp]['Numeric_Value'])
-                    raise err.DataError(msg)
-            self._unicodedata = unicodedata
-        return self._unicodedata
-
-
-    _blocks_line_re = re.compile(r'(?P<Code_Point>{codePoint}|{codePoint}\.\.{codePoint})\s*;\s*(?P<Value>{Block})$'.format(**ucd_regex_patterns))
+                                name_prefix = base_name + '-'
+                                unicodedata.fill_range(cp_first, cp_last, gd,
+                                                       names=[name_prefix + format(cp, '04X')
+                                                              for cp in range(cp_first, cp_last+1)])
+        except Exception as e:
+            raise err.DataError('Failed to parse UnicodeData.txt:\n  {0}'.format(e))
+        # Update to account for derived numeric data.  Cross-checking
+        # UnicodeData against the derived files constructs two Fraction
+        # objects (string parse plus gcd reduction) per derived numeric
+        # code point; it guards an invariant of the shipped data files, so
+        # it only runs when UNICODETOOLS_VALIDATE is set.  The merge
+        # itself, which fills in types and values that UnicodeData leaves
+        # unspecified, always runs.
+        derived_numeric_type = self.derivednumerictype
+        derived_numeric_values = self.derivednumericvalues
+        for cp, dnt in derived_numeric_type.items():
+            row = unicodedata[cp]
+            if row['Numeric_Type'] == 'None':
+                row['Numeric_Type'] = dnt['Numeric_Type']
+                row['Numeric_Value'] = derived_numeric_values[cp]['Numeric_Value']
+            elif _VALIDATE and (row['Numeric_Type'] != dnt['Numeric_Type'] or
+                                fractions.Fraction(row['Numeric_Value']) != fractions.Fraction(derived_numeric_values[cp]['Numeric_Value'])):
+                msg = 'Mismatched "Numeric_Type" and/or "Numeric_Value" between "UnicodeData.txt" and "DerivedNumericType.txt" or "DerivedNumericValues.txt."'
+                msg += '\n  {0}, {1} vs. {2}, {3}'.format(row['Numeric_Type'],
+                                                          row['Numeric_Value'],
+                                                          dnt['Numeric_Type'],
+                                                          derived_numeric_values[cp]['Numeric_Value'])
+                raise err.DataError(msg)
+        return unicodedata
+
+
+    _blocks_line_pattern = _blocks_line_pattern
 
     @property
     def blocks(self):
@@ -523,7 +1634,7 @@ class UCDFiles(Files):
         Data from Blocks.txt.
         '''
         if self._blocks is None:
-            self._blocks = self._get_single_string_property('Blocks', 'Block', line_re=self._blocks_line_re)
+            self._blocks = self._get_single_string_property('Blocks', 'Block', line_pattern=self._blocks_line_pattern, ranges=True)
         return self._blocks
 
 
@@ -533,7 +1644,7 @@ class UCDFiles(Files):
         Data from DerivedBidiClass.txt.
         '''
         if self._derivedbidiclass is None:
-            self._derivedbidiclass = self._get_single_string_property('DerivedBidiClass', 'Bidi_Class')
+            self._derivedbidiclass = self._get_single_string_property('DerivedBidiClass', 'Bidi_Class', ranges=True)
         return self._derivedbidiclass
 
 
@@ -553,7 +1664,7 @@ class UCDFiles(Files):
         Data from DerivedEastAsianWidth.txt.
         '''
         if self._derivedeastasianwidth is None:
-            self._derivedeastasianwidth = self._get_single_string_property('DerivedEastAsianWidth', 'East_Asian_Width')
+            self._derivedeastasianwidth = self._get_single_string_property('DerivedEastAsianWidth', 'East_Asian_Width', ranges=True)
         return self._derivedeastasianwidth
 
 
@@ -563,7 +1674,7 @@ class UCDFiles(Files):
         Data from DerivedJoiningType.txt.
         '''
         if self._derivedjoiningtype is None:
-            self._derivedjoiningtype = self._get_single_string_property('DerivedJoiningType', 'Joining_Type')
+            self._derivedjoiningtype = self._get_single_string_property('DerivedJoiningType', 'Joining_Type', ranges=True)
         return self._derivedjoiningtype
 
 
@@ -573,11 +1684,11 @@ class UCDFiles(Files):
         Data from DerivedNumericType.txt.
         '''
         if self._derivednumerictype is None:
-            self._derivednumerictype = self._get_single_string_property('DerivedNumericType', 'Numeric_Type')
+            self._derivednumerictype = self._get_single_string_property('DerivedNumericType', 'Numeric_Type', ranges=True)
         return self._derivednumerictype
 
 
-    _derived_numeric_values_line_re = re.compile(r'(?P<Code_Point>{codePoint}|{codePoint}\.\.{codePoint})\s*;\s*{decimal}\s*;\s*;\s*(?P<Value>{rational})\s*#.*$'.format(**ucd_regex_patterns))
+    _derived_numeric_values_line_pattern = _derived_numeric_values_line_pattern
 
     @property
     def derivednumericvalues(self):
@@ -585,7 +1696,7 @@ class UCDFiles(Files):
         Data from DerivedNumericValues.txt.
         '''
         if self._derivednumericvalues is None:
-            self._derivednumericvalues = self._get_single_string_property('DerivedNumericValues', 'Numeric_Value', line_re=self._derived_numeric_values_line_re)
+            self._derivednumericvalues = self._get_single_string_property('DerivedNumericValues', 'Numeric_Value', line_pattern=self._derived_numeric_values_line_pattern, ranges=True, value_field=3)
         return self._derivednumericvalues
 
 
@@ -595,7 +1706,7 @@ class UCDFiles(Files):
         Data from EastAsianWidth.txt.
         '''
         if self._eastasianwidth is None:
-            self._eastasianwidth = self._get_single_string_property('EastAsianWidth', 'East_Asian_Width')
+            self._eastasianwidth = self._get_single_string_property('EastAsianWidth', 'East_Asian_Width', ranges=True)
         return self._eastasianwidth
 
 
@@ -609,22 +1720,30 @@ class UCDFiles(Files):
         return self._proplist
 
 
-    _script_extensions_line_re = re.compile(r'(?P<Code_Point>{codePoint}|{codePoint}\.\.{codePoint})\s*;\s*(?P<Scripts>{Script}(\x20{Script})*)\s*#.*$'.format(**ucd_regex_patterns))
+    _script_extensions_line_pattern = _script_extensions_line_pattern
 
     @property
     def scriptextensions(self):
         '''
-        Data from ScriptExtensions.txt.
+        Data from ScriptExtensions.txt.  Script_Extensions values are
+        tuples of script codes, in data file order.
         '''
+        token_cache = {}
         def postprocess(re_match_groupdict):
-            ret = collections.OrderedDict()
-            for key in re_match_groupdict['Scripts'].split('\x20'):
-                ret[key] = True
-            return ret
+            # All lines sharing a script-set token (for example
+            # "Arab Thaa") share one tuple of interned script codes;
+            # no-argument `split()` takes a fast whitespace-scanning path
+            token = re_match_groupdict['Scripts']
+            try:
+                return token_cache[token]
+            except KeyError:
+                value = token_cache[token] = tuple(map(_intern, token.split()))
+                return value
         if self._scriptextensions is None:
             self._scriptextensions = self._get_single_string_property('ScriptExtensions', 'Script_Extensions',
                                                                       postprocess=postprocess,
-                                                                      line_re=self._script_extensions_line_re)
+                                                                      line_pattern=self._script_extensions_line_pattern,
+                                                                      ranges=True)
         return self._scriptextensions
 
 
@@ -634,7 +1753,7 @@ class UCDFiles(Files):
         Data from Scripts.txt.
         '''
         if self._scripts is None:
-            self._scripts = self._get_single_string_property('Scripts', 'Script')
+            self._scripts = self._get_single_string_property('Scripts', 'Script', ranges=True)
         return self._scripts
 
 
@@ -657,15 +1776,85 @@ class SecurityFiles(Files):
         self._confusables = None
 
 
-    _confusables_line_re = re.compile(r'(?P<Code_Point>{codePoint})\s*;\s*(?P<confusable>{codePoints})\s*;\s*MA\s*#.*$'.format(**ucd_regex_patterns))
+    # Data files backing each property, for `prefetch()`.
+    _property_data_files = {'confusables': ('confusables',)}
+
+
+    _confusables_line_pattern = _confusables_line_pattern
+
+    def _parse_confusables(self):
+        '''
+        Parse confusables.txt.
+
+        Confusable sequences are wrapped in _LazyCodePoints, so that hex
+        decoding is deferred until a sequence is actually used.
+        '''
+        return self._get_single_string_property('confusables', None,
+                                                postprocess=lambda gd: _LazyCodePoints(gd['confusable']),
+                                                line_pattern=self._confusables_line_pattern)
+
 
     @property
     def confusables(self):
         '''
         Data from confusables.txt.
+
+        For data files shipped in the package, a pre-generated table module
+        is imported when available (see `tools/bake_confusables.py`), which
+        replaces parsing confusables.txt with loading cached bytecode.
         '''
         if self._confusables is None:
-            self._confusables = self._get_single_string_property('confusables', None,
-                                                                 postprocess=lambda gd: tuple(int(x, 16) for x in gd['confusable'].split('\x20')),
-                                                                 line_re=self._confusables_line_re)
+            if self.data_path is None:
+                try:
+                    baked = importlib.import_module('.baked._confusables_{0}'.format(self.unicode_version.replace('.', '_')), 'unicodetools')
+                    self._confusables = baked.CONFUSABLES
+                except ImportError:
+                    self._confusables = self._parse_confusables()
+            else:
+                self._confusables = self._parse_confusables()
         return self._confusables
+
+
+
+
+# Memoized factory functions.  Because all data files are loaded lazily and
+# parsed data is stored on the instance, sharing a single instance per
+# (unicode_version, data_path) combination ensures that each data file is
+# parsed at most once per process.
+if hasattr(functools, 'lru_cache'):
+    def _memoize_files(func):
+        return functools.lru_cache(maxsize=8)(func)
+else:
+    # Python 2:  `functools.lru_cache` does not exist, so fall back to a
+    # simple unbounded memo.
+    def _memoize_files(func):
+        cache = {}
+        @functools.wraps(func)
+        def wrapper(unicode_version=None, data_path=None):
+            key = (unicode_version, data_path)
+            if key not in cache:
+                cache[key] = func(unicode_version=unicode_version, data_path=data_path)
+            return cache[key]
+        return wrapper
+
+
+@_memoize_files
+def get_ucd_files(unicode_version=None, data_path=None):
+    '''
+    Return a UCDFiles instance for the specified `unicode_version` and
+    `data_path`.  Repeated calls with the same arguments return the same
+    instance, so that already parsed data files are shared instead of being
+    re-parsed.
+    '''
+    return UCDFiles(unicode_version=unicode_version, data_path=data_path)
+
+
+@_memoize_files
+def get_security_files(unicode_version=None, data_path=None):
+    '''
+    Return a SecurityFiles instance for the specified `unicode_version` and
+    `data_path`.  Repeated calls with the same arguments return the same
+    instance, so that already parsed data files are shared instead of being
+    re-parsed.
+    '''
+    return SecurityFiles(unicode_version=unicode_version, data_path=data_path)
@@ -12,15 +12,18 @@ Exceptions for unicodetools.
 '''
 
 
+__all__ = ('UnicodeToolsError', 'DataError')
+
+
 class UnicodeToolsError(Exception):
     '''
     Base unicodetools error.
     '''
-    pass
+    __slots__ = ()
 
 
 class DataError(UnicodeToolsError):
     '''
     Error in internal or loaded data.
     '''
-    pass
+    __slots__ = ()
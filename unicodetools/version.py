@@ -11,5 +11,9 @@
 from __future__ import (division, print_function, absolute_import,
                         unicode_literals)
 
-from .fmtversion import get_version_plus_info
-__version__, __version_info__ = get_version_plus_info(1, 0, 0, 'dev', 2)
+# The version constants are hard-coded literals so that importing the
+# package does no formatting work.  `fmtversion.get_version_plus_info()`
+# documents the format and generates equivalent values:
+#     get_version_plus_info(1, 0, 0, 'dev', 2)
+__version__ = '1.0.0.dev2'
+__version_info__ = (1, 0, 0, 'dev', 2)